@@ -4,9 +4,10 @@ All conversations-related Use Case
 Orchestrates the creation of a conversation and sending messages within a conversation.
 """
 
+from collections.abc import AsyncIterator
 from uuid import uuid4
 
-from src.core.ports import ChatProvider, ConversationRepository, TimeProvider
+from src.core.ports import ChatProvider, ConversationRepository, IdProvider, TimeProvider
 from src.core.domain import (
     # Value objects
     Role, 
@@ -16,7 +17,7 @@ from src.core.domain import (
     # Entities
     Conversation,
 )
-from src.core.exceptions import ResourceNotFoundError
+from src.core.exceptions import ResourceNotFoundError, TeacherResponseError
 
 from src.application.dtos.conversations import (
     # CreateConversationUseCase
@@ -40,6 +41,7 @@ class CreateConversationUseCase:
         self,
         repository: ConversationRepository,
         time_provider: TimeProvider,
+        id_provider: IdProvider | None = None,
     ) -> None:
         """
         Initialize the use case with required dependencies.
@@ -47,9 +49,11 @@ class CreateConversationUseCase:
         Args:
             repository: Repository for conversation persistence
             time_provider: Port for retrieving current time
+            id_provider: Port for generating conversation IDs (defaults to random UUID4)
         """
         self._repository = repository
         self._time_provider = time_provider
+        self._id_provider = id_provider
 
     async def execute(self, command_dto: CreateConversationCommand) -> CreateConversationResult:
         """
@@ -71,7 +75,7 @@ class CreateConversationUseCase:
             PersistenceError: If repository fails to persist conversation
         """
         # Generate ID and timestamps for the conversation
-        conversation_id = uuid4()
+        conversation_id = self._id_provider.new_id() if self._id_provider else uuid4()
         now = self._time_provider.now()
 
         conversation_title = command_dto.title if command_dto.title and command_dto.title.strip() else "New Conversation"
@@ -165,13 +169,11 @@ class SendMessageUseCase:
         )
 
         # Prepare the history and teacher profile for generation
-        history = tuple(conversation.messages)
-        teacher_profile = TeacherProfile(
-            creativity_level=CreativityLevel(command_dto.creativity_level), 
-            generation_style=GenerationStyle(command_dto.generation_style)
-        )
+        history = conversation.messages
+        teacher_profile = self._build_teacher_profile(command_dto)
 
-        # 3. Get the teacher's response
+        # 3. Get the teacher's response (nothing is persisted if this fails,
+        # so a client retry doesn't duplicate the student's turn)
         teacher_response = await self._chat_provider.get_teacher_response(
             history=history, 
             teacher_profile=teacher_profile,
@@ -200,6 +202,88 @@ class SendMessageUseCase:
             student_message_id=student_message_id,
             teacher_message=teacher_response
         )
+
+    async def stream(self, command_dto: SendMessageCommand) -> AsyncIterator[str]:
+        """
+        Execute the send message use case, streaming the teacher's response.
+        
+        The conversation is loaded, and the student message added, before this
+        call returns: lookup and state errors are raised here rather than in the
+        middle of the stream. Both messages are persisted together once the
+        stream has been fully consumed; a failed or abandoned stream saves nothing.
+
+        Args:
+            command_dto: Command containing conversation ID, student message
+                        and teacher profile params
+            
+        Returns:
+            Async iterator over the chunks of the teacher's response
+            
+        Raises:
+            ResourceNotFoundError: If conversation does not exist
+            ConversationNotWritableError: If conversation is archived or deleted
+        """
+        conversation = await self._repository.get_by_id(command_dto.conversation_id)
+
+        _ = conversation.add_message(
+            new_message_id=uuid4(),
+            now=self._time_provider.now(),
+            role=Role.STUDENT,
+            content=command_dto.student_message,
+        )
+
+        chunks = self._chat_provider.stream_teacher_response(
+            history=conversation.messages,
+            teacher_profile=self._build_teacher_profile(command_dto),
+            native_lang=conversation.native_lang,
+            target_lang=conversation.target_lang,
+        )
+        return self._relay_and_save(conversation, chunks)
+
+    async def _relay_and_save(
+        self,
+        conversation: Conversation,
+        chunks: AsyncIterator[str],
+    ) -> AsyncIterator[str]:
+        """
+        Yield the teacher's chunks, then record the full response in the conversation.
+
+        The teacher stream is closed as soon as this one ends, even when it is
+        abandoned midway, so it doesn't hold its resources until collected.
+
+        Raises:
+            TeacherResponseError: If the streamed response is empty (nothing is saved)
+        """
+        parts: list[str] = []
+        try:
+            async for chunk in chunks:
+                parts.append(chunk)
+                yield chunk
+        finally:
+            aclose = getattr(chunks, "aclose", None)
+            if aclose is not None:
+                await aclose()
+
+        # Same normalization as the non-streamed response
+        content = "".join(parts).strip()
+        if not content:
+            raise TeacherResponseError(cause="The teacher service returned an empty response.")
+
+        _ = conversation.add_message(
+            new_message_id=uuid4(),
+            now=self._time_provider.now(),
+            role=Role.TEACHER,
+            content=content,
+        )
+        await self._repository.save(conversation)
+
+    @staticmethod
+    def _build_teacher_profile(command_dto: SendMessageCommand) -> TeacherProfile:
+        """Build the teacher profile requested by the command."""
+        return TeacherProfile(
+            creativity_level=CreativityLevel(command_dto.creativity_level), 
+            generation_style=GenerationStyle(command_dto.generation_style)
+        )
     
 
 class DeleteConversationUseCase:
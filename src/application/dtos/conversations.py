@@ -110,7 +110,7 @@ class SelectConversationQuery:
     conversation_id: UUID
     student_id: UUID
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MessageView:
     """
     Read model for displaying messages in a conversation.
@@ -147,6 +147,8 @@ class Conversation(AggregateRoot):
     _title: str = field(default_factory=lambda: "Conversation")
     _status: Status = field(default_factory=lambda: Status.ACTIVE)
     _messages: list[ChatMessage] = field(default_factory=list) # type: ignore
+    # Read-only snapshot of _messages, rebuilt lazily after each append
+    _messages_view: tuple[ChatMessage, ...] | None = field(default=None, init=False, repr=False)
 
     @property
     def student_id(self) -> UUID:
@@ -178,13 +180,20 @@ class Conversation(AggregateRoot):
 
     @property
     def messages(self) -> tuple[ChatMessage, ...]:
-        """Return an immutable view of the conversation messages."""
-        return tuple(self._messages)
+        """
+        Return an immutable view of the conversation messages.
+        
+        The tuple is cached until the next message is added, so repeated reads
+        (history for the teacher, message count, views) don't copy the history.
+        """
+        if self._messages_view is None:
+            self._messages_view = tuple(self._messages)
+        return self._messages_view
         
     @property
     def message_count(self) -> int:
         """Return the total number of messages in this conversation."""
-        return len(self.messages)
+        return len(self._messages)
 
     @classmethod
     def create_new(
@@ -265,6 +274,7 @@ class Conversation(AggregateRoot):
         )
 
         self._messages.append(message)
+        self._messages_view = None
         return message
 
     def touch(self, now: datetime) -> None:
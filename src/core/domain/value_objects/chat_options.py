@@ -23,12 +23,12 @@ class Role(Enum):
     @property
     def is_student(self) -> bool:
         """Check if this role represents the student."""
-        return self == Role.STUDENT
+        return self is Role.STUDENT
     
     @property
     def is_teacher(self) -> bool:
         """Check if this role represents the teacher."""
-        return self == Role.TEACHER
+        return self is Role.TEACHER
 
 
 class Status(Enum):
@@ -48,12 +48,12 @@ class Status(Enum):
     @property
     def is_active(self) -> bool:
         """Check if this conversation is active."""
-        return self == Status.ACTIVE
+        return self is Status.ACTIVE
     
     @property
     def is_archived(self) -> bool:
         """Check if this conversation is archived."""
-        return self == Status.ARCHIVED
+        return self is Status.ARCHIVED
     
     @property
     def is_writable(self) -> bool:
@@ -6,8 +6,9 @@ Defines linguistic and grammatical concepts for language analysis.
 
 from __future__ import annotations
 
+import sys
 from enum import Enum
-from functools import total_ordering, lru_cache
+from functools import total_ordering
 from dataclasses import dataclass
 
 from src.core.exceptions import InvalidLanguageIsoCodeError
@@ -40,10 +41,11 @@ class Language:
             InvalidLanguageIsoCodeError: If code is not 2 alphabetic characters
         """
         normalized = self.code.lower().strip()
+        if len(normalized) != 2 or not normalized.isalpha():
+            raise InvalidLanguageIsoCodeError(normalized)
+        # Interned so equal codes share one string and compare by identity first.
         # We need to use setattr because this is a frozen dataclass
-        object.__setattr__(self, "code", normalized)
-        if not self.code.isalpha() or len(self.code) != 2:
-            raise InvalidLanguageIsoCodeError(self.code)
+        object.__setattr__(self, "code", sys.intern(normalized))
 
 
 @total_ordering
@@ -69,14 +71,6 @@ class CEFRLevel(Enum):
     C1 = "C1"
     C2 = "C2"
 
-    @classmethod
-    @lru_cache(maxsize=1) 
-    def _get_ordered_members(cls) -> tuple[CEFRLevel, ...]:
-        """
-        Return all levels as tuple and cache it.
-        """
-        return tuple(cls)
-
     @property
     def is_beginner(self) -> bool:
         """Check if this is a beginner level (A1-A2)."""
@@ -111,16 +105,20 @@ class CEFRLevel(Enum):
         Get numeric value for comparison (1-6).
         Useful for progress tracking and level comparisons.
         """
-        return self._get_ordered_members().index(self) + 1
+        return _CEFR_RANKS[self]
 
     def is_adjacent_to(self, other: CEFRLevel) -> bool:
         """Verify the other rank is adjacent to this one."""
-        return abs(self.rank - other.rank) == 1
+        return abs(_CEFR_RANKS[self] - _CEFR_RANKS[other]) == 1
 
     def __lt__(self, other: object) -> bool:
         if not isinstance(other, CEFRLevel):
             return NotImplemented
-        return self.rank < other.rank
+        return _CEFR_RANKS[self] < _CEFR_RANKS[other]
+
+
+# Ranks computed once from declaration order (A1=1 ... C2=6)
+_CEFR_RANKS: dict[CEFRLevel, int] = {level: rank for rank, level in enumerate(CEFRLevel, start=1)}
 
 
 class PartOfSpeech(Enum):
@@ -19,9 +19,13 @@ class ChatProviderError(ExternalServiceError):
 class TeacherResponseError(ChatProviderError):
     """
     Raised when the teacher fails to provide a response.
+    
+    Attributes:
+        retry_after: Seconds after which retrying makes sense, when known
     """
-    def __init__(self, cause: str) -> None:
+    def __init__(self, cause: str, retry_after: float | None = None) -> None:
         super().__init__(f"Unable to provide the teacher's response: {cause}")
+        self.retry_after = retry_after
 
 
 class PersistenceError(InfrastructureError):
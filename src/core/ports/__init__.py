@@ -9,6 +9,7 @@ Infrastructure provides concrete implementations.
 """
 
 from .chat_provider import ChatProvider
+from .id_provider import IdProvider
 from .repositories import (
     ConversationRepository,
     StudentRepository,
@@ -17,6 +18,7 @@ from .time_provider import TimeProvider
 
 __all__ = [
     "ChatProvider",
+    "IdProvider",
     "ConversationRepository",
     "StudentRepository",
     "TimeProvider",
@@ -5,6 +5,7 @@ Interface for chat completion services.
 This is what services use to get teacher responses.
 """
 
+from collections.abc import AsyncIterator
 from typing import Protocol
 
 from src.core.domain.entities import ChatMessage
@@ -39,4 +40,31 @@ class ChatProvider(Protocol):
         Raises:
             TeacherGenerationError: If the external service fails or returns invalid content.
         """
-        ...
\ No newline at end of file
+        ...
+
+    def stream_teacher_response(
+        self,
+        history: tuple[ChatMessage, ...],
+        teacher_profile: TeacherProfile,
+        native_lang: Language,
+        target_lang: Language
+    ) -> AsyncIterator[str]:
+        """
+        Stream a pedagogical response from the teacher as it is generated.
+
+        Same contract as `get_teacher_response`, but text chunks are yielded
+        as soon as the service produces them.
+
+        Args:
+            history: Conversation history as domain entities.
+            teacher_profile: Teacher behavior configuration.
+            native_lang: Student's native language.
+            target_lang: Language being learned by the student.
+
+        Yields:
+            Successive chunks of the teacher's response.
+
+        Raises:
+            TeacherResponseError: If the external service fails.
+        """
+        ...
@@ -0,0 +1,20 @@
+"""
+Id Provider Port
+
+Interface for generating entity identifiers.
+"""
+
+from typing import Protocol
+from uuid import UUID
+
+
+class IdProvider(Protocol):
+    """
+    Port for identifier generation.
+    """
+
+    def new_id(self) -> UUID:
+        """
+        Generate a new unique identifier.
+        """
+        ...
@@ -5,15 +5,19 @@ Interface for persisting and retrieving conversation entities.
 This port abstracts the database layer for conversation management.
 """
 
-from abc import ABC, abstractmethod
+from abc import abstractmethod
+from typing import Protocol
 from uuid import UUID
 
 from src.core.domain import Conversation
 from src.core.exceptions import ResourceNotFoundError
 
-class ConversationRepository(ABC):
+class ConversationRepository(Protocol):
     """
     Port for conversation persistence operations.
+    
+    get_by_id has a default built on find_by_id, so adapters subclassing
+    the port only write the three abstract methods.
     """
 
     @abstractmethod
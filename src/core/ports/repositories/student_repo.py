@@ -5,15 +5,19 @@ Interface for persisting and retrieving student entities.
 This port abstracts the database layer for student management.
 """
 
-from abc import ABC, abstractmethod
+from abc import abstractmethod
+from typing import Protocol
 from uuid import UUID
 
 from src.core.domain import Student
 from src.core.exceptions import ResourceNotFoundError
 
-class StudentRepository(ABC):
+class StudentRepository(Protocol):
     """
     Port for student persistence operations.
+    
+    Only save, find_by_id and remove are abstract; the raising lookup
+    (get_by_id) comes for free to explicit subclasses.
     """
 
     @abstractmethod
@@ -1,5 +1,6 @@
 
 from .chat import LLMTeacherAdapter
+from .ids import SystemUUIDProvider
 from .repositories import InMemoryConversationRepository
 from .time import SystemTimeProvider
 
@@ -7,4 +8,5 @@ __all__ = [
     "LLMTeacherAdapter",
     "InMemoryConversationRepository",
     "SystemTimeProvider",
+    "SystemUUIDProvider",
 ]
\ No newline at end of file
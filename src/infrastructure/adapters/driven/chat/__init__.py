@@ -1,6 +1,9 @@
 
 from .llm_teacher import LLMTeacherAdapter
+from .circuit_breaker import CircuitBreaker, CircuitState
 
 __all__ = [
     "LLMTeacherAdapter",
+    "CircuitBreaker",
+    "CircuitState",
 ]
\ No newline at end of file
@@ -0,0 +1,117 @@
+"""
+Circuit Breaker
+
+Fails fast when the teacher service is known to be down, instead of making
+every request wait for the full LLM timeout.
+
+States:
+- CLOSED: calls go through; failures within the window are counted
+- OPEN: calls are rejected immediately until the reset timeout elapses
+- HALF_OPEN: a single probe call is let through to test recovery
+"""
+
+import time
+from collections import deque
+from collections.abc import Callable
+from enum import Enum
+
+from src.core.exceptions import TeacherResponseError
+
+
+class CircuitState(Enum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """
+    Hand-rolled CLOSED / OPEN / HALF_OPEN circuit breaker.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        failure_window: float = 30.0,
+        reset_timeout: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Args:
+            failure_threshold: Failures within the window that open the circuit
+            failure_window: Sliding window for counting failures, in seconds
+            reset_timeout: Time spent OPEN before a probe is allowed, in seconds
+            clock: Monotonic clock, injectable for tests
+        """
+        self._failure_threshold = failure_threshold
+        self._failure_window = failure_window
+        self._reset_timeout = reset_timeout
+        self._clock = clock
+
+        self._state = CircuitState.CLOSED
+        self._failures: deque[float] = deque()
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+
+    @property
+    def state(self) -> CircuitState:
+        """Current state, moving OPEN to HALF_OPEN once the reset timeout elapsed."""
+        if (
+            self._state is CircuitState.OPEN
+            and self._clock() - self._opened_at >= self._reset_timeout
+        ):
+            self._state = CircuitState.HALF_OPEN
+        return self._state
+
+    def before_call(self, claim_probe: bool = True) -> None:
+        """
+        Check that a call may go through.
+
+        With claim_probe, a call let through while HALF_OPEN takes the single
+        probe slot: it must be followed by record_success, record_failure or
+        release_probe.
+
+        Args:
+            claim_probe: Whether to take the HALF_OPEN probe slot, or only check it is free.
+
+        Raises:
+            TeacherResponseError: If the circuit is open (or a probe is already in flight)
+        """
+        state = self.state
+        if state is CircuitState.CLOSED:
+            return
+        if state is CircuitState.HALF_OPEN and not self._probe_in_flight:
+            # Let this call probe the service; concurrent calls keep failing fast
+            self._probe_in_flight = claim_probe
+            return
+        self._reject()
+
+    def _reject(self) -> None:
+        """Raise the fail-fast error, with the time left before the next probe."""
+        retry_after = self._reset_timeout - (self._clock() - self._opened_at)
+        raise TeacherResponseError(
+            cause="The teacher service is temporarily unavailable.",
+            retry_after=max(retry_after, 1.0),
+        )
+
+    def record_success(self) -> None:
+        """Close the circuit and forget past failures."""
+        self._state = CircuitState.CLOSED
+        self._failures.clear()
+        self._probe_in_flight = False
+
+    def release_probe(self) -> None:
+        """Free the HALF_OPEN probe slot of a call that ended without an outcome."""
+        self._probe_in_flight = False
+
+    def record_failure(self) -> None:
+        """Count a failure, opening the circuit when the threshold is reached."""
+        now = self._clock()
+        self._failures.append(now)
+        while self._failures and now - self._failures[0] > self._failure_window:
+            self._failures.popleft()
+
+        if len(self._failures) >= self._failure_threshold or self.state is CircuitState.HALF_OPEN:
+            self._state = CircuitState.OPEN
+            self._opened_at = now
+            self._probe_in_flight = False
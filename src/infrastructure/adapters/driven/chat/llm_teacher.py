@@ -12,10 +12,106 @@ Responsibilities:
 - Pass domain entities (ChatMessage, TeacherProfile) to infrastructure
 """
 
+import time
+from collections.abc import AsyncIterator
+from functools import lru_cache
+
 from src.core.domain.entities import ChatMessage
-from src.core.domain.value_objects import TeacherProfile, Language
+from src.core.domain.value_objects import (
+    TeacherProfile, 
+    Language, 
+    GenerationStyle, 
+    CreativityLevel,
+    Role,
+)
+from src.core.exceptions import TeacherResponseError
 from src.infrastructure.ai.client import LLMClient
 
+from .circuit_breaker import CircuitBreaker
+
+
+_STYLE_INSTRUCTIONS = {
+    GenerationStyle.PRACTICE: "Focus on creating small exercises and drills. Ask them to conjugate verbs or translate sentences.",
+    GenerationStyle.EXPLANATORY: "Be verbose. Explain the grammar rules behind every correction. Use the student's native language for complex explanations.",
+    GenerationStyle.CORRECTIVE: "Be strict. Point out every single mistake. Ask the student to rewrite their sentence correctly before moving on.",
+    GenerationStyle.CONVERSATIONAL: "Prioritize flow. Only correct major errors that impede understanding. Keep the conversation going naturally.",
+}
+
+_TONE_INSTRUCTIONS = {
+    CreativityLevel.STRICT: "Formal, academic, and concise.",
+    CreativityLevel.CONTROLLED: "Professional but encouraging.",
+    CreativityLevel.MODERATE: "Friendly, casual, and warm.",
+    CreativityLevel.EXPRESSIVE: "Very enthusiastic, using emojis and slang appropriate for the target language.",
+}
+
+_NEGATIVE_CACHE_MAX_SIZE = 1024
+
+# Identifies a teacher request in the negative cache (the full tuple, not its
+# hash, so that two different requests never share an entry)
+_RequestKey = tuple[tuple[tuple[Role, str], ...], TeacherProfile, Language, Language]
+
+# The pedagogical section only depends on (style, tone): every combination is
+# rendered once at import so building a prompt is a single lookup.
+_PROFILE_PROMPTS: dict[tuple[GenerationStyle, CreativityLevel], str] = {
+    (style, tone): (
+        "PEDAGOGICAL STYLE:\n"
+        f"- Approach: {_STYLE_INSTRUCTIONS[style]}\n"
+        f"- Tone: {_TONE_INSTRUCTIONS[tone]}\n\n"
+    )
+    for style in GenerationStyle
+    for tone in CreativityLevel
+}
+
+
+# System prompts are deterministic per teaching context; reusing the exact
+# same string keeps the prompt prefix stable so the LLM server can reuse
+# its KV cache across turns of a conversation.
+@lru_cache(maxsize=256)
+def _build_system_prompt(
+    teacher_profile: TeacherProfile,
+    native_lang: Language,
+    target_lang: Language,
+) -> str:
+    """
+    Construct a system prompt for the LLM based on teaching context.
+
+    Args:
+        teacher_profile: Pedagogical instructions and teaching style configuration.
+        native_lang: Student's native language.
+        target_lang: Target language being taught.
+
+    Returns:
+        System prompt string containing role, context, and pedagogical guidelines.
+    """
+    base_prompt = (
+        f"You are an expert language teacher specializing in teaching {target_lang.code} "
+        f"to speakers of {native_lang.code}.\n\n"
+        "CORE MISSION:\n"
+        "1. Engage the student in natural conversation.\n"
+        "2. Correct their mistakes subtly but effectively.\n"
+        "3. Adapt your vocabulary and grammar to their proficiency level.\n"
+        "4. Encourage them to speak more.\n\n"
+    )
+
+    profile_prompt = _PROFILE_PROMPTS[(teacher_profile.generation_style, teacher_profile.creativity_level)]
+
+    rules = (
+        "CRITICAL RULES:\n"
+        f"- Primarily speak in {target_lang.code}, unless explaining a complex concept.\n"
+        "- If the student speaks in their native language, translate it and ask them to repeat it in the target language.\n"
+        "- Keep your responses concise (under 3 paragraphs) unless asked to explain.\n"
+        "- Do not hallucinate words. If unsure, ask for clarification."
+    )
+
+    return base_prompt + profile_prompt + rules
+
+
+async def _aclose(chunks: AsyncIterator[str]) -> None:
+    """Close an async iterator that supports it (async generators do)."""
+    aclose = getattr(chunks, "aclose", None)
+    if aclose is not None:
+        await aclose()
+
 
 class LLMTeacherAdapter:
     """
@@ -25,14 +121,26 @@ class LLMTeacherAdapter:
     into LLM requests, enabling the core to remain independent of specific LLM implementations.
     """
 
-    def __init__(self, client: LLMClient) -> None:
+    def __init__(
+        self, 
+        client: LLMClient,
+        circuit_breaker: CircuitBreaker | None = None,
+        negative_cache_ttl: float = 5.0,
+    ) -> None:
         """
         Initialize the adapter with an LLM client.
         
         Args:
             client: LLM client implementing the LLMClient protocol.
+            circuit_breaker: Breaker failing fast while the LLM service is down.
+            negative_cache_ttl: Seconds during which an identical request that
+                just failed is rejected without calling the LLM again.
         """
         self._client = client
+        self._circuit_breaker = circuit_breaker or CircuitBreaker()
+        self._negative_cache_ttl = negative_cache_ttl
+        # Request key -> monotonic expiry of the recorded failure
+        self._recent_failures: dict[_RequestKey, float] = {}
 
     async def get_teacher_response(
         self,
@@ -59,63 +167,106 @@ class LLMTeacherAdapter:
         Raises:
             TeacherResponseError: If the teacher service fails to generate a response.
         """
-        system_prompt = self._build_system_prompt(teacher_profile, native_lang, target_lang)
+        request_key: _RequestKey = (
+            tuple((msg.role, msg.content) for msg in history),
+            teacher_profile, native_lang, target_lang,
+        )
+        self._reject_recent_failure(request_key)
+        self._circuit_breaker.before_call()
 
-        return await self._client.generate(history, system_prompt)
+        # Only a teacher error counts against the service; a cancelled call
+        # just frees the HALF_OPEN probe slot so the next call can probe
+        try:
+            system_prompt = _build_system_prompt(teacher_profile, native_lang, target_lang)
+            response = await self._client.generate(history, system_prompt)
+        except TeacherResponseError:
+            self._remember_failure(request_key)
+            self._circuit_breaker.record_failure()
+            raise
+        except BaseException:
+            self._circuit_breaker.release_probe()
+            raise
+        self._circuit_breaker.record_success()
 
-    def _build_system_prompt(
-        self, 
+        return response
+
+    def stream_teacher_response(
+        self,
+        history: tuple[ChatMessage, ...],
         teacher_profile: TeacherProfile,
         native_lang: Language,
         target_lang: Language,
-    ) -> str:
+    ) -> AsyncIterator[str]:
         """
-        Construct a system prompt for the LLM based on teaching context.
+        Stream the teacher's response as the LLM generates it.
         
         Args:
-            teacher_profile: Pedagogical instructions and teaching style configuration.
+            history: Conversation history as ChatMessage entities.
+            teacher_profile: Teacher behavior configuration.
             native_lang: Student's native language.
-            target_lang: Target language being taught.
+            target_lang: Language being learned by the student.
             
         Returns:
-            System prompt string containing role, context, and pedagogical guidelines.
+            Async iterator over the response text chunks.
         """
-        base_prompt = (
-            f"You are an expert language teacher specializing in teaching {target_lang.code} "
-            f"to speakers of {native_lang.code}.\n\n"
-            "CORE MISSION:\n"
-            "1. Engage the student in natural conversation.\n"
-            "2. Correct their mistakes subtly but effectively.\n"
-            "3. Adapt your vocabulary and grammar to their proficiency level.\n"
-            "4. Encourage them to speak more.\n\n"
-        )
+        # Fail fast before the response starts; the call itself (and the
+        # HALF_OPEN probe slot) is only claimed once the stream is iterated
+        self._circuit_breaker.before_call(claim_probe=False)
+        system_prompt = _build_system_prompt(teacher_profile, native_lang, target_lang)
 
-        style_instructions = {
-            "practice": "Focus on creating small exercises and drills. Ask them to conjugate verbs or translate sentences.",
-            "explanatory": "Be verbose. Explain the grammar rules behind every correction. Use the student's native language for complex explanations.",
-            "corrective": "Be strict. Point out every single mistake. Ask the student to rewrite their sentence correctly before moving on.",
-            "conversational": "Prioritize flow. Only correct major errors that impede understanding. Keep the conversation going naturally."
-        }
-
-        tone_instructions = {
-            0: "Formal, academic, and concise.",
-            1: "Professional but encouraging.",
-            2: "Friendly, casual, and warm.",
-            3: "Very enthusiastic, using emojis and slang appropriate for the target language."
-        }
-
-        profile_prompt = (
-            "PEDAGOGICAL STYLE:\n"
-            f"- Approach: {style_instructions.get(teacher_profile.generation_style.value, 'Conversational')}\n"
-            f"- Tone: {tone_instructions.get(teacher_profile.creativity_level.value, 'Friendly')}\n\n"
-        )
+        return self._guarded_stream(self._client.stream(history, system_prompt))
 
-        rules = (
-            "CRITICAL RULES:\n"
-            f"- Primarily speak in {target_lang.code}, unless explaining a complex concept.\n"
-            "- If the student speaks in their native language, translate it and ask them to repeat it in the target language.\n"
-            "- Keep your responses concise (under 3 paragraphs) unless asked to explain.\n"
-            "- Do not hallucinate words. If unsure, ask for clarification."
-        )
+    async def _guarded_stream(self, chunks: AsyncIterator[str]) -> AsyncIterator[str]:
+        """
+        Relay a stream, reporting its outcome to the circuit breaker.
+
+        A stream abandoned midway (client disconnect, cancellation, aclose)
+        only frees the probe slot, and the inner stream is closed right away.
+        """
+        self._circuit_breaker.before_call()
+        try:
+            async for chunk in chunks:
+                yield chunk
+        except TeacherResponseError:
+            self._circuit_breaker.record_failure()
+            raise
+        except BaseException:
+            self._circuit_breaker.release_probe()
+            raise
+        else:
+            self._circuit_breaker.record_success()
+        finally:
+            await _aclose(chunks)
+
+    def _remember_failure(self, request_key: _RequestKey) -> None:
+        """Add a failed request to the negative cache, evicting the oldest entries when full."""
+        now = time.monotonic()
+        # Re-inserting keeps the dict in expiry order, oldest first
+        self._recent_failures.pop(request_key, None)
+        if len(self._recent_failures) >= _NEGATIVE_CACHE_MAX_SIZE:
+            self._recent_failures = {
+                key: expires_at for key, expires_at in self._recent_failures.items()
+                if expires_at > now
+            }
+        while len(self._recent_failures) >= _NEGATIVE_CACHE_MAX_SIZE:
+            del self._recent_failures[next(iter(self._recent_failures))]
+        self._recent_failures[request_key] = now + self._negative_cache_ttl
 
-        return base_prompt + profile_prompt + rules
\ No newline at end of file
+    def _reject_recent_failure(self, request_key: _RequestKey) -> None:
+        """
+        Fail fast when the very same request failed a moment ago.
+        
+        Raises:
+            TeacherResponseError: If the request is in the negative cache.
+        """
+        now = time.monotonic()
+        expires_at = self._recent_failures.get(request_key)
+        if expires_at is None:
+            return
+        if expires_at <= now:
+            del self._recent_failures[request_key]
+            return
+        raise TeacherResponseError(
+            cause="The teacher could not answer this message a moment ago. Please retry shortly.",
+            retry_after=expires_at - now,
+        )
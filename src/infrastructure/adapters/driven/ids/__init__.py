@@ -0,0 +1,5 @@
+from .system_uuid_provider import SystemUUIDProvider
+
+__all__ = [
+    "SystemUUIDProvider",
+]
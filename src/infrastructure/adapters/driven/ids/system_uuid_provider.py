@@ -0,0 +1,33 @@
+"""
+System UUID Provider Adapter
+
+Implementation of IdProvider generating time-ordered UUIDs (RFC 9562 version 7).
+"""
+
+import os
+import time
+from uuid import UUID
+
+from src.core.ports import IdProvider
+
+
+class SystemUUIDProvider(IdProvider):
+    """
+    Implementation of IdProvider that generates UUIDv7 identifiers.
+
+    The 48 most significant bits hold the Unix timestamp in milliseconds, so
+    identifiers sort by creation time and keep B-tree index inserts sequential.
+    The remaining 74 bits (after version and variant) are random.
+    """
+
+    def new_id(self) -> UUID:
+        """Return a new time-ordered UUID."""
+        timestamp_ms = time.time_ns() // 1_000_000
+        rand = int.from_bytes(os.urandom(10))
+
+        value = (timestamp_ms & 0xFFFF_FFFF_FFFF) << 80
+        value |= 0x7 << 76                          # version 7
+        value |= ((rand >> 62) & 0xFFF) << 64       # rand_a (12 bits)
+        value |= 0b10 << 62                         # RFC 4122 variant
+        value |= rand & 0x3FFF_FFFF_FFFF_FFFF       # rand_b (62 bits)
+        return UUID(int=value)
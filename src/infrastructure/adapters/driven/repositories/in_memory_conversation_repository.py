@@ -3,6 +3,8 @@ In-Memory Conversation Repository
 """
 
 import copy
+import heapq
+from operator import attrgetter
 from typing import Sequence
 from uuid import UUID
 
@@ -14,6 +16,11 @@ from src.application.ports import ConversationReader
 from src.application.queries.conversations import ConversationSummary
 
 
+# Statuses listed by get_student_conversations (DELETED is never listed)
+_VISIBLE: frozenset[Status] = frozenset({Status.ACTIVE})
+_VISIBLE_WITH_ARCHIVED: frozenset[Status] = frozenset({Status.ACTIVE, Status.ARCHIVED})
+
+
 class InMemoryConversationRepository(ConversationRepository, ConversationReader):
     """
     In-memory Fake implementation of ConversationRepository and ConversationReader.
@@ -34,15 +41,17 @@ class InMemoryConversationRepository(ConversationRepository, ConversationReader)
 
     async def find_by_id(self, id: UUID) -> Conversation | None:
         """Find a conversation by ID, returns None if not found."""
-        if id not in self._storage:
+        conversation = self._storage.get(id)
+        if conversation is None:
             return None
-        return copy.deepcopy(self._storage[id])
+        return copy.deepcopy(conversation)
 
     async def remove(self, id: UUID) -> None:
         """Remove a conversation by ID, raises if not found (only for in-memory storage)."""
-        if id not in self._storage:
-            raise ResourceNotFoundError(resource_type="Conversation", resource_id=id)
-        del self._storage[id]
+        try:
+            del self._storage[id]
+        except KeyError:
+            raise ResourceNotFoundError(resource_type="Conversation", resource_id=id) from None
 
     # ──────────────────────────────────────────────────────────────────────────
     # ConversationReader (Query Operations)
@@ -70,19 +79,16 @@ class InMemoryConversationRepository(ConversationRepository, ConversationReader)
         Returns:
             List of conversation summaries, sorted by creation date (newest first)
         """
-        # Determine which statuses to include
-        allowed_statuses = {Status.ACTIVE}
-        if include_archived:
-            allowed_statuses.add(Status.ARCHIVED)
         # Note: DELETED conversations are never included (soft delete)
+        allowed_statuses = _VISIBLE_WITH_ARCHIVED if include_archived else _VISIBLE
         
-        student_conversations = [
+        student_conversations = (
             conv for conv in self._storage.values() 
             if conv.student_id == student_id and conv.status in allowed_statuses
-        ]
-        student_conversations.sort(key=lambda c: c.created_at, reverse=True)
-        paginated_convs = student_conversations[offset : offset + limit]
-        return [self._to_summary(c) for c in paginated_convs]
+        )
+        # Only the first offset + limit entries are ordered (same result as sort + slice)
+        newest = heapq.nlargest(offset + limit, student_conversations, key=attrgetter("created_at"))
+        return [self._to_summary(c) for c in newest[offset:]]
 
     def _to_summary(self, conversation: Conversation) -> ConversationSummary:
         """
@@ -1,10 +1,12 @@
 from .conversations import (
     get_in_memory_db,
+    get_llm_client,
     get_chat_provider,
+    close_llm_client,
     get_time_provider,
+    get_id_provider,
     get_conversation_repository,
     get_conversation_reader,
-    get_knowledge_retriever,
     get_create_conversation_use_case,
     get_send_message_use_case,
     get_select_conversation_use_case,
@@ -19,11 +21,13 @@ from .conversations import (
 
 __all__ = [
     "get_in_memory_db",
+    "get_llm_client",
     "get_chat_provider",
+    "close_llm_client",
     "get_time_provider",
+    "get_id_provider",
     "get_conversation_repository",
     "get_conversation_reader",
-    "get_knowledge_retriever",
     "get_create_conversation_use_case",
     "get_send_message_use_case",
     "get_select_conversation_use_case",
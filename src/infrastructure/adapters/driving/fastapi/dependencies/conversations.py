@@ -3,7 +3,7 @@ from typing import Annotated
 from fastapi import Depends
 from functools import lru_cache
 
-from src.core.ports import ConversationRepository, TimeProvider, ChatProvider
+from src.core.ports import ConversationRepository, TimeProvider, ChatProvider, IdProvider
 from src.application.ports import ConversationReader
 
 from src.application.commands import (
@@ -16,11 +16,13 @@ from src.application.queries import (
     ListStudentConversationsUseCase
 )
 
-from src.infrastructure.ai import OllamaClient, OllamaConfig
+from src.infrastructure.ai import OllamaClient
+from src.infrastructure.ai.config import get_settings
 from src.infrastructure.adapters.driven import (
     LLMTeacherAdapter, 
     InMemoryConversationRepository, 
     SystemTimeProvider,
+    SystemUUIDProvider,
 )
 
 # ──────────────────────────────────────────────────────────────────────────────
@@ -32,17 +34,31 @@ def get_in_memory_db() -> InMemoryConversationRepository:
     return InMemoryConversationRepository()
 
 @lru_cache
-def get_chat_provider() -> ChatProvider:
-    config = OllamaConfig()
-    client = OllamaClient(
+def get_llm_client() -> OllamaClient:
+    config = get_settings().ollama
+    return OllamaClient(
         base_url=config.openai_compatible_url, 
-        model_name=config.model
+        model_name=config.model,
+        max_concurrent_requests=config.num_parallel,
     )
-    return LLMTeacherAdapter(client=client)
 
+@lru_cache
+def get_chat_provider() -> ChatProvider:
+    return LLMTeacherAdapter(client=get_llm_client())
+
+async def close_llm_client() -> None:
+    """Release the shared LLM connection pool (called on application shutdown)."""
+    if get_llm_client.cache_info().currsize:
+        await get_llm_client().aclose()
+
+@lru_cache
 def get_time_provider() -> TimeProvider:
     return SystemTimeProvider()
 
+@lru_cache
+def get_id_provider() -> IdProvider:
+    return SystemUUIDProvider()
+
 # ──────────────────────────────────────────────────────────────────────────────
 # PORTS
 # ──────────────────────────────────────────────────────────────────────────────
@@ -64,18 +80,29 @@ def get_conversation_reader(
 RepoDep = Annotated[ConversationRepository, Depends(get_conversation_repository)]
 ReaderDep = Annotated[ConversationReader, Depends(get_conversation_reader)]
 TimeDep = Annotated[TimeProvider, Depends(get_time_provider)]
+IdDep = Annotated[IdProvider, Depends(get_id_provider)]
 ChatDep = Annotated[ChatProvider, Depends(get_chat_provider)]
 
 # ──────────────────────────────────────────────────────────────────────────────
 # USE CASES FACTORIES
 # ──────────────────────────────────────────────────────────────────────────────
+# Use cases are stateless: memoizing on their (singleton) dependencies builds
+# each one once per process instead of once per request. Dependency overrides
+# still work, as different dependencies produce a different cache entry.
 
+@lru_cache
 def get_create_conversation_use_case(
     repository: RepoDep,
-    time_provider: TimeDep    
+    time_provider: TimeDep,
+    id_provider: IdDep,
 ) -> CreateConversationUseCase:
-    return CreateConversationUseCase(repository=repository, time_provider=time_provider)
+    return CreateConversationUseCase(
+        repository=repository, 
+        time_provider=time_provider, 
+        id_provider=id_provider,
+    )
 
+@lru_cache
 def get_send_message_use_case(
     chat_provider: ChatDep,
     repository: RepoDep,
@@ -87,17 +114,20 @@ def get_send_message_use_case(
         time_provider=time_provider,
     )
 
+@lru_cache
 def get_select_conversation_use_case(
     repository: RepoDep
 ) -> SelectConversationUseCase:
     return SelectConversationUseCase(repository=repository)
 
+@lru_cache
 def get_delete_conversation_use_case(
     repository: RepoDep,
     time_provider: TimeDep
 ) -> DeleteConversationUseCase:
     return DeleteConversationUseCase(repository=repository, time_provider=time_provider)
 
+@lru_cache
 def get_list_conversations_use_case(
     reader: ReaderDep
 ) -> ListStudentConversationsUseCase:
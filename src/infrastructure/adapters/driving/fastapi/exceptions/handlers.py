@@ -1,20 +1,25 @@
 
+import math
 from http import HTTPStatus
 from fastapi import Request
-from fastapi.responses import JSONResponse
+
+from ..responses import OrjsonResponse
+
 
 def _create_problem_details(
     status_code: int,
     type_uri: str,
     title: str,
     detail: str,
-    instance: str
-) -> JSONResponse:
+    instance: str,
+    headers: dict[str, str] | None = None,
+) -> OrjsonResponse:
     """
     Constructs RFC 7807 compliant error response.
     """
-    return JSONResponse(
+    return OrjsonResponse(
         status_code=status_code,
+        headers=headers,
         content={
             "type": type_uri,
             "title": title,
@@ -24,7 +29,7 @@ def _create_problem_details(
         }
     )
 
-async def resource_not_found_handler(request: Request, exc: Exception) -> JSONResponse:
+async def resource_not_found_handler(request: Request, exc: Exception) -> OrjsonResponse:
     """
     Handles 404 for missing resources.
     """
@@ -36,7 +41,7 @@ async def resource_not_found_handler(request: Request, exc: Exception) -> JSONRe
         instance=str(request.url)
     )
 
-async def resource_conflict_handler(request: Request, exc: Exception) -> JSONResponse:
+async def resource_conflict_handler(request: Request, exc: Exception) -> OrjsonResponse:
     """
     Handles 409 for duplicate resources.
     """
@@ -48,7 +53,7 @@ async def resource_conflict_handler(request: Request, exc: Exception) -> JSONRes
         instance=str(request.url)
     )
 
-async def state_conflict_handler(request: Request, exc: Exception) -> JSONResponse:
+async def state_conflict_handler(request: Request, exc: Exception) -> OrjsonResponse:
     """
     Handles 409 when resource state prevents the action.
     """
@@ -60,7 +65,7 @@ async def state_conflict_handler(request: Request, exc: Exception) -> JSONRespon
         instance=str(request.url)
     )
 
-async def business_rule_handler(request: Request, exc: Exception) -> JSONResponse:
+async def business_rule_handler(request: Request, exc: Exception) -> OrjsonResponse:
     """
     Handles 400 for business rule violations.
     """
@@ -72,19 +77,24 @@ async def business_rule_handler(request: Request, exc: Exception) -> JSONRespons
         instance=str(request.url)
     )
 
-async def teacher_unavailable_handler(request: Request, exc: Exception) -> JSONResponse:
+async def teacher_unavailable_handler(request: Request, exc: Exception) -> OrjsonResponse:
     """
     Handles 503 when LLM service is unavailable.
+    
+    Adds a Retry-After header when the failure says when to retry
+    (e.g. open circuit breaker).
     """
+    retry_after = getattr(exc, "retry_after", None)
     return _create_problem_details(
         status_code=HTTPStatus.SERVICE_UNAVAILABLE,
         type_uri="error:teacher-service-unavailable",
         title="Teacher Service Unavailable",
         detail=str(exc),
-        instance=str(request.url)
+        instance=str(request.url),
+        headers={"Retry-After": str(math.ceil(retry_after))} if retry_after is not None else None,
     )
 
-async def global_domain_handler(request: Request, exc: Exception) -> JSONResponse:
+async def global_domain_handler(request: Request, exc: Exception) -> OrjsonResponse:
     """
     Fallback handler for domain exceptions (400).
     """
@@ -96,7 +106,7 @@ async def global_domain_handler(request: Request, exc: Exception) -> JSONRespons
         instance=str(request.url)
     )
 
-async def global_infrastructure_handler(request: Request, exc: Exception) -> JSONResponse:
+async def global_infrastructure_handler(request: Request, exc: Exception) -> OrjsonResponse:
     """
     Fallback handler for infrastructure errors (500).
     """
@@ -5,13 +5,34 @@ Main entry point for the FastAPI application.
 Configures routes, exception handlers, and starts the server.
 """
 
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 
 from src.infrastructure.adapters.driving.fastapi.routers.conversations import router as conversations_router
 from src.infrastructure.adapters.driving.fastapi.routers.messages import router as messages_router
+from src.infrastructure.adapters.driving.fastapi.routers.health import router as health_router
 from src.infrastructure.adapters.driving.fastapi.exceptions import configure_exception_handlers
+from src.infrastructure.adapters.driving.fastapi.dependencies import close_llm_client
+from src.infrastructure.adapters.driving.fastapi.middleware import ServerTimingMiddleware
+from src.infrastructure.adapters.driving.fastapi.responses import OrjsonResponse
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """
+    Application lifespan: the LLM client (and its connection pool) is shared
+    across requests and only closed at shutdown.
+    """
+    yield
+    await close_llm_client()
+
 
-app = FastAPI()
+app = FastAPI(lifespan=lifespan, default_response_class=OrjsonResponse)
+
+# Cross-cutting concerns (pure ASGI middleware only)
+app.add_middleware(ServerTimingMiddleware)
 
 # Configure global exception handlers
 configure_exception_handlers(app)
@@ -19,14 +40,4 @@ configure_exception_handlers(app)
 # Register API routers
 app.include_router(conversations_router, prefix="/api", tags=["Conversations"])
 app.include_router(messages_router, prefix="/api", tags=["Messages"])
-
-
-@app.get("/health", tags=["Health"], summary="Health check endpoint")
-def health_check() -> dict[str, str]:
-    """
-    Health check endpoint for monitoring and deployment verification.
-    
-    Returns:
-        Status dictionary indicating service health
-    """
-    return {"status": "ok"}
\ No newline at end of file
+app.include_router(health_router)
@@ -0,0 +1,3 @@
+from .timing import ServerTimingMiddleware
+
+__all__ = ["ServerTimingMiddleware"]
@@ -0,0 +1,44 @@
+"""
+Server Timing Middleware
+
+Reports the time spent handling each HTTP request in a `Server-Timing` header.
+
+Written as a pure ASGI middleware rather than with `@app.middleware("http")` /
+`BaseHTTPMiddleware`, which wraps every request in an extra task and memory
+stream.
+"""
+
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+class ServerTimingMiddleware:
+    """
+    Add a `Server-Timing: app;dur=<ms>` header to every HTTP response.
+
+    The duration covers the time until the response headers are sent, which
+    for streamed responses is the time to first byte.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            # lifespan / websocket messages pass through untouched
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                duration_ms = (time.perf_counter() - start) * 1000
+                message["headers"] = [
+                    *message.get("headers", ()),
+                    (b"server-timing", f"app;dur={duration_ms:.1f}".encode()),
+                ]
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
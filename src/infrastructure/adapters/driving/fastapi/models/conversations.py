@@ -6,6 +6,10 @@ from datetime import datetime
 
 from src.core.domain.value_objects import CreativityLevel, GenerationStyle
 
+# Compiled once by pydantic-core (Rust regex) when the models are built at import time,
+# so validation never goes through Python's `re` module.
+LANG_CODE_PATTERN = r"^[a-z]{2}$"
+
 
 class CreateConversationRequest(BaseModel):
     """
@@ -13,8 +17,8 @@ class CreateConversationRequest(BaseModel):
     """
     student_id: Annotated[UUID, Field(..., description="Unique identifier of the student owner")]
     title: Annotated[str | None, Field(None, min_length=1, max_length=100, description="Optional custom title")] = None
-    native_lang: Annotated[str, Field(..., min_length=2, max_length=2, pattern="^[a-z]{2}$", description="ISO 639-1 code (e.g. 'fr')")]
-    target_lang: Annotated[str, Field(..., min_length=2, max_length=2, pattern="^[a-z]{2}$", description="ISO 639-1 code (e.g. 'en')")]
+    native_lang: Annotated[str, Field(..., pattern=LANG_CODE_PATTERN, description="ISO 639-1 code (e.g. 'fr')")]
+    target_lang: Annotated[str, Field(..., pattern=LANG_CODE_PATTERN, description="ISO 639-1 code (e.g. 'en')")]
 
     model_config = ConfigDict(
         json_schema_extra={
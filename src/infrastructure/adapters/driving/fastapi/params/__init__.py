@@ -1,12 +1,11 @@
-
 from .conversations import (
-    PaginationParams,
+    ListConversationsParams,
     ConversationFilterParams,
     DeleteConversationParams,
 )
 
 __all__ = [
-    "PaginationParams",
+    "ListConversationsParams",
     "ConversationFilterParams",
     "DeleteConversationParams",  
-]
\ No newline at end of file
+]
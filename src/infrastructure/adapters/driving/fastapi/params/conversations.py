@@ -1,29 +1,30 @@
-
 from uuid import UUID
 from typing import Annotated
-from dataclasses import dataclass
-from fastapi import Query
+from pydantic import BaseModel, Field
+
+# Query parameter models: each endpoint binds a single model with
+# `Annotated[Model, Query()]`, validated in one pydantic-core pass instead of
+# one sub-dependency per parameter group.
+
 
-@dataclass
-class PaginationParams:
+class ListConversationsParams(BaseModel):
     """
-    Standard pagination parameters reusable across all list endpoints.
+    Filtering and pagination parameters for listing conversations.
     """
-    limit: Annotated[int, Query(ge=1, le=100, description="Number of items to return per page")] = 20
-    offset: Annotated[int, Query(ge=0, description="Number of items to skip")] = 0
+    student_id: Annotated[UUID, Field(description="ID of the student to retrieve conversations for")]
+    limit: Annotated[int, Field(ge=1, le=100, description="Number of items to return per page")] = 20
+    offset: Annotated[int, Field(ge=0, description="Number of items to skip")] = 0
 
 
-@dataclass
-class ConversationFilterParams:
+class ConversationFilterParams(BaseModel):
     """
-    Filtering parameters for listing conversations.
+    Filtering parameters for reading a conversation.
     """
-    student_id: Annotated[UUID, Query(..., description="ID of the student to retrieve conversations for")]
+    student_id: Annotated[UUID, Field(description="ID of the conversation owner")]
 
 
-@dataclass
-class DeleteConversationParams:
+class DeleteConversationParams(BaseModel):
     """
     Security parameters for deletion.
     """
-    student_id: Annotated[UUID, Query(..., description="ID of the conversation owner (security check)")]
\ No newline at end of file
+    student_id: Annotated[UUID, Field(description="ID of the conversation owner (security check)")]
@@ -0,0 +1,24 @@
+"""
+Response classes shared by routers and exception handlers.
+"""
+
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+
+class OrjsonResponse(JSONResponse):
+    """
+    JSON response rendered with orjson.
+    
+    orjson natively serializes dataclasses (our DTOs), UUIDs and datetimes,
+    so read models can be returned as-is without a response_model
+    validation/serialization round-trip.
+    
+    UTC datetimes are rendered with a `Z` suffix, as pydantic does, so the
+    wire format is the same as for routes with a response_model.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_UTC_Z)
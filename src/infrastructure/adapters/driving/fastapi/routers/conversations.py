@@ -1,10 +1,8 @@
 
 from uuid import UUID
-from typing import Annotated, Sequence
+from typing import Annotated
 
-from fastapi import APIRouter, status, Path, Depends
-
-from src.core.domain.value_objects import Language
+from fastapi import APIRouter, status, Path, Query
 
 from src.application.dtos import (
     CreateConversationCommand, CreateConversationResult, 
@@ -13,8 +11,11 @@ from src.application.dtos import (
     DeleteConversationCommand,
 )
 
+from src.infrastructure.utils import to_language
+
 from ..models import CreateConversationRequest
-from ..params import PaginationParams, ConversationFilterParams, DeleteConversationParams
+from ..responses import OrjsonResponse
+from ..params import ListConversationsParams, ConversationFilterParams, DeleteConversationParams
 from ..dependencies import (
     CreateConversationUseCaseDep,
     SelectConversationUseCaseDep,
@@ -24,57 +25,65 @@ from ..dependencies import (
 
 router = APIRouter(tags=["Conversations"])
 
+# Endpoints serialize the use case DTOs directly with orjson: they are already
+# typed, so the response_model round-trip is skipped (the models are still
+# declared in `responses` for the OpenAPI schema).
+
 @router.post(
     "/conversations",
     status_code=status.HTTP_201_CREATED,
-    response_model=CreateConversationResult,
+    response_model=None,
+    response_class=OrjsonResponse,
+    responses={status.HTTP_201_CREATED: {"model": CreateConversationResult}},
 )
 async def create_conversation(
     request: CreateConversationRequest,
     use_case: CreateConversationUseCaseDep
-) -> CreateConversationResult:
+) -> OrjsonResponse:
     """
     Create a new conversation.
     """
     command = CreateConversationCommand(
         student_id=request.student_id,
-        native_lang=Language(request.native_lang),
-        target_lang=Language(request.target_lang)
+        native_lang=to_language(request.native_lang),
+        target_lang=to_language(request.target_lang)
     )
 
-    return await use_case.execute(command)
-
+    return OrjsonResponse(await use_case.execute(command), status_code=status.HTTP_201_CREATED)
 
 @router.get(
     "/conversations",
     status_code=status.HTTP_200_OK,
-    response_model=Sequence[ConversationSummary],
+    response_model=None,
+    response_class=OrjsonResponse,
+    responses={status.HTTP_200_OK: {"model": list[ConversationSummary]}},
 )
 async def list_conversations(
     use_case: ListConversationsUseCaseDep,
-    filters: Annotated[ConversationFilterParams, Depends()],
-    pagination: Annotated[PaginationParams, Depends()]
-) -> Sequence[ConversationSummary]:
+    params: Annotated[ListConversationsParams, Query()]
+) -> OrjsonResponse:
     
     query = ListConversationsQuery(
-        student_id=filters.student_id,
-        limit=pagination.limit,
-        offset=pagination.offset,
+        student_id=params.student_id,
+        limit=params.limit,
+        offset=params.offset,
     )
 
-    return await use_case.execute(query=query)
+    return OrjsonResponse(await use_case.execute(query=query))
 
 
 @router.get(
     "/conversations/{conversation_id}",
     status_code=status.HTTP_200_OK,
-    response_model=SelectConversationResult,
+    response_model=None,
+    response_class=OrjsonResponse,
+    responses={status.HTTP_200_OK: {"model": SelectConversationResult}},
 )
 async def get_conversation(
     conversation_id: Annotated[UUID, Path(description="Unique identifier of the conversation")],
-    filters: Annotated[ConversationFilterParams, Depends()],
+    filters: Annotated[ConversationFilterParams, Query()],
     use_case: SelectConversationUseCaseDep
-) -> SelectConversationResult:
+) -> OrjsonResponse:
     """
     Retrieve conversation details including message history.
     """
@@ -83,7 +92,7 @@ async def get_conversation(
         student_id=filters.student_id
     )
 
-    return await use_case.execute(query=query)
+    return OrjsonResponse(await use_case.execute(query=query))
 
 
 @router.delete(
@@ -92,7 +101,7 @@ async def get_conversation(
 )
 async def delete_conversation(
     conversation_id: Annotated[UUID, Path(description="Unique identifier of the conversation to delete")],
-    delete_params: Annotated[DeleteConversationParams, Depends()],
+    delete_params: Annotated[DeleteConversationParams, Query()],
     use_case: DeleteConversationUseCaseDep
 ) -> None:
     """
@@ -1,11 +1,25 @@
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Response
 
-router = APIRouter(tags=["System"])
+router = APIRouter(tags=["Health"])
 
-@router.get("/health")
-async def health_check() -> dict[str, str]:
+# Constant body, built once at import
+_HEALTH_BODY = b'{"status":"ok"}'
+
+
+@router.head("/health", include_in_schema=False)
+@router.get(
+    "/health",
+    summary="Health check endpoint",
+    response_class=Response,
+    responses={200: {"content": {"application/json": {"example": {"status": "ok"}}}}},
+)
+async def health_check() -> Response:
     """
-    Health check endpoint.
+    Health check endpoint for monitoring and deployment verification.
+
+    Liveness probes hit this endpoint constantly: it is async (no threadpool
+    hop) and sends a precomputed body instead of serializing one per call.
+    Load balancers often probe with HEAD, which gets the same headers.
     """
-    return {"status": "ok"}
\ No newline at end of file
+    return Response(content=_HEALTH_BODY, media_type="application/json")
@@ -1,14 +1,20 @@
 
+from collections.abc import AsyncIterator
 from uuid import UUID
 from typing import Annotated
 
+import orjson
 from fastapi import APIRouter, status, Path
+from fastapi.responses import StreamingResponse
+
+from src.core.exceptions import TeacherResponseError
 
 from src.application.dtos import (
     SendMessageCommand, SendMessageResult,
 )
 
 from ..models import SendMessageRequest
+from ..responses import OrjsonResponse
 from ..dependencies import SendMessageUseCaseDep
 
 router = APIRouter(tags=["Messages"])
@@ -16,13 +22,15 @@ router = APIRouter(tags=["Messages"])
 @router.post(
     "/conversations/{conversation_id}/messages",
     status_code=status.HTTP_200_OK,
-    response_model=SendMessageResult,
+    response_model=None,
+    response_class=OrjsonResponse,
+    responses={status.HTTP_200_OK: {"model": SendMessageResult}},
 )
 async def send_message(
     conversation_id: Annotated[UUID, Path(description="The conversation context")],
     request: SendMessageRequest,
     use_case: SendMessageUseCaseDep
-) -> SendMessageResult:
+) -> OrjsonResponse:
     """
     Send a message and receive AI response.
     """
@@ -33,4 +41,51 @@ async def send_message(
         generation_style=request.generation_style
     )
 
-    return await use_case.execute(command)
\ No newline at end of file
+    return OrjsonResponse(await use_case.execute(command))
+
+
+@router.post(
+    "/conversations/{conversation_id}/messages/stream",
+    status_code=status.HTTP_200_OK,
+    response_class=StreamingResponse,
+)
+async def stream_message(
+    conversation_id: Annotated[UUID, Path(description="The conversation context")],
+    request: SendMessageRequest,
+    use_case: SendMessageUseCaseDep
+) -> StreamingResponse:
+    """
+    Send a message and stream the AI response as server-sent events.
+    """
+    command = SendMessageCommand(
+        conversation_id=conversation_id,
+        student_message=request.student_message,
+        creativity_level=request.creativity_level,
+        generation_style=request.generation_style
+    )
+
+    chunks = await use_case.stream(command)
+    return StreamingResponse(_to_server_sent_events(chunks), media_type="text/event-stream")
+
+
+async def _to_server_sent_events(chunks: AsyncIterator[str]) -> AsyncIterator[str]:
+    """
+    Frame text chunks as SSE `data:` events (one `data:` line per text line).
+
+    The status line is already sent when the stream fails, so a failure is
+    reported as a final `event: error` frame carrying a problem type and detail.
+    """
+    try:
+        async for chunk in chunks:
+            yield "".join(f"data: {line}\n" for line in chunk.split("\n")) + "\n"
+    except TeacherResponseError as exc:
+        yield _error_event("error:teacher-service-unavailable", str(exc))
+    except Exception:
+        yield _error_event("error:internal-server-error", "An internal error occurred.")
+        raise
+
+
+def _error_event(type_uri: str, detail: str) -> str:
+    """Frame an SSE `error` event (JSON payload on a single data line)."""
+    payload = orjson.dumps({"type": type_uri, "detail": detail}).decode()
+    return f"event: error\ndata: {payload}\n\n"
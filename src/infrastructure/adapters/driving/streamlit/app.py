@@ -2,15 +2,18 @@
 import streamlit as st
 import asyncio
 import sys
+import threading
+from collections.abc import AsyncIterator, Iterator
 from pathlib import Path
-from uuid import UUID, uuid4
+from typing import TypeVar
+from uuid import uuid4
 
 current_file = Path(__file__).resolve()
 project_root = current_file.parents[5]
 sys.path.append(str(project_root))
 print(project_root)
 
-from src.core.domain.value_objects import Language, CreativityLevel, GenerationStyle
+from src.core.domain.value_objects import CreativityLevel, GenerationStyle
 
 from src.application.dtos import (
     CreateConversationCommand, 
@@ -20,6 +23,9 @@ from src.application.dtos import (
 )
 
 from src.infrastructure.adapters.driving.streamlit import get_container
+from src.infrastructure.utils import to_language, to_uuid
+
+T = TypeVar("T")
 
 st.set_page_config(
     page_title="PolyglotAI",
@@ -27,9 +33,73 @@ st.set_page_config(
     layout="wide"
 )
 
+@st.cache_resource
+def get_event_loop() -> asyncio.AbstractEventLoop:
+    """
+    Long-lived event loop shared by every session, running in a daemon thread.
+    
+    The LLM client and its connection pool are process-wide singletons bound
+    to the loop they were first used on, so all async work must run on the
+    same loop (instead of a fresh `asyncio.run` loop per action).
+    """
+    loop = asyncio.new_event_loop()
+    threading.Thread(target=loop.run_forever, name="polyglot-event-loop", daemon=True).start()
+    return loop
+
 def run_async(coroutine):
     """Execute async code in synchronous Streamlit context."""
-    return asyncio.run(coroutine)
+    return asyncio.run_coroutine_threadsafe(coroutine, get_event_loop()).result()
+
+def iterate_async(iterator: AsyncIterator[T]) -> Iterator[T]:
+    """
+    Consume an async iterator from synchronous Streamlit code, item by item.
+    
+    The async iterator is closed on the event loop when this generator ends,
+    including when the rerun that consumes it is interrupted midway.
+    """
+    async def next_item() -> T:
+        return await anext(iterator)
+
+    try:
+        while True:
+            try:
+                yield run_async(next_item())
+            except StopAsyncIteration:
+                return
+    finally:
+        aclose = getattr(iterator, "aclose", None)
+        if aclose is not None:
+            run_async(aclose())
+
+def select_conversation(conversation_id: str) -> None:
+    """Button callback: make the given conversation the current one."""
+    st.session_state.current_conversation_id = conversation_id
+
+async def load_page(student_id: str, conversation_id: str | None):
+    """
+    Fetch the sidebar list and the selected conversation concurrently.
+    
+    Returns:
+        (conversations, conversation) where each item is either the result or
+        the exception raised while loading it; conversation is None when no
+        conversation is selected.
+    """
+    async def list_conversations():
+        query = ListConversationsQuery(student_id=to_uuid(student_id), limit=10, offset=0)
+        return await container.list_conversations_use_case.execute(query=query)
+
+    async def select_conversation():
+        if conversation_id is None:
+            return None
+        query = SelectConversationQuery(
+            conversation_id=to_uuid(conversation_id),
+            student_id=to_uuid(student_id)
+        )
+        return await container.select_conversation_use_case.execute(query=query)
+
+    return await asyncio.gather(
+        list_conversations(), select_conversation(), return_exceptions=True
+    )
 
 if "student_id" not in st.session_state:
     st.session_state.student_id = str(uuid4())
@@ -61,10 +131,10 @@ with st.sidebar:
             if submitted:
                 try:
                     cmd = CreateConversationCommand(
-                        student_id=UUID(st.session_state.student_id),
+                        student_id=to_uuid(st.session_state.student_id),
                         title=title if title else None,
-                        native_lang=Language(native),
-                        target_lang=Language(target)
+                        native_lang=to_language(native),
+                        target_lang=to_language(target)
                     )
                     result = run_async(container.create_conversation_use_case.execute(cmd))
                     
@@ -73,22 +143,28 @@ with st.sidebar:
                 except Exception as e:
                     st.error(f"Error: {str(e)}")
 
+    # Both panels are loaded in a single loop round trip
+    conversations, conversation_dto = run_async(
+        load_page(st.session_state.student_id, st.session_state.current_conversation_id)
+    )
+
     try:
-        query = ListConversationsQuery(
-            student_id=UUID(st.session_state.student_id),
-            limit=10,
-            offset=0
-        )
-        conversations = run_async(
-            container.list_conversations_use_case.execute(query=query)
-        )
+        if isinstance(conversations, Exception):
+            raise conversations
         
         st.caption("Recent")
         for conv in conversations:
             btn_label = f"{'🟢' if conv.status == 'ACTIVE' else '⚪'} {conv.title}"
-            if st.button(btn_label, key=str(conv.conversation_id), use_container_width=True):
-                st.session_state.current_conversation_id = str(conv.conversation_id)
-                st.rerun()
+            # Selecting in the click callback (which runs before the rerun the
+            # click triggers) renders the new conversation in one script run
+            # instead of two (click rerun + explicit st.rerun)
+            st.button(
+                btn_label,
+                key=str(conv.conversation_id),
+                use_container_width=True,
+                on_click=select_conversation,
+                args=(str(conv.conversation_id),),
+            )
                 
     except Exception as e:
         st.error("Could not load history.")
@@ -99,15 +175,9 @@ if not st.session_state.current_conversation_id:
     st.info("👈 Select a conversation or create a new one to start.")
 else:
     try:
-        current_id = UUID(st.session_state.current_conversation_id)
-        query = SelectConversationQuery(
-            conversation_id=current_id,
-            student_id=UUID(st.session_state.student_id)
-        )
-
-        conversation_dto = run_async(
-            container.select_conversation_use_case.execute(query=query)
-        )
+        current_id = to_uuid(st.session_state.current_conversation_id)
+        if isinstance(conversation_dto, Exception):
+            raise conversation_dto
         
         st.title(conversation_dto.title)
         st.caption(f"Learning {conversation_dto.target_lang} from {conversation_dto.native_lang}")
@@ -121,20 +191,21 @@ else:
                 st.markdown(prompt)
 
             with st.chat_message("teacher"):
-                with st.spinner("Generating response..."):
-                    try:
-                        cmd = SendMessageCommand(
-                            conversation_id=current_id,
-                            student_message=prompt,
-                            creativity_level=CreativityLevel.MODERATE,
-                            generation_style=GenerationStyle.CONVERSATIONAL
-                        )
-                        response_dto = run_async(container.send_message_use_case.execute(cmd))
+                try:
+                    cmd = SendMessageCommand(
+                        conversation_id=current_id,
+                        student_message=prompt,
+                        creativity_level=CreativityLevel.MODERATE,
+                        generation_style=GenerationStyle.CONVERSATIONAL
+                    )
+                    with st.spinner("Generating response..."):
+                        chunks = run_async(container.send_message_use_case.stream(cmd))
+                    
+                    # Render tokens as they arrive instead of waiting for the full reply
+                    st.write_stream(iterate_async(chunks))
                         
-                        st.markdown(response_dto.teacher_message)    
-                            
-                    except Exception as e:
-                        st.error(f"Error: {str(e)}")
+                except Exception as e:
+                    st.error(f"Error: {str(e)}")
 
     except Exception as e:
         st.error(f"Error loading conversation: {str(e)}")
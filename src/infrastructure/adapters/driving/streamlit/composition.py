@@ -1,10 +1,11 @@
 
-from functools import lru_cache
+from functools import cached_property, lru_cache
 
 from src.infrastructure.adapters.driving.fastapi.dependencies import (
     get_in_memory_db,
     get_chat_provider,
     get_time_provider,
+    get_id_provider,
     get_create_conversation_use_case,
     get_list_conversations_use_case,
     get_select_conversation_use_case,
@@ -16,28 +17,36 @@ from src.infrastructure.adapters.driving.fastapi.dependencies import (
 class Container:
     """
     Dependency injection container for Streamlit.
+    
+    Use cases are resolved once per container (itself a process-wide
+    singleton): Streamlit reruns the script on every interaction, and each
+    rerun would otherwise walk the factory graph again.
     """
     
-    @property
+    @cached_property
     def create_conversation_use_case(self):
         db = get_in_memory_db()
         repo = get_conversation_repository(db)
         time = get_time_provider()
-        return get_create_conversation_use_case(repository=repo, time_provider=time)
+        return get_create_conversation_use_case(
+            repository=repo, 
+            time_provider=time, 
+            id_provider=get_id_provider(),
+        )
 
-    @property
+    @cached_property
     def list_conversations_use_case(self):
         db = get_in_memory_db()
         reader = get_conversation_reader(db)
         return get_list_conversations_use_case(reader=reader)
 
-    @property
+    @cached_property
     def select_conversation_use_case(self):
         db = get_in_memory_db()
         repo = get_conversation_repository(db)
         return get_select_conversation_use_case(repository=repo)
 
-    @property
+    @cached_property
     def send_message_use_case(self):
         chat = get_chat_provider()
         db = get_in_memory_db()
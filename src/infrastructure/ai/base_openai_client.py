@@ -17,19 +17,40 @@ Error Mapping Strategy:
     messages. This ensures the core domain layer remains pure and doesn't depend on
     infrastructure details.
 """
+import asyncio
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator, Sequence
+from contextlib import AbstractAsyncContextManager, nullcontext
+from functools import lru_cache
+from typing import Any
 
 from src.core.domain import ChatMessage, Role
 from src.core.exceptions import TeacherResponseError
 
+import httpx
 import openai
 from openai import AsyncOpenAI, AsyncAzureOpenAI
-from openai.types.chat import (
-    ChatCompletionMessageParam,
-    ChatCompletionSystemMessageParam,
-    ChatCompletionUserMessageParam,
-    ChatCompletionAssistantMessageParam,
-)
+from openai.types.chat import ChatCompletionMessageParam
+
+# Domain role -> OpenAI chat role
+_OPENAI_ROLES: dict[Role, str] = {
+    Role.STUDENT: "user",
+    Role.TEACHER: "assistant",
+}
+
+# Specific SDK errors (APIStatusError subclasses) come before the generic
+# status error, which is handled separately since its message has the code.
+_OPENAI_ERROR_MESSAGES: dict[type[Exception], str] = {
+    openai.RateLimitError: "The teacher is currently busy. Please try again later.",
+    openai.AuthenticationError: "Teacher service configuration error (Auth).",
+    openai.PermissionDeniedError: "Access denied to the learning service.",
+    openai.APIConnectionError: "The teacher service is currently unavailable.",
+}
+
+@lru_cache(maxsize=32)
+def _system_message(system_prompt: str) -> ChatCompletionMessageParam:
+    """Shared (never mutated) system message for a given prompt."""
+    return {"role": "system", "content": system_prompt}
 
 class BaseOpenAIClient(ABC):
     """
@@ -43,10 +64,20 @@ class BaseOpenAIClient(ABC):
     Subclasses must implement _create_client() 
     to provide the appropriate client.
     """
-    def __init__(self, model_name: str):
-        
+    def __init__(self, model_name: str, max_concurrent_requests: int | None = None):
+        """
+        Args:
+            model_name: Model used for completions
+            max_concurrent_requests: Completions allowed in flight at once
+                (default: unbounded). Set it to the backend's parallel slots so
+                excess calls wait here instead of queueing server-side, where
+                a full queue is rejected as an error.
+        """
         self._model_name = model_name
         self._client: AsyncOpenAI | AsyncAzureOpenAI | None = None
+        self._request_slots = (
+            asyncio.Semaphore(max_concurrent_requests) if max_concurrent_requests else None
+        )
 
     @property
     def model(self) -> str:
@@ -60,6 +91,12 @@ class BaseOpenAIClient(ABC):
             self._client = self._create_client()
         return self._client
 
+    async def aclose(self) -> None:
+        """Close the underlying client and its connection pool, if created."""
+        if self._client is not None:
+            await self._client.close()
+            self._client = None
+
     @abstractmethod
     def _create_client(self) -> AsyncOpenAI | AsyncAzureOpenAI:
         """
@@ -69,33 +106,37 @@ class BaseOpenAIClient(ABC):
         """
         ...
 
+    def _extra_body(self) -> dict[str, object] | None:
+        """
+        Provider-specific fields merged into the request body.
+        
+        Override in subclasses to send options the OpenAI schema doesn't know about.
+        """
+        return None
+
     def _convert_to_openai_format(
         self, 
-        messages: tuple[ChatMessage, ...],
+        messages: Sequence[ChatMessage],
         system_prompt: str
     ) -> list[ChatCompletionMessageParam]:
         """
         Convert domain messages to OpenAI SDK format.
         
+        The system prompt is always emitted first, followed by the history in
+        order, so consecutive turns share a common prompt prefix.
+        
         Args:
             messages: List of ChatMessage entities
-            system_prompt: 
+            system_prompt: System instructions, sent as the leading message.
             
         Returns:
             List of ChatCompletionMessageParam for OpenAI SDK
         """
-        sdk_messages: list[ChatCompletionMessageParam] = []
-        sdk_messages.append(ChatCompletionSystemMessageParam(role="system", content=system_prompt))
-
-        for msg in messages:
-            role = msg.role
-            content = msg.content
-            
-            if role == Role.STUDENT:
-                sdk_messages.append(ChatCompletionUserMessageParam(role="user", content=content))
-            else:
-                sdk_messages.append(ChatCompletionAssistantMessageParam(role="assistant", content=content))
-            
+        sdk_messages: list[ChatCompletionMessageParam] = [_system_message(system_prompt)]
+        sdk_messages.extend(
+            {"role": _OPENAI_ROLES[msg.role], "content": msg.content}
+            for msg in messages
+        )
         return sdk_messages
 
     async def generate(
@@ -107,30 +148,8 @@ class BaseOpenAIClient(ABC):
         Generates a response using the LLM provider.
         """
         formatted_messages = self._convert_to_openai_format(messages, system_prompt)
-
-        try:
-            # API call
-            response = await self.client.chat.completions.create(
-                messages=formatted_messages, 
-                model=self.model,
-            )
-        except openai.RateLimitError as e:
-            raise TeacherResponseError(cause="The teacher is currently busy. Please try again later.") from e
-        
-        except openai.AuthenticationError as e:
-            raise TeacherResponseError(cause="Teacher service configuration error (Auth).") from e
-        
-        except openai.PermissionDeniedError as e:
-            raise TeacherResponseError(cause="Access denied to the learning service.") from e
-        
-        except openai.APIConnectionError as e:
-            raise TeacherResponseError(cause="The teacher service is currently unavailable.") from e
-
-        except openai.APIStatusError as e:
-            raise TeacherResponseError(cause=f"Teacher service encountered an error ({e.status_code}).") from e
-            
-        except Exception as e:
-            raise TeacherResponseError(cause=f"An unexpected error occurred.") from e
+        async with self._request_slot():
+            response = await self._create_completion(formatted_messages)
         
         try:
             content = response.choices[0].message.content
@@ -139,4 +158,70 @@ class BaseOpenAIClient(ABC):
             return content.strip()
             
         except (AttributeError, IndexError) as e:
-            raise TeacherResponseError(cause="Invalid response format from teacher service.") from e
\ No newline at end of file
+            raise TeacherResponseError(cause="Invalid response format from teacher service.") from e
+
+    async def stream(
+            self,
+            messages: tuple[ChatMessage, ...],
+            system_prompt: str = "You're an helpful assistant."
+        ) -> AsyncIterator[str]:
+        """
+        Streams a response from the LLM provider, yielding text chunks as they arrive.
+        """
+        formatted_messages = self._convert_to_openai_format(messages, system_prompt)
+
+        # The slot is held for the whole stream: generation runs until the last chunk
+        async with self._request_slot():
+            response = await self._create_completion(formatted_messages, stream=True)
+
+            try:
+                async for chunk in response:
+                    if chunk.choices and chunk.choices[0].delta.content:
+                        yield chunk.choices[0].delta.content
+            # A read timeout or dropped connection mid-stream surfaces as a raw httpx error
+            except (openai.APIError, httpx.HTTPError) as e:
+                raise TeacherResponseError(cause="The teacher service interrupted its response.") from e
+
+    def _request_slot(self) -> AbstractAsyncContextManager[Any]:
+        """Wait for a free request slot (no-op when concurrency is unbounded)."""
+        return self._request_slots if self._request_slots is not None else nullcontext()
+
+    async def _create_completion(
+            self,
+            formatted_messages: list[ChatCompletionMessageParam],
+            **options: Any,
+        ) -> Any:
+        """
+        Call the chat completions API, mapping SDK errors to domain errors.
+        """
+        try:
+            # API call
+            return await self.client.chat.completions.create(
+                messages=formatted_messages, 
+                model=self.model,
+                extra_body=self._extra_body(),
+                **options,
+            )
+        except Exception as e:
+            raise TeacherResponseError(cause=_describe_openai_error(e)) from e
+
+
+def _describe_openai_error(error: Exception) -> str:
+    """
+    Map an SDK exception to a domain-focused message.
+    
+    Exact types are resolved with a single dict lookup; subclasses (e.g.
+    APITimeoutError under APIConnectionError) fall back to an isinstance scan.
+    """
+    message = _OPENAI_ERROR_MESSAGES.get(type(error))
+    if message is not None:
+        return message
+
+    for error_type, message in _OPENAI_ERROR_MESSAGES.items():
+        if isinstance(error, error_type):
+            return message
+
+    if isinstance(error, openai.APIStatusError):
+        return f"Teacher service encountered an error ({error.status_code})."
+    return "An unexpected error occurred."
+
@@ -1,4 +1,5 @@
 
+from collections.abc import AsyncIterator
 from typing import Protocol
 
 from src.core.domain.entities import ChatMessage
@@ -28,4 +29,21 @@ class LLMClient(Protocol):
         Returns:
             The generated response text.
         """
-        ...
\ No newline at end of file
+        ...
+
+    def stream(
+        self,
+        messages: tuple[ChatMessage, ...],
+        system_prompt: str,
+    ) -> AsyncIterator[str]:
+        """
+        Stream a response from the LLM, chunk by chunk.
+        
+        Args:
+            messages: Conversation history as domain entities.
+            system_prompt: System instructions for the LLM.
+            
+        Yields:
+            Text chunks of the generated response.
+        """
+        ...
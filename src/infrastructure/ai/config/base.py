@@ -72,14 +72,19 @@ class SecretString:
         
         This allows SecretString to be used as a field type in Pydantic models.
         """
-        # Accept either a string (convert to SecretString) or an existing SecretString (pass through)
-        return core_schema.union_schema([
-            core_schema.is_instance_schema(cls),
-            core_schema.no_info_after_validator_function(
-                cls,
-                core_schema.str_schema(),
+        # Accept either a string (convert to SecretString) or an existing SecretString (pass through),
+        # in a single validator call rather than a two-branch union
+        def validate(value: Any) -> SecretString:
+            if isinstance(value, cls):
+                return value
+            if isinstance(value, str):
+                return cls(value)
+            raise ValueError("SecretString expects a string")
+
+        return core_schema.no_info_plain_validator_function(
+            validate,
+            serialization=core_schema.plain_serializer_function_ser_schema(
+                lambda x: "**********",
+                info_arg=False,
             ),
-        ], serialization=core_schema.plain_serializer_function_ser_schema(
-            lambda x: "**********",
-            info_arg=False,
-        ))
\ No newline at end of file
+        )
@@ -4,9 +4,11 @@ Ollama Configuration
 Configuration for the Ollama local LLM provider.
 """
 
+import os
+from functools import lru_cache
 from typing import Self
 from pydantic import Field, field_validator
-from .base import ImmutableConfig, get_env
+from .base import ImmutableConfig
 
 
 class OllamaConfig(ImmutableConfig):
@@ -16,6 +18,7 @@ class OllamaConfig(ImmutableConfig):
     Env variables:
     - OLLAMA_BASE_URL: Ollama server URL (default: http://localhost:11434)
     - OLLAMA_CHAT_MODEL: Chat model (default: qwen2.5:7b)
+    - OLLAMA_NUM_PARALLEL: Requests the server processes in parallel (default: unbounded)
     
     Note:
         Ollama runs locally so no API key is required.
@@ -24,6 +27,7 @@ class OllamaConfig(ImmutableConfig):
     base_url: str = Field(default="http://localhost:11434")
     model: str = Field(default="qwen2.5:7b")
     temperature: float = Field(default=0.7)
+    num_parallel: int | None = Field(default=None, ge=1)
     
     def model_name(self) -> str:
         """Get the chat model name."""
@@ -43,15 +47,20 @@ class OllamaConfig(ImmutableConfig):
         return f"{self.base_url}/v1"
     
     @classmethod
+    @lru_cache(maxsize=1)
     def from_env(cls) -> Self:
         """
         Create Ollama config from environment variables.
         
+        The environment is read (and the config validated) once per process.
+        
         Returns:
             Validated Ollama configuration
         """
+        env = os.environ
         return cls(
-            base_url=get_env("OLLAMA_BASE_URL", "http://localhost:11434"),
-            model=get_env("OLLAMA_MODEL", "qwen2.5:7b"),
-            temperature=float(get_env("LLM_TEMPERATURE", "0.7")),
+            base_url=env.get("OLLAMA_BASE_URL", "http://localhost:11434"),
+            model=env.get("OLLAMA_MODEL", "qwen2.5:7b"),
+            temperature=float(env.get("LLM_TEMPERATURE", "0.7")),
+            num_parallel=int(env.get("OLLAMA_NUM_PARALLEL", "0")) or None,
         )
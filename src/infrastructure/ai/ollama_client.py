@@ -1,15 +1,29 @@
 
+import httpx
 from openai import AsyncOpenAI
 from .base_openai_client import BaseOpenAIClient
 
+# Connection pool shared by every request of a client instance: keep-alive
+# connections to Ollama are reused instead of paying a TCP setup per call.
+_POOL_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=50)
+# Keep the SDK's 600s budget for slow generations, but fail fast when
+# Ollama is not even reachable.
+_TIMEOUT = httpx.Timeout(600.0, connect=2.0)
+
 class OllamaClient(BaseOpenAIClient):
 
-    def __init__(self, base_url: str, model_name: str):
+    def __init__(self, base_url: str, model_name: str, max_concurrent_requests: int | None = None):
         self.base_url = base_url
-        super().__init__(model_name)
+        super().__init__(model_name, max_concurrent_requests)
 
     def _create_client(self) -> AsyncOpenAI:
         return AsyncOpenAI(
             base_url=self.base_url,
-            api_key="ollama"
+            api_key="ollama",
+            http_client=httpx.AsyncClient(limits=_POOL_LIMITS, timeout=_TIMEOUT),
         )
+
+    def _extra_body(self) -> dict[str, object]:
+        # Ask the server to keep the KV state of the shared prompt prefix
+        # (system prompt + previous turns) between requests.
+        return {"cache_prompt": True}
@@ -0,0 +1,7 @@
+from .language import to_language
+from .uuid import to_uuid
+
+__all__ = [
+    "to_language",
+    "to_uuid",
+]
@@ -0,0 +1,29 @@
+"""
+Language Parsing
+
+Memoized ISO code to Language conversion for driving adapters.
+"""
+
+from functools import lru_cache
+
+from src.core.domain.value_objects import Language
+
+
+@lru_cache(maxsize=256)
+def to_language(code: str) -> Language:
+    """
+    Build the Language value object for an ISO code, reusing known instances.
+
+    Language is immutable, so a single instance per code can be shared; only
+    the first occurrence of a code pays for normalization and validation.
+
+    Args:
+        code: ISO 639-1 language code
+
+    Returns:
+        The Language value object
+
+    Raises:
+        InvalidLanguageIsoCodeError: If the code is invalid (failures are not cached)
+    """
+    return Language(code)
@@ -0,0 +1,26 @@
+"""
+UUID Parsing
+
+Memoized string to UUID conversion for driving adapters that re-parse the
+same identifiers over and over (e.g. Streamlit session state on every rerun).
+"""
+
+from functools import lru_cache
+from uuid import UUID
+
+
+@lru_cache(maxsize=4096)
+def to_uuid(value: str) -> UUID:
+    """
+    Parse a UUID string, reusing the result for strings already seen.
+
+    Args:
+        value: The UUID in any form accepted by `uuid.UUID`
+
+    Returns:
+        The parsed UUID
+
+    Raises:
+        ValueError: If the string is not a valid UUID (failures are not cached)
+    """
+    return UUID(value)
@@ -1,11 +1,12 @@
+from __future__ import annotations
 
-from typing import Protocol
-from uuid import UUID, uuid4
+from typing import TYPE_CHECKING, Final
 
 import pytest
 from datetime import datetime, timezone
 
 from src.core.domain import (
+    Conversation,
     CreativityLevel, 
     GenerationStyle, 
     Language,
@@ -17,73 +18,74 @@ from src.application.dtos.conversations import (
     # CreateConversationUseCase
     CreateConversationCommand,
     # SelectConversationUseCase
-    SelectConversationQuery, MessageView,
+    MessageView,
     # SendMessageUseCase 
     SendMessageCommand,
-    # DeleteConversationUseCase
-    DeleteConversationCommand,
 )
 
-from tests.doubles.stubs import StubTimeProvider
-
-# Protocols
-
-class MakeListConversationsQuery(Protocol):
-    def __call__(
-        self,
-        student_id: UUID,
-        limit: int,
-        offset: int,
-    ) -> ListConversationsQuery: ...
-
-class MakeCreateConversationCommand(Protocol):
-    def __call__(
-        self,
-        student_id: UUID,
-        native_lang: Language,
-        target_lang: Language,
-        title: str,
-    ) -> CreateConversationCommand: ...
-
-class MakeSelectConversationQuery(Protocol):
-    def __call__(
-        self,
-        student_id: UUID,
-        conversation_id: UUID,
-    ) -> SelectConversationQuery: ...
-
-class MakeMessageView(Protocol):
-    def __call__(
-        self,
-        id: UUID,
-        role: str,
-        content: str,
-        created_at: datetime,
-    ) -> MessageView: ...
-
-
-class MakeSendMessageCommand(Protocol):
-    def __call__(
-        self,
-        conversation_id: UUID,
-        student_message: str,
-        creativity_level: CreativityLevel,
-        generation_style: GenerationStyle,
-    ) -> SendMessageCommand: ...
-
-class MakeDeleteConversationCommand(Protocol):
-    def __call__(
-        self,
-        conversation_id: UUID,
-    ) -> DeleteConversationCommand: ...
+from tests.doubles.fakes import InMemoryConversationRepository
+from tests.doubles.factories import make_bare_conversation
+from tests.doubles.stubs import StubTimeProvider, fresh_uuid
+
+if TYPE_CHECKING:
+    # Only referenced in annotations
+    from collections.abc import Iterator
+    from typing import Protocol
+    from uuid import UUID
+
+# Fixed timestamp for deterministic tests
+FIXED_TIME: Final[datetime] = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+
+# Default languages, built once
+LANG_FR: Final[Language] = Language("fr")
+LANG_EN: Final[Language] = Language("en")
+
+# Protocols (fixture return types, only needed by the type checker)
+
+if TYPE_CHECKING:
+    class MakeListConversationsQuery(Protocol):
+        def __call__(
+            self,
+            student_id: UUID,
+            limit: int,
+            offset: int,
+        ) -> ListConversationsQuery: ...
+
+    class MakeCreateConversationCommand(Protocol):
+        def __call__(
+            self,
+            student_id: UUID,
+            native_lang: Language,
+            target_lang: Language,
+            title: str,
+        ) -> CreateConversationCommand: ...
+
+    class MakeMessageView(Protocol):
+        def __call__(
+            self,
+            id: UUID,
+            role: str,
+            content: str,
+            created_at: datetime,
+        ) -> MessageView: ...
+
+    class MakeSendMessageCommand(Protocol):
+        def __call__(
+            self,
+            conversation_id: UUID,
+            student_message: str,
+            creativity_level: CreativityLevel,
+            generation_style: GenerationStyle,
+        ) -> SendMessageCommand: ...
 
 # Fixtures
+# Factories are pure (no state kept between calls): built once per session
 
 # ──────────────────────────────────────────────────────────────────────────
 # ListStudentConversationsUseCase 
 # ──────────────────────────────────────────────────────────────────────────
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def make_list_conversations_query() -> MakeListConversationsQuery:
     """
     Factory fixture for creating ListConversationsQuery DTOs.
@@ -96,7 +98,7 @@ def make_list_conversations_query() -> MakeListConversationsQuery:
         offset: int = 0,
     ) -> ListConversationsQuery:
         return ListConversationsQuery(
-            student_id=student_id or uuid4(),
+            student_id=student_id or fresh_uuid(),
             limit=limit,
             offset=offset,
         )
@@ -107,7 +109,7 @@ def make_list_conversations_query() -> MakeListConversationsQuery:
 # CreateConversationUseCase 
 # ──────────────────────────────────────────────────────────────────────────
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def make_create_conversation_command() -> MakeCreateConversationCommand:
     """
     Factory fixture for creating CreateConversationCommand DTOs.
@@ -117,12 +119,12 @@ def make_create_conversation_command() -> MakeCreateConversationCommand:
     """
     def _factory(
         student_id: UUID | None = None,
-        native_lang: Language = Language("fr"),
-        target_lang: Language = Language("en"),
+        native_lang: Language = LANG_FR,
+        target_lang: Language = LANG_EN,
         title: str = "New conversation",
     ) -> CreateConversationCommand:
         return CreateConversationCommand(
-            student_id=student_id or uuid4(),
+            student_id=student_id or fresh_uuid(),
             native_lang=native_lang,
             target_lang=target_lang,
         )
@@ -133,12 +135,12 @@ def make_create_conversation_command() -> MakeCreateConversationCommand:
 # SelectConversationUseCase 
 # ──────────────────────────────────────────────────────────────────────────
 
-@pytest.fixture
-def make_message_view(fixed_time: datetime) -> MakeMessageView:
+@pytest.fixture(scope="session")
+def make_message_view() -> MakeMessageView:
     """
     Factory fixture for creating MessageView DTOs.
     
-    Uses fixed_time as default for timestamps to ensure deterministic tests.
+    Uses FIXED_TIME as default for timestamps to ensure deterministic tests.
     Default role is "student".
     """
     def _factory(
@@ -148,28 +150,10 @@ def make_message_view(fixed_time: datetime) -> MakeMessageView:
         created_at: datetime | None = None,
     ) -> MessageView:
         return MessageView(
-            id=id or uuid4(),
+            id=id or fresh_uuid(),
             role=role,
             content=content,
-            created_at=created_at or fixed_time,
-        )
-    
-    return _factory
-
-@pytest.fixture
-def make_select_conversation_query() -> MakeSelectConversationQuery:
-    """
-    Factory fixture for creating SelectConversationQuery DTOs.
-    
-    Generates random UUIDs for student and conversation IDs if not provided.
-    """
-    def _factory(
-        student_id: UUID | None = None,
-        conversation_id: UUID | None = None
-    ) -> SelectConversationQuery:
-        return SelectConversationQuery(
-            student_id=student_id or uuid4(),
-            conversation_id=conversation_id or uuid4()
+            created_at=created_at or FIXED_TIME,
         )
     
     return _factory
@@ -178,7 +162,7 @@ def make_select_conversation_query() -> MakeSelectConversationQuery:
 # SendMessageUseCase 
 # ──────────────────────────────────────────────────────────────────────────
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def make_send_message_command() -> MakeSendMessageCommand:
     """
     Factory fixture for creating SendMessageCommand DTOs.
@@ -192,7 +176,7 @@ def make_send_message_command() -> MakeSendMessageCommand:
         generation_style: GenerationStyle = GenerationStyle.CONVERSATIONAL,    
     ) -> SendMessageCommand:
         return SendMessageCommand(
-            conversation_id=conversation_id or uuid4(),
+            conversation_id=conversation_id or fresh_uuid(),
             student_message=student_message,
             creativity_level=creativity_level,
             generation_style=generation_style
@@ -200,44 +184,59 @@ def make_send_message_command() -> MakeSendMessageCommand:
 
     return _factory
 
-# ──────────────────────────────────────────────────────────────────────────
-# DeleteConversationUseCase 
-# ──────────────────────────────────────────────────────────────────────────
+# Mock
 
-@pytest.fixture
-def make_delete_conversation_command() -> MakeDeleteConversationCommand:
+@pytest.fixture(scope="session")
+def fixed_time() -> datetime:
     """
-    Factory fixture for creating DeleteConversationCommand DTOs.
+    Fixture providing a fixed timestamp for deterministic tests.
     
-     Generates random UUIDs conversation IDs if not provided.
+    Returns FIXED_TIME (2024-01-01 12:00:00 UTC).
     """
-    def _factory(
-        conversation_id: UUID | None = None,
-        student_id: UUID | None = None,
-    ) -> DeleteConversationCommand:
-        return DeleteConversationCommand(
-            conversation_id=conversation_id or uuid4(),
-            student_id=student_id or uuid4(),
-        )
-
-    return _factory
+    return FIXED_TIME
 
-# Mock
+@pytest.fixture(scope="session")
+def _fake_repo_instance() -> InMemoryConversationRepository:
+    return InMemoryConversationRepository()
 
 @pytest.fixture
-def fixed_time() -> datetime:
+def fake_repo(_fake_repo_instance: InMemoryConversationRepository) -> Iterator[InMemoryConversationRepository]:
     """
-    Fixture providing a fixed timestamp for deterministic tests.
+    FAKE for ConversationRepository and ConversationReader.
     
-    Returns 2024-01-01 12:00:00 UTC to ensure consistent datetime values across tests.
+    A single repository is shared by the session and emptied after each test,
+    so every test still starts from an empty storage.
     """
-    return datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+    yield _fake_repo_instance
+    _fake_repo_instance.clear()
 
 @pytest.fixture
-def stub_time(fixed_time: datetime) -> StubTimeProvider:
+async def two_students(fake_repo: InMemoryConversationRepository) -> tuple[Conversation, UUID]:
+    """
+    Seed fake_repo with conversations belonging to two different students.
+    
+    The owner has one conversation ("Student1's Chat"), the other student two.
+    Shared by the owner isolation tests of every use case.
+    
+    Returns:
+        The owner's conversation and the other student's id
+    """
+    owner_id, other_id = fresh_uuid(), fresh_uuid()
+    owner_conversation = make_bare_conversation(owner_id, title="Student1's Chat")
+
+    await fake_repo.save_many([
+        owner_conversation,
+        make_bare_conversation(other_id, title="Student2's Chat 1"),
+        make_bare_conversation(other_id, title="Student2's Chat 2"),
+    ])
+
+    return owner_conversation, other_id
+
+@pytest.fixture(scope="session")
+def stub_time() -> StubTimeProvider:
     """
     STUB for TimeProvider.
     
-    Returns a fixed, predictable time value.
+    Returns a fixed, predictable time value. Stateless, hence shared by the session.
     """
-    return StubTimeProvider(now=fixed_time)
\ No newline at end of file
+    return StubTimeProvider(now=FIXED_TIME)
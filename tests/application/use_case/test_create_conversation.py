@@ -1,34 +1,32 @@
 
 from collections.abc import Callable
-from uuid import uuid4
+from uuid import UUID, uuid4
 import pytest
 
-from src.core.domain.value_objects import Language
 from src.core.exceptions import InvalidLanguagePairError
 
 from src.application.dtos.conversations import CreateConversationCommand
 from src.application.commands import CreateConversationUseCase
 
-from tests.doubles.stubs import StubTimeProvider
+from tests.doubles.stubs import SequentialIdProvider, StubTimeProvider
 from tests.doubles.fakes import InMemoryConversationRepository
+from tests.application.use_case.conftest import LANG_EN, LANG_FR
 
 class TestCreateConversation:
 
     async def test_should_create_conversation_successfully(
         self,
+        fake_repo: InMemoryConversationRepository,
         make_create_conversation_command: Callable[..., CreateConversationCommand],
         stub_time: StubTimeProvider,
     ) -> None:
-        fake_repo = InMemoryConversationRepository()
         student_id = uuid4()
 
-        initial_conversations = await fake_repo.get_student_conversations(student_id=student_id)
-
         command = make_create_conversation_command(
             student_id=student_id,
             title="Custom Title",
-            native_lang=Language("fr"),
-            target_lang=Language("en"),
+            native_lang=LANG_FR,
+            target_lang=LANG_EN,
         )
 
         use_case = CreateConversationUseCase(
@@ -41,7 +39,6 @@ class TestCreateConversation:
         conversation = await fake_repo.get_by_id(id=result.conversation_id)
         final_conversations = await fake_repo.get_student_conversations(student_id=student_id)
         
-        assert len(initial_conversations) == 0
         assert len(final_conversations) == 1
         assert final_conversations[0].conversation_id == result.conversation_id
 
@@ -49,19 +46,36 @@ class TestCreateConversation:
         assert conversation.native_lang == command.native_lang
         assert conversation.target_lang == command.target_lang
     
+    async def test_should_use_id_provider_for_conversation_id(
+        self,
+        fake_repo: InMemoryConversationRepository,
+        make_create_conversation_command: Callable[..., CreateConversationCommand],
+        stub_time: StubTimeProvider,
+    ) -> None:
+        use_case = CreateConversationUseCase(
+            repository=fake_repo,
+            time_provider=stub_time,
+            id_provider=SequentialIdProvider(start=42),
+        )
+
+        result = await use_case.execute(make_create_conversation_command())
+
+        assert result.conversation_id == UUID(int=42)
+        assert await fake_repo.find_by_id(UUID(int=42)) is not None
+
     async def test_same_native_and_target_raises_error(
         self,
+        fake_repo: InMemoryConversationRepository,
         make_create_conversation_command: Callable[..., CreateConversationCommand],
         stub_time: StubTimeProvider,
     ) -> None:
-        fake_repo = InMemoryConversationRepository()
         student_id = uuid4()
 
         command = make_create_conversation_command(
             student_id=student_id,
             title="Custom Title",
-            native_lang=Language("fr"),
-            target_lang=Language("fr"),
+            native_lang=LANG_FR,
+            target_lang=LANG_FR,
         )
 
         use_case = CreateConversationUseCase(
@@ -1,33 +1,30 @@
 
 from typing import Callable
-from uuid import uuid4
+from uuid import UUID, uuid4
 import pytest
 
 from src.core.domain import Conversation, Status
 from src.core.ports import TimeProvider
 from src.core.exceptions import ResourceNotFoundError
 
-from src.application.dtos import DeleteConversationCommand
 from src.application.commands import DeleteConversationUseCase
 
 from tests.doubles.fakes import InMemoryConversationRepository
+from tests.doubles.factories import make_delete_conversation_command
 
 class TestDeleteConversation:
     
     async def test_should_delete_conversation_successfully(
         self,
+        fake_repo: InMemoryConversationRepository,
         make_conversation: Callable[..., Conversation],
-        make_delete_conversation_command: Callable[..., DeleteConversationCommand],
         stub_time: TimeProvider,
     ) -> None:
-        fake_repo = InMemoryConversationRepository()
         student_id = uuid4()
 
         conversation = make_conversation(student_id=student_id)
         await fake_repo.save(conversation=conversation)
 
-        initial_conversations = await fake_repo.get_student_conversations(student_id=student_id)
-
         command = make_delete_conversation_command(
             conversation_id=conversation.id,
             student_id=student_id,
@@ -45,15 +42,13 @@ class TestDeleteConversation:
 
         assert conversation_removed.status == Status.DELETED
         assert conversation_removed.last_activity_at == stub_time.now()
-        assert len(initial_conversations) == 1
         assert len(final_conversations) == 0
 
     async def test_should_raise_error_when_conversation_not_found(
         self,
-        make_delete_conversation_command: Callable[..., DeleteConversationCommand],
+        fake_repo: InMemoryConversationRepository,
         stub_time: TimeProvider,
     ) -> None:
-        fake_repo = InMemoryConversationRepository()
         
         command = make_delete_conversation_command(
             conversation_id=uuid4(), 
@@ -67,18 +62,14 @@ class TestDeleteConversation:
 
     async def test_should_prevent_deletion_of_other_student_conversation(
         self,
-        make_conversation: Callable[..., Conversation],
-        make_delete_conversation_command: Callable[..., DeleteConversationCommand],
+        fake_repo: InMemoryConversationRepository,
+        two_students: tuple[Conversation, UUID],
         stub_time: TimeProvider,
     ) -> None:
-        fake_repo = InMemoryConversationRepository()
         
-        student1_id = uuid4()
-        student1_conv = make_conversation(student_id=student1_id)
-        await fake_repo.save(student1_conv)
+        student1_conv, student2_id = two_students
         
         # Student2 tries to delete it
-        student2_id = uuid4()
         command = make_delete_conversation_command(
             conversation_id=student1_conv.id,
             student_id=student2_id,
@@ -1,6 +1,7 @@
 
+import asyncio
 from typing import Callable
-from uuid import uuid4
+from uuid import UUID, uuid4
 
 from src.core.domain.entities import Conversation
 
@@ -16,30 +17,19 @@ class TestListStudentConversations:
 
     async def test_should_only_return_conversations_owned_by_student(
         self,
+        fake_repo: InMemoryConversationRepository,
         make_list_conversations_query: Callable[..., ListConversationsQuery],
-        make_conversation: Callable[..., Conversation]
+        two_students: tuple[Conversation, UUID],
     ) -> None:
         """
         Ensure that a student can only see their own conversations
         and not those belonging to other students.
         """
-        fake_reader = InMemoryConversationRepository()
-        
-        # Create data for two different students
-        student1_id = uuid4()
-        student2_id = uuid4()
-        
-        # Student 1 has 1 conversation
-        student1_conversation = make_conversation(student_id=student1_id, title="Student1's Chat")
-        await fake_reader.save(student1_conversation)
-        
-        # Student 2 has 2 conversations
-        await fake_reader.save(make_conversation(student_id=student2_id, title="Student2's Chat 1"))
-        await fake_reader.save(make_conversation(student_id=student2_id, title="Student2's Chat 2"))
+        student1_conversation, _ = two_students
 
         # Student 1 requests his conversations
-        query = make_list_conversations_query(student_id=student1_id)
-        use_case = ListStudentConversationsUseCase(reader=fake_reader)
+        query = make_list_conversations_query(student_id=student1_conversation.student_id)
+        use_case = ListStudentConversationsUseCase(reader=fake_repo)
         summaries = await use_case.execute(query)
 
         # Student 1 should only see his single conversation
@@ -49,6 +39,7 @@ class TestListStudentConversations:
 
     async def test_should_respect_pagination_limit_and_offset(
         self,
+        fake_repo: InMemoryConversationRepository,
         make_list_conversations_query: Callable[..., ListConversationsQuery],
         make_conversation: Callable[..., Conversation]
     ) -> None:
@@ -56,40 +47,28 @@ class TestListStudentConversations:
         Verify that the query respects the 'limit' and 'offset' parameters
         to return the correct subset of results.
         """
-        fake_reader = InMemoryConversationRepository()
         student_id = uuid4()
 
         # Create a sequence of 10 conversations
-        for i in range(10):
-            conv = make_conversation(student_id=student_id, title=f"Conversation {i}")
-            await fake_reader.save(conv)
-
-        use_case = ListStudentConversationsUseCase(reader=fake_reader)
-
-        # Fetch the first page (Limit 3, Offset 0)
-        # Expected: Conversations 0, 1, 2
-        query_page_1 = make_list_conversations_query(
-            student_id=student_id, 
-            limit=3, 
-            offset=0
+        await fake_repo.save_many(
+            make_conversation(student_id=student_id, title=f"Conversation {i}")
+            for i in range(10)
         )
-        page_1 = await use_case.execute(query_page_1)
-
-        # Fetch the second page (Limit 3, Offset 3)
-        # Expected: Conversations 3, 4, 5
-        query_page_2 = make_list_conversations_query(
-            student_id=student_id, 
-            limit=3, 
-            offset=3
+
+        use_case = ListStudentConversationsUseCase(reader=fake_repo)
+
+        # Expected: Conversations 0, 1, 2 / 3, 4, 5 / 9
+        query_page_1, query_page_2, query_last_page = (
+            make_list_conversations_query(student_id=student_id, limit=3, offset=offset)
+            for offset in (0, 3, 9)
         )
-        page_2 = await use_case.execute(query_page_2)
 
-        query_last_page = make_list_conversations_query(
-            student_id=student_id, 
-            limit=3, 
-            offset=9
+        # Pages are independent reads: fetch them concurrently
+        page_1, page_2, last_page = await asyncio.gather(
+            use_case.execute(query_page_1),
+            use_case.execute(query_page_2),
+            use_case.execute(query_last_page),
         )
-        last_page = await use_case.execute(query_last_page)
 
         assert len(page_1) == 3
         assert len(page_2) == 3
@@ -106,17 +85,17 @@ class TestListStudentConversations:
         assert page_2_ids.isdisjoint(last_page_ids)
 
     async def test_should_return_empty_list_for_new_student(
-        self, 
+        self,
+        fake_repo: InMemoryConversationRepository,
         make_list_conversations_query: Callable[..., ListConversationsQuery]
     ) -> None:
         """
         Verify that querying a student with no history returns an empty list.
         """
-        fake_reader = InMemoryConversationRepository()
         student_id = uuid4()
 
         query = make_list_conversations_query(student_id=student_id)
-        use_case = ListStudentConversationsUseCase(reader=fake_reader)
+        use_case = ListStudentConversationsUseCase(reader=fake_repo)
         summaries = await use_case.execute(query)
 
         assert summaries == []
\ No newline at end of file
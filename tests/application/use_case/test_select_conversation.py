@@ -10,29 +10,23 @@ import pytest
 from src.core.domain import Conversation, Role
 from src.core.exceptions import ResourceNotFoundError
 
-from src.application.dtos import SelectConversationQuery
 from src.application.queries import SelectConversationUseCase
 
 from tests.doubles.fakes import InMemoryConversationRepository
+from tests.doubles.factories import make_select_conversation_query
 
 class TestSelectConversation:
 
     async def test_should_return_selected_conversation(
         self,
+        fake_repo: InMemoryConversationRepository,
         make_conversation: Callable[..., Conversation],
-        make_select_conversation_query: Callable[..., SelectConversationQuery],
         stub_time: datetime
     ) -> None:
         selected_conv_id = uuid4()
         message_id = uuid4()
         student_id = uuid4()
-        fake_repo = InMemoryConversationRepository()
 
-        # Set up 4 conversations attached to a specific student 
-        for _ in range(3):
-            conversation = make_conversation(student_id=student_id)
-            await fake_repo.save(conversation=conversation)
-        
         # Add a message to the selected conversation
         selected_conv = make_conversation(
             id=selected_conv_id,
@@ -44,7 +38,11 @@ class TestSelectConversation:
             role=Role.TEACHER,
             content="Hello student!"
         )
-        await fake_repo.save(conversation=selected_conv)    
+        # Set up 4 conversations attached to a specific student 
+        await fake_repo.save_many([
+            *(make_conversation(student_id=student_id) for _ in range(3)),
+            selected_conv,
+        ])
 
         query = make_select_conversation_query(
             student_id=student_id,
@@ -63,9 +61,8 @@ class TestSelectConversation:
 
     async def test_should_raise_error_when_conversation_not_found(
         self,
-        make_select_conversation_query: Callable[..., SelectConversationQuery],
+        fake_repo: InMemoryConversationRepository,
     ) -> None:
-        fake_repo = InMemoryConversationRepository()
         student_id = uuid4()
         non_existent_id = uuid4()
 
@@ -81,12 +78,11 @@ class TestSelectConversation:
 
     async def test_should_raise_error_when_accessing_other_student_conversation(
         self,
+        fake_repo: InMemoryConversationRepository,
         make_conversation: Callable[..., Conversation],
-        make_select_conversation_query: Callable[..., SelectConversationQuery],
     ) -> None:
         student1_id = uuid4()
         student1_conv = make_conversation(student_id=student1_id)
-        fake_repo = InMemoryConversationRepository()
 
         await fake_repo.save(conversation=student1_conv)
 
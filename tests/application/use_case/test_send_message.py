@@ -4,11 +4,11 @@ Tests for SendMessageUseCase.
 Test Strategy:
 - FAKE (InMemoryConversationRepository): Verify state changes and persistence
 - STUB (StubTimeProvider): Control time for deterministic assertions
-- MOCK (AsyncMock for ChatProvider): Verify interactions with response service
+- STUB (StubChatProvider): Canned teacher responses and failures
+- SPY (SpyChatProvider): Verify interactions with response service
 """
 
-from collections.abc import Callable
-from unittest.mock import AsyncMock
+from collections.abc import AsyncIterator, Callable
 from uuid import uuid4
 
 import pytest
@@ -27,7 +27,8 @@ from src.application.dtos.conversations import SendMessageCommand
 from src.application.commands.conversations import SendMessageUseCase
 
 from tests.doubles.fakes import InMemoryConversationRepository
-from tests.doubles.stubs import StubTimeProvider
+from tests.doubles.spies import SpyChatProvider
+from tests.doubles.stubs import StubChatProvider, StubTimeProvider
 
 
 class TestSendMessageUseCase:
@@ -36,8 +37,9 @@ class TestSendMessageUseCase:
     """
 
     async def test_should_send_message_successfully(
-        self, 
-        mock_chat: AsyncMock, 
+        self,
+        fake_repo: InMemoryConversationRepository,
+        mock_chat: SpyChatProvider, 
         stub_time: StubTimeProvider,
         make_send_message_command: Callable[..., SendMessageCommand],
         make_conversation: Callable[..., Conversation],
@@ -53,7 +55,6 @@ class TestSendMessageUseCase:
         3. Interaction: ChatProvider is called with correct history and profile
         """
         # FAKE: In-memory repository to verify state changes
-        fake_repo = InMemoryConversationRepository()
 
         # Set up existing conversation with 2 messages
         conv_id = uuid4()
@@ -63,7 +64,7 @@ class TestSendMessageUseCase:
         await fake_repo.save(existing_conversation)
         initial_message_count = len(existing_conversation.messages)
 
-        # MOCK: Configure expected teacher response
+        # SPY: Configure expected teacher response
         student_message = "Comment dit-on 'chat' en anglais?"
         expected_teacher_response = "The word 'chat' translates to 'cat' in English."
         mock_chat.get_teacher_response.return_value = expected_teacher_response
@@ -105,7 +106,7 @@ class TestSendMessageUseCase:
         assert teacher_message.content == expected_teacher_response
         assert teacher_message.created_at == stub_time.now()
 
-        # 3. Interaction: verify MOCK was called correctly
+        # 3. Interaction: verify SPY was called correctly
         expected_history = tuple(saved_conversation.messages[:-1])  # Excludes teacher response
         expected_teacher_profile = TeacherProfile(
             creativity_level=CreativityLevel(command.creativity_level),
@@ -122,6 +123,78 @@ class TestSendMessageUseCase:
         )
 
 
+    async def test_should_stream_teacher_response_and_persist_it(
+        self,
+        fake_repo: InMemoryConversationRepository,
+        stub_time: StubTimeProvider,
+        make_send_message_command: Callable[..., SendMessageCommand],
+        make_conversation: Callable[..., Conversation],
+    ) -> None:
+        """
+        Given an active conversation, when a student message is streamed
+        Then chunks are relayed as they come and the full response is persisted at the end.
+        """
+        conv_id = uuid4()
+        await fake_repo.save(make_conversation(id=conv_id, messages=[]))
+
+        use_case = SendMessageUseCase(
+            chat_provider=StubChatProvider(chunks=("The word ", "is ", "'cat'.")),
+            repository=fake_repo,
+            time_provider=stub_time,
+        )
+
+        chunks = await use_case.stream(make_send_message_command(conversation_id=conv_id))
+
+        # Nothing is persisted until the teacher has fully answered
+        saved_conversation = await fake_repo.get_by_id(conv_id)
+        assert saved_conversation.messages == ()
+
+        assert [chunk async for chunk in chunks] == ["The word ", "is ", "'cat'."]
+
+        saved_conversation = await fake_repo.get_by_id(conv_id)
+        assert [m.role for m in saved_conversation.messages] == [Role.STUDENT, Role.TEACHER]
+        assert saved_conversation.messages[-1].content == "The word is 'cat'."
+
+    async def test_should_close_teacher_stream_when_abandoned(
+        self,
+        fake_repo: InMemoryConversationRepository,
+        stub_time: StubTimeProvider,
+        make_send_message_command: Callable[..., SendMessageCommand],
+        make_conversation: Callable[..., Conversation],
+    ) -> None:
+        """
+        Given a streamed response, when the client stops reading midway
+        Then the teacher stream is closed right away and nothing is persisted.
+        """
+        conv_id = uuid4()
+        await fake_repo.save(make_conversation(id=conv_id, messages=[]))
+        closed = False
+
+        async def teacher_chunks(*args: object, **kwargs: object) -> AsyncIterator[str]:
+            nonlocal closed
+            try:
+                yield "The word "
+                yield "is 'cat'."
+            finally:
+                closed = True
+
+        chat_provider = StubChatProvider()
+        chat_provider.stream_teacher_response = teacher_chunks  # type: ignore[method-assign]
+        use_case = SendMessageUseCase(
+            chat_provider=chat_provider,
+            repository=fake_repo,
+            time_provider=stub_time,
+        )
+
+        chunks = await use_case.stream(make_send_message_command(conversation_id=conv_id))
+        assert await anext(chunks) == "The word "
+        await chunks.aclose()  # type: ignore[attr-defined]
+
+        assert closed
+        saved_conversation = await fake_repo.get_by_id(conv_id)
+        assert saved_conversation.messages == ()
+
+
 class TestSendMessageErrors:
     """
     Tests for error handling in SendMessageUseCase.
@@ -132,7 +205,7 @@ class TestSendMessageErrors:
 
     async def test_should_propagate_chat_provider_exception(
         self,
-        mock_chat: AsyncMock,
+        fake_repo: InMemoryConversationRepository,
         stub_time: StubTimeProvider,
         make_send_message_command: Callable[..., SendMessageCommand],
         make_conversation: Callable[..., Conversation],
@@ -145,17 +218,15 @@ class TestSendMessageErrors:
         The use case should NOT silently swallow infrastructure errors.
         """
         # FAKE: In-memory repository to verify state changes
-        fake_repo = InMemoryConversationRepository()
         conv_id = uuid4()
         await fake_repo.save(make_conversation(id=conv_id, messages=[]))
 
-        # STUB behavior on Mock: force failure
+        # STUB: force failure
         error_message = "Service connection timeout"
-        mock_chat.get_teacher_response.side_effect = TeacherResponseError(cause=error_message)
 
         command = make_send_message_command(conversation_id=conv_id)
         use_case = SendMessageUseCase(
-            chat_provider=mock_chat,
+            chat_provider=StubChatProvider(error=TeacherResponseError(cause=error_message)),
             repository=fake_repo,
             time_provider=stub_time,
         )
@@ -166,9 +237,38 @@ class TestSendMessageErrors:
         
         assert error_message in str(exc_info.value)
 
+    async def test_should_not_persist_student_message_when_chat_provider_fails(
+        self,
+        fake_repo: InMemoryConversationRepository,
+        stub_time: StubTimeProvider,
+        make_send_message_command: Callable[..., SendMessageCommand],
+        make_conversation: Callable[..., Conversation],
+    ) -> None:
+        """
+        Given an active conversation
+        When the ChatProvider raises an exception
+        Then nothing is persisted (a retry won't duplicate the student's message).
+        """
+        conv_id = uuid4()
+        await fake_repo.save(make_conversation(id=conv_id, messages=[]))
+
+        command = make_send_message_command(conversation_id=conv_id)
+        use_case = SendMessageUseCase(
+            chat_provider=StubChatProvider(error=TeacherResponseError(cause="Service down")),
+            repository=fake_repo,
+            time_provider=stub_time,
+        )
+
+        with pytest.raises(TeacherResponseError):
+            await use_case.execute(command)
+
+        saved_conversation = await fake_repo.get_by_id(conv_id)
+        assert saved_conversation.messages == ()
+
     async def test_should_raise_when_conversation_not_found(
         self,
-        mock_chat: AsyncMock,
+        fake_repo: InMemoryConversationRepository,
+        stub_chat: StubChatProvider,
         stub_time: StubTimeProvider,
         make_send_message_command: Callable[..., SendMessageCommand],
     ) -> None:
@@ -177,12 +277,11 @@ class TestSendMessageErrors:
         Then ResourceNotFoundError is raised.
         """
         # Empty storage
-        fake_repo = InMemoryConversationRepository()  
         non_existent_id = uuid4()
 
         command = make_send_message_command(conversation_id=non_existent_id)
         use_case = SendMessageUseCase(
-            chat_provider=mock_chat,
+            chat_provider=stub_chat,
             repository=fake_repo,
             time_provider=stub_time,
         )
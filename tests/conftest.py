@@ -6,12 +6,11 @@ Fixtures shared across multiple test layers (domain, application and infrastruct
 
 from __future__ import annotations
 
-from typing import Protocol
-from uuid import UUID, uuid4
+from typing import TYPE_CHECKING, Final, Protocol
 from datetime import datetime, timezone
+from functools import cache
 
 import pytest
-from unittest.mock import AsyncMock
 
 from src.core.domain.entities import (
     ChatMessage, 
@@ -29,10 +28,26 @@ from src.core.domain.value_objects import (
     Lemma,
     PartOfSpeech,
 )
-from src.core.ports import ChatProvider
 
-def utc_now() -> datetime:
-    return datetime.now(timezone.utc)
+from tests.doubles.spies import SpyChatProvider
+from tests.doubles.stubs import StubChatProvider, fresh_uuid
+
+if TYPE_CHECKING:
+    # Only referenced in annotations
+    from collections.abc import Callable
+    from uuid import UUID
+
+# Default languages, built once (Language validates its code on every instantiation)
+LANG_FR: Final[Language] = Language("fr")
+LANG_EN: Final[Language] = Language("en")
+
+# Default timestamp of the factories (deterministic, no clock read per call)
+FROZEN_NOW: Final[datetime] = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+@cache
+def _lexeme(term: str, language: Language, pos: PartOfSpeech, definition: str) -> Lexeme:
+    """Lexemes are frozen, so one instance per distinct entry is shared by all make_vocab calls."""
+    return Lexeme(lemma=Lemma(term=term, pos=pos, language=language), definition=definition)
 
 # Protocols
 
@@ -74,7 +89,7 @@ class MakeVocab(Protocol):
         id: UUID | None = None,
         student_id: UUID | None = None,
         term: str = "test",
-        language: Language = Language("en"),
+        language: Language = LANG_EN,
         pos: PartOfSpeech = PartOfSpeech.NOUN,
         definition: str = "Test definition",
         source: VocabularySource = VocabularySource.STUDENT,
@@ -84,8 +99,9 @@ class MakeVocab(Protocol):
 
 
 # Fixtures
+# Factories are pure (no state kept between calls): built once per session
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def make_chat_message() -> MakeChatMessage:
     def _factory(
         id: UUID | None = None,
@@ -94,14 +110,14 @@ def make_chat_message() -> MakeChatMessage:
         now: datetime | None = None,
     ) -> ChatMessage:
         return ChatMessage(
-            _id=id or uuid4(),
-            _created_at=now or utc_now(),
+            _id=id or fresh_uuid(),
+            _created_at=now or FROZEN_NOW,
             _role=role,
             _content=content
         )
     return _factory
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def make_student() -> MakeStudent:
     def _factory(
         id: UUID | None = None,
@@ -111,16 +127,21 @@ def make_student() -> MakeStudent:
         now: datetime | None = None,
     ) -> Student:
         return Student(
-            _id=id or uuid4(),
-            _created_at=now or utc_now(),
-            _native_lang=native_lang or Language("fr"),
-            _target_lang=target_lang or Language("en"),
+            _id=id or fresh_uuid(),
+            _created_at=now or FROZEN_NOW,
+            _native_lang=native_lang or LANG_FR,
+            _target_lang=target_lang or LANG_EN,
             _level=level
         )
     return _factory
 
-@pytest.fixture
-def make_conversation(make_student: MakeStudent) -> MakeConversation:
+@pytest.fixture(scope="session")
+def shared_student(make_student: MakeStudent) -> Student:
+    """One Student built per session, for tests that only read its id or languages."""
+    return make_student()
+
+@pytest.fixture(scope="session")
+def make_conversation() -> MakeConversation:
     def _factory(
         id: UUID | None = None,
         student_id: UUID | None = None,
@@ -131,13 +152,13 @@ def make_conversation(make_student: MakeStudent) -> MakeConversation:
         title: str | None = None,
         now: datetime | None = None,
     ) -> Conversation:
-        ts = now or utc_now()
+        ts = now or FROZEN_NOW
         return Conversation(
-            _id=id or uuid4(),
+            _id=id or fresh_uuid(),
             _created_at=ts,
-            _student_id=student_id or make_student().id,
-            _native_lang=native_lang or Language("fr"),
-            _target_lang=target_lang or Language("en"),
+            _student_id=student_id or fresh_uuid(),
+            _native_lang=native_lang or LANG_FR,
+            _target_lang=target_lang or LANG_EN,
             _last_activity_at=ts,
             _status=status,
             _title=title or "Conversation",
@@ -145,43 +166,59 @@ def make_conversation(make_student: MakeStudent) -> MakeConversation:
         )
     return _factory
 
-@pytest.fixture
-def make_vocab(make_student: MakeStudent) -> MakeVocab:
+@pytest.fixture(scope="session")
+def make_vocab() -> MakeVocab:
     def _factory(
         id: UUID | None = None,
         student_id: UUID | None = None,
         term: str = "test",
-        language: Language = Language("en"),
+        language: Language = LANG_EN,
         pos: PartOfSpeech = PartOfSpeech.NOUN,
         definition: str = "Test definition",
         source: VocabularySource = VocabularySource.STUDENT,
         review_count: int = 1,
         now: datetime | None = None,
     ) -> VocabularyItem:
-        lemma = Lemma(term=term, pos=pos, language=language)
-        lexeme = Lexeme(lemma=lemma, definition=definition)
-        ts = now or utc_now()
+        ts = now or FROZEN_NOW
         
         return VocabularyItem(
-            _id=id or uuid4(),
+            _id=id or fresh_uuid(),
             _created_at=ts,
-            _student_id=student_id or make_student().id,
-            _lexeme=lexeme,
+            _student_id=student_id or fresh_uuid(),
+            _lexeme=_lexeme(term, language, pos, definition),
             _source=source,
             _last_reviewed_at=ts,
             _review_count=review_count
         )
     return _factory
 
+@pytest.fixture(scope="session")
+def frozen_now() -> datetime:
+    """Deterministic "current" time for tests that only need some timestamp."""
+    return FROZEN_NOW
+
+@pytest.fixture(scope="session")
+def new_uuid() -> Callable[[], UUID]:
+    """Id generator drawing from the shared deterministic sequence."""
+    return fresh_uuid
+
 @pytest.fixture
-def mock_chat() -> AsyncMock:
+def mock_chat() -> SpyChatProvider:
     """
-    MOCK for ChatProvider.
+    SPY for ChatProvider.
     
     Use this to verify interactions (was it called? with what arguments?).
-    Configure return_value or side_effect per test as needed.
+    Configure get_teacher_response.return_value or .side_effect per test as needed.
     """
-    mock = AsyncMock(spec=ChatProvider)
-    mock.get_teacher_response.return_value = "Hello Student!"
+    return SpyChatProvider()
 
-    return mock
\ No newline at end of file
+@pytest.fixture(scope="session")
+def stub_chat() -> StubChatProvider:
+    """
+    STUB for ChatProvider.
+    
+    Always answers "Hello Student!". Prefer it over mock_chat when the test
+    does not assert on the calls; build a StubChatProvider directly for other
+    answers or failures.
+    """
+    return StubChatProvider()
@@ -3,10 +3,16 @@ Tests for the base Entity class.
 """
 
 from datetime import datetime, timezone
-from uuid import uuid4
+from uuid import UUID
+
+import pytest
 
 from src.core.domain.entities.base import Entity
 
+_NOW = datetime(2024, 1, 1, tzinfo=timezone.utc)
+_SHARED_ID = UUID(int=1)
+_OTHER_ID = UUID(int=2)
+
 
 class ConcreteEntity(Entity):
     """Concrete implementation of Entity for testing purposes."""
@@ -21,34 +27,23 @@ class AnotherEntity(Entity):
 class TestEntityIdentity:
     """Tests for Entity identity semantics."""
 
-    def test_entities_with_same_id_are_equal(self) -> None:
-        """Two entities of the same type with the same ID should be equal."""
-        shared_id = uuid4()
-        now = datetime.now(timezone.utc)
-        
-        entity1 = ConcreteEntity(_id=shared_id, _created_at=now)
-        entity2 = ConcreteEntity(_id=shared_id, _created_at=now)
-        
-        assert entity1 == entity2
-
-    def test_entities_with_different_ids_are_not_equal(self) -> None:
-        """Two entities with different IDs should not be equal."""
-        now = datetime.now(timezone.utc)
-        
-        entity1 = ConcreteEntity(_id=uuid4(), _created_at=now)
-        entity2 = ConcreteEntity(_id=uuid4(), _created_at=now)
-        
-        assert entity1 != entity2
-
-    def test_entities_of_different_types_are_not_equal(self) -> None:
-        """Two entities of different types are never equal, even with same ID."""
-        shared_id = uuid4()
-        now = datetime.now(timezone.utc)
-        
-        entity1 = ConcreteEntity(_id=shared_id, _created_at=now)
-        entity2 = AnotherEntity(_id=shared_id, _created_at=now)
-        
-        assert entity1 != entity2
+    @pytest.mark.parametrize(
+        ("other_type", "other_id", "expected_equal"),
+        [
+            (ConcreteEntity, _SHARED_ID, True),
+            (ConcreteEntity, _OTHER_ID, False),
+            (AnotherEntity, _SHARED_ID, False),
+        ],
+        ids=["same_id_same_type", "different_id_same_type", "same_id_different_type"],
+    )
+    def test_equality_matrix(
+        self, other_type: type[Entity], other_id: UUID, expected_equal: bool
+    ) -> None:
+        """Entities are equal only when both their type and their ID match."""
+        entity = ConcreteEntity(_id=_SHARED_ID, _created_at=_NOW)
+        other = other_type(_id=other_id, _created_at=_NOW)
+        
+        assert (entity == other) is expected_equal
 
 class TestEntityHashing:
     """Tests for Entity hashing behavior."""
@@ -56,8 +51,8 @@ class TestEntityHashing:
     def test_entity_is_hashable(self) -> None:
         """Entities should be hashable for use in sets and dicts."""
         entity = ConcreteEntity(
-            _id=uuid4(), 
-            _created_at=datetime.now(timezone.utc)
+            _id=_SHARED_ID, 
+            _created_at=_NOW
         )
         
         # Should not raise
@@ -65,22 +60,16 @@ class TestEntityHashing:
 
     def test_entities_with_same_id_have_same_hash(self) -> None:
         """Equal entities should have the same hash."""
-        shared_id = uuid4()
-        now = datetime.now(timezone.utc)
-        
-        entity1 = ConcreteEntity(_id=shared_id, _created_at=now)
-        entity2 = ConcreteEntity(_id=shared_id, _created_at=now)
+        entity1 = ConcreteEntity(_id=_SHARED_ID, _created_at=_NOW)
+        entity2 = ConcreteEntity(_id=_SHARED_ID, _created_at=_NOW)
         
         assert hash(entity1) == hash(entity2)
 
     def test_entity_can_be_used_in_set(self) -> None:
         """Entities should work correctly in sets."""
-        shared_id = uuid4()
-        now = datetime.now(timezone.utc)
-        
-        entity1 = ConcreteEntity(_id=shared_id, _created_at=now)
-        entity2 = ConcreteEntity(_id=shared_id, _created_at=now)
-        entity3 = ConcreteEntity(_id=uuid4(), _created_at=now)
+        entity1 = ConcreteEntity(_id=_SHARED_ID, _created_at=_NOW)
+        entity2 = ConcreteEntity(_id=_SHARED_ID, _created_at=_NOW)
+        entity3 = ConcreteEntity(_id=_OTHER_ID, _created_at=_NOW)
         
         entity_set = {entity1, entity2, entity3}
         
@@ -90,8 +79,8 @@ class TestEntityHashing:
     def test_entity_can_be_used_as_dict_key(self) -> None:
         """Entities should work correctly as dictionary keys."""
         entity = ConcreteEntity(
-            _id=uuid4(), 
-            _created_at=datetime.now(timezone.utc)
+            _id=_SHARED_ID, 
+            _created_at=_NOW
         )
         
         data = {entity: "value"}
@@ -100,11 +89,8 @@ class TestEntityHashing:
 
     def test_equal_entities_access_same_dict_value(self) -> None:
         """Equal entities should access the same dictionary value."""
-        shared_id = uuid4()
-        now = datetime.now(timezone.utc)
-        
-        entity1 = ConcreteEntity(_id=shared_id, _created_at=now)
-        entity2 = ConcreteEntity(_id=shared_id, _created_at=now)
+        entity1 = ConcreteEntity(_id=_SHARED_ID, _created_at=_NOW)
+        entity2 = ConcreteEntity(_id=_SHARED_ID, _created_at=_NOW)
         
         data = {entity1: "value"}
         
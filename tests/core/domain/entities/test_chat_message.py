@@ -9,6 +9,7 @@ from __future__ import annotations
 
 import pytest
 
+from src.core.domain.entities import ChatMessage
 from src.core.domain.value_objects import Role
 from src.core.exceptions import InvalidChatMessageContentError
 from tests.conftest import MakeChatMessage
@@ -40,48 +41,48 @@ class TestChatMessageCreation:
             make_chat_message(role=role, content="")
 
 
-class TestChatMessageClassification:
-    """Tests for role-based classification."""
+@pytest.fixture(scope="module")
+def messages_by_role(make_chat_message: MakeChatMessage) -> dict[Role, ChatMessage]:
+    """One message per role, shared by the module: only read by classification tests."""
+    return {role: make_chat_message(role=role, content=role.value) for role in Role}
 
-    def test_student_message_classification(
-        self, make_chat_message: MakeChatMessage
-    ) -> None:
-        """Student messages report is_from_student=True."""
-        message = make_chat_message(role=Role.STUDENT, content="Question")
 
-        assert message.is_from_student is True
-        assert message.is_from_teacher is False
+class TestChatMessageClassification:
+    """Tests for role-based classification."""
 
-    def test_teacher_message_classification(
-        self, make_chat_message: MakeChatMessage
+    @pytest.mark.parametrize(
+        ("role", "is_from_student", "is_from_teacher"),
+        [(Role.STUDENT, True, False), (Role.TEACHER, False, True)],
+        ids=["student", "teacher"],
+    )
+    def test_classification(
+        self,
+        messages_by_role: dict[Role, ChatMessage],
+        role: Role,
+        is_from_student: bool,
+        is_from_teacher: bool,
     ) -> None:
-        """Teacher messages report is_from_teacher=True."""
-        message = make_chat_message(role=Role.TEACHER, content="Answer")
+        """Each message reports exactly the role it was sent with."""
+        message = messages_by_role[role]
 
-        assert message.is_from_teacher is True
-        assert message.is_from_student is False
+        assert (message.is_from_student, message.is_from_teacher) == (is_from_student, is_from_teacher)
 
 
 class TestChatMessageEditing:
     """Tests for message content editing."""
 
-    @pytest.mark.parametrize("role", [Role.STUDENT, Role.TEACHER], ids=["student", "teacher"])
-    def test_messages_can_be_edited(
-        self, make_chat_message: MakeChatMessage, role: Role
-    ) -> None:
+    @pytest.fixture(params=[Role.STUDENT, Role.TEACHER], ids=["student", "teacher"])
+    def message(self, request: pytest.FixtureRequest, make_chat_message: MakeChatMessage) -> ChatMessage:
+        """A message of each role, built fresh for every test as editing mutates it."""
+        return make_chat_message(role=request.param, content="Original content")
+
+    def test_messages_can_be_edited(self, message: ChatMessage) -> None:
         """Student and teacher messages can have their content edited."""
-        message = make_chat_message(role=role, content="Original content")
-        
         message.edit_content("Updated content")
         
         assert message.content == "Updated content"
 
-    @pytest.mark.parametrize("role", [Role.STUDENT, Role.TEACHER], ids=["student", "teacher"])
-    def test_edit_with_empty_content_raises(
-        self, make_chat_message: MakeChatMessage, role: Role
-    ) -> None:
-        """Editing a student message with empty content raises an error."""
-        message = make_chat_message(role=role, content="Original content")
-        
+    def test_edit_with_empty_content_raises(self, message: ChatMessage) -> None:
+        """Editing a message with empty content raises an error."""
         with pytest.raises(InvalidChatMessageContentError):
-            message.edit_content(" ")
\ No newline at end of file
+            message.edit_content(" ")
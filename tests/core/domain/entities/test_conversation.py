@@ -7,8 +7,9 @@ Conversations can be ACTIVE, ARCHIVED, or DELETED.
 
 from __future__ import annotations
 
-from datetime import datetime, timezone, timedelta
-from uuid import uuid4
+from collections.abc import Callable
+from datetime import datetime, timedelta
+from uuid import UUID
 
 import pytest
 
@@ -23,6 +24,12 @@ from src.core.exceptions import (
 
 from tests.conftest import MakeConversation
 
+# Title test data (max_len is 100 characters)
+_DEFAULT_TITLE = "Conversation"
+_EMPTY_TITLE = ""
+_SPACES_TITLE = "   "
+_LONG_TITLE = "A" * 101
+
 
 class TestConversationCreation:
     """Tests for Conversation instantiation."""
@@ -46,10 +53,10 @@ class TestConversationCreation:
         assert conversation.status.is_active is True
 
     def test_conversation_has_student_id(
-        self, make_conversation: MakeConversation
+        self, make_conversation: MakeConversation, new_uuid: Callable[[], UUID]
     ) -> None:
         """Conversations are associated with a user."""
-        student_id = uuid4()
+        student_id = new_uuid()
         conversation = make_conversation(student_id=student_id)
 
         assert conversation.student_id == student_id
@@ -60,7 +67,7 @@ class TestConversationCreation:
         """New conversations have a default title.""" 
         conversation = make_conversation()
 
-        assert conversation.title == "Conversation"
+        assert conversation.title == _DEFAULT_TITLE
 
     def test_conversation_can_have_custom_title(
         self, make_conversation: MakeConversation
@@ -70,13 +77,15 @@ class TestConversationCreation:
 
         assert conversation.title == "Custom Title"
 
-    def test_create_conversation_with_same_native_and_target_raises_error(self, make_conversation: MakeConversation) -> None:
+    def test_create_conversation_with_same_native_and_target_raises_error(
+        self, make_conversation: MakeConversation, frozen_now: datetime, new_uuid: Callable[[], UUID]
+    ) -> None:
         """Creating a conversation with identical native and target languages raises InvalidLanguagePairError."""
-        id = uuid4()
-        student_id = uuid4()
+        id = new_uuid()
+        student_id = new_uuid()
         native_lang = Language("fr")
         target_lang = Language("fr")
-        now = datetime.now(timezone.utc)
+        now = frozen_now
 
         with pytest.raises(InvalidLanguagePairError):
             Conversation.create_new(
@@ -87,51 +96,34 @@ class TestConversationCreation:
                 now=now,
             )
 
-    def test_create_conversation_with_empty_title_raises_error(self) -> None:
-        """Creating a conversation with empty title raises EmptyConversationTitleError."""
-        id = uuid4()
-        student_id = uuid4()
-        native_lang = Language("fr")
-        target_lang = Language("en")
-        now = datetime.now(timezone.utc)
-        title = ""
-
-        with pytest.raises(EmptyConversationTitleError):
+    @pytest.mark.parametrize(
+        ("title", "expected_error"),
+        [(_EMPTY_TITLE, EmptyConversationTitleError), (_LONG_TITLE, ConversationTitleTooLongError)],
+        ids=["empty", "too_long"],
+    )
+    def test_create_conversation_with_invalid_title_raises_error(
+        self,
+        frozen_now: datetime,
+        new_uuid: Callable[[], UUID],
+        title: str,
+        expected_error: type[Exception],
+    ) -> None:
+        """Titles must be non-empty and at most 100 characters long."""
+        with pytest.raises(expected_error):
             Conversation.create_new(
-                id=id,
-                student_id=student_id,
-                native_lang=native_lang,
-                target_lang=target_lang,
-                now=now,
+                id=new_uuid(),
+                student_id=new_uuid(),
+                native_lang=Language("fr"),
+                target_lang=Language("en"),
+                now=frozen_now,
                 title=title
             )
 
-    def test_create_conversation_with_too_long_title_raises_error(
-            self
-        ) -> None:
-        """Creating a conversation with title longer than 100 chars raises ConversationTitleTooLongError."""
-        id = uuid4()
-        student_id = uuid4()
-        native_lang = Language("fr")
-        target_lang = Language("en")
-        now = datetime.now(timezone.utc)
-        long_title = "A" * 101
-
-        with pytest.raises(ConversationTitleTooLongError):
-            Conversation.create_new(
-                id=id,
-                student_id=student_id,
-                native_lang=native_lang,
-                target_lang=target_lang,
-                now=now,
-                title=long_title
-            )
-        
     def test_conversation_timestamps_are_set(
-        self, make_conversation: MakeConversation
+        self, make_conversation: MakeConversation, frozen_now: datetime
     ) -> None:
         """Conversation creation sets timestamps."""
-        now = datetime.now(timezone.utc)
+        now = frozen_now
         conversation = make_conversation(now=now)
 
         assert conversation.created_at == now
@@ -142,14 +134,14 @@ class TestConversationMessages:
     """Tests for adding messages to a conversation."""
 
     def test_add_message_increases_count(
-        self, make_conversation: MakeConversation
+        self, make_conversation: MakeConversation, frozen_now: datetime, new_uuid: Callable[[], UUID]
     ) -> None:
         """Adding a message increases the message count."""
         conversation = make_conversation()
-        now = datetime.now(timezone.utc)
+        now = frozen_now
 
         conversation.add_message(
-            new_message_id=uuid4(),
+            new_message_id=new_uuid(),
             now=now,
             role=Role.STUDENT,
             content="Hello"
@@ -158,14 +150,14 @@ class TestConversationMessages:
         assert conversation.message_count == 1
 
     def test_add_message_returns_chat_message(
-        self, make_conversation: MakeConversation
+        self, make_conversation: MakeConversation, frozen_now: datetime, new_uuid: Callable[[], UUID]
     ) -> None:
         """add_message returns a ChatMessage instance."""
         conversation = make_conversation()
-        now = datetime.now(timezone.utc)
+        now = frozen_now
 
         message = conversation.add_message(
-            new_message_id=uuid4(),
+            new_message_id=new_uuid(),
             now=now,
             role=Role.STUDENT,
             content="Hello"
@@ -176,15 +168,15 @@ class TestConversationMessages:
         assert message.role == Role.STUDENT
         
     def test_add_message_updates_last_activity(
-        self, make_conversation: MakeConversation
+        self, make_conversation: MakeConversation, frozen_now: datetime, new_uuid: Callable[[], UUID]
     ) -> None:
         """Adding a message updates the last_activity_at timestamp."""
-        initial_time = datetime.now(timezone.utc)
+        initial_time = frozen_now
         conversation = make_conversation(now=initial_time)
         
         later_time = initial_time + timedelta(minutes=5)
         conversation.add_message(
-            new_message_id=uuid4(),
+            new_message_id=new_uuid(),
             now=later_time,
             role=Role.STUDENT,
             content="Hello"
@@ -192,165 +184,105 @@ class TestConversationMessages:
 
         assert conversation.last_activity_at == later_time
 
-    def test_add_multiple_messages(
-        self, make_conversation: MakeConversation
+    def test_messages_preserve_order_count_and_immutability(
+        self, make_conversation: MakeConversation, frozen_now: datetime, new_uuid: Callable[[], UUID]
     ) -> None:
-        """Multiple messages can be added to a conversation."""
+        """Several messages can be added; they are exposed in order as an immutable tuple."""
         conversation = make_conversation()
-        now = datetime.now(timezone.utc)
+        now = frozen_now
 
-        conversation.add_message(
-            new_message_id=uuid4(),
+        msg1 = conversation.add_message(
+            new_message_id=new_uuid(),
             now=now,
             role=Role.STUDENT,
             content="Hello"
         )
-        conversation.add_message(
-            new_message_id=uuid4(),
+        msg2 = conversation.add_message(
+            new_message_id=new_uuid(),
             now=now + timedelta(seconds=1),
             role=Role.TEACHER,
             content="Hi there!"
         )
-        conversation.add_message(
-            new_message_id=uuid4(),
+        msg3 = conversation.add_message(
+            new_message_id=new_uuid(),
             now=now + timedelta(seconds=2),
             role=Role.STUDENT,
             content="How are you?"
         )
 
         assert conversation.message_count == 3
+        assert isinstance(conversation.messages, tuple)
+        assert conversation.messages == (msg1, msg2, msg3)
 
-    def test_messages_property_returns_tuple(
-        self, make_conversation: MakeConversation
+    def test_messages_view_is_reused_until_a_message_is_added(
+        self, make_conversation: MakeConversation, frozen_now: datetime, new_uuid: Callable[[], UUID]
     ) -> None:
-        """messages property returns an immutable tuple."""
+        """The messages tuple is cached and refreshed when the history grows."""
         conversation = make_conversation()
-        now = datetime.now(timezone.utc)
+        now = frozen_now
+
+        first_view = conversation.messages
+        assert conversation.messages is first_view
 
         conversation.add_message(
-            new_message_id=uuid4(),
+            new_message_id=new_uuid(),
             now=now,
             role=Role.STUDENT,
             content="Hello"
         )
 
-        messages = conversation.messages
-        
-        assert isinstance(messages, tuple)
-        assert len(messages) == 1
-
-    def test_messages_preserve_order(
-        self, make_conversation: MakeConversation
-    ) -> None:
-        """Messages are returned in the order they were added."""
-        conversation = make_conversation()
-        now = datetime.now(timezone.utc)
-
-        msg1 = conversation.add_message(
-            new_message_id=uuid4(),
-            now=now,
-            role=Role.STUDENT,
-            content="First"
-        )
-        msg2 = conversation.add_message(
-            new_message_id=uuid4(),
-            now=now + timedelta(seconds=1),
-            role=Role.TEACHER,
-            content="Second"
-        )
-
-        assert conversation.messages[0] == msg1
-        assert conversation.messages[1] == msg2
+        assert conversation.messages is not first_view
+        assert len(conversation.messages) == 1
 
 
 class TestConversationLifecycle:
     """Tests for conversation state transitions."""
 
-    def test_archive_changes_status(
-        self, make_conversation: MakeConversation
+    @pytest.fixture
+    def conversation(self, make_conversation: MakeConversation, frozen_now: datetime) -> Conversation:
+        """Active conversation created at frozen_now, fresh per test as transitions mutate it."""
+        return make_conversation(now=frozen_now)
+
+    @pytest.mark.parametrize(
+        ("action", "expected_status"),
+        [("archive", Status.ARCHIVED), ("delete", Status.DELETED)],
+    )
+    def test_transition_updates_status_and_last_activity(
+        self, conversation: Conversation, action: str, expected_status: Status, frozen_now: datetime
     ) -> None:
-        """Archiving changes status to ARCHIVED."""
-        conversation = make_conversation()
-        now = datetime.now(timezone.utc)
-
-        conversation.archive(now)
-
-        assert conversation.status == Status.ARCHIVED
-        assert conversation.status.is_archived is True
-
-    def test_archive_updates_last_activity(
-        self, make_conversation: MakeConversation
-    ) -> None:
-        """Archiving updates last_activity_at timestamp."""
-        initial_time = datetime.now(timezone.utc)
-        conversation = make_conversation(now=initial_time)
-        
-        archive_time = initial_time + timedelta(hours=1)
-        conversation.archive(archive_time)
-
-        assert conversation.last_activity_at == archive_time
-
-    def test_cannot_add_message_when_archived(
-        self, make_conversation: MakeConversation
-    ) -> None:
-        """Archived conversations are read-only."""
-        conversation = make_conversation()
-        now = datetime.now(timezone.utc)
-        conversation.archive(now)
-
-        with pytest.raises(ConversationNotWritableError):
-            conversation.add_message(
-                new_message_id=uuid4(),
-                now=now + timedelta(seconds=1),
-                role=Role.STUDENT,
-                content="Too late"
-            )
-
-    def test_delete_changes_status(
-        self, make_conversation: MakeConversation
-    ) -> None:
-        """Deleting changes status to DELETED."""
-        conversation = make_conversation()
-        now = datetime.now(timezone.utc)
-
-        conversation.delete(now)
-
-        assert conversation.status == Status.DELETED
-
-    def test_delete_updates_last_activity(
-        self, make_conversation: MakeConversation
-    ) -> None:
-        """Deleting updates last_activity_at timestamp."""
-        initial_time = datetime.now(timezone.utc)
-        conversation = make_conversation(now=initial_time)
-        
-        delete_time = initial_time + timedelta(hours=1)
-        conversation.delete(delete_time)
+        """Archiving and deleting change the status and update last_activity_at."""
+        transition_time = frozen_now + timedelta(hours=1)
+        getattr(conversation, action)(transition_time)
 
-        assert conversation.last_activity_at == delete_time
+        assert conversation.status == expected_status
+        assert conversation.last_activity_at == transition_time
 
-    def test_cannot_add_message_when_deleted(
-        self, make_conversation: MakeConversation
+    @pytest.mark.parametrize("action", ["archive", "delete"])
+    @pytest.mark.parametrize("write", ["add_message", "modify_title"])
+    def test_cannot_write_after_transition(
+        self, conversation: Conversation, action: str, write: str, frozen_now: datetime, new_uuid: Callable[[], UUID]
     ) -> None:
-        """Deleted conversations cannot accept messages."""
-        conversation = make_conversation()
-        now = datetime.now(timezone.utc)
-        conversation.delete(now)
+        """Archived and deleted conversations are read-only (no messages, no title change)."""
+        now = frozen_now
+        getattr(conversation, action)(now)
 
+        later = now + timedelta(seconds=1)
         with pytest.raises(ConversationNotWritableError):
-            conversation.add_message(
-                new_message_id=uuid4(),
-                now=now + timedelta(seconds=1),
-                role=Role.STUDENT,
-                content="Message to deleted conversation"
-            )
+            if write == "add_message":
+                conversation.add_message(
+                    new_message_id=new_uuid(),
+                    now=later,
+                    role=Role.STUDENT,
+                    content="Too late"
+                )
+            else:
+                conversation.modify_title("New Title", later)
 
     def test_modify_title_successfully(
-        self, make_conversation: MakeConversation
+        self, conversation: Conversation, frozen_now: datetime
     ) -> None:
         """Modifying title updates the title and last activity.""" 
-        conversation = make_conversation(title="Old Title")
-        now = datetime.now(timezone.utc)
+        now = frozen_now
         new_time = now + timedelta(hours=1)
 
         conversation.modify_title("New Title", new_time)
@@ -359,71 +291,45 @@ class TestConversationLifecycle:
         assert conversation.last_activity_at == new_time
 
     def test_modify_title_strips_whitespace(
-        self, make_conversation: MakeConversation
+        self, conversation: Conversation, frozen_now: datetime
     ) -> None:
         """Title modification strips leading/trailing whitespace."""
-        conversation = make_conversation()
-        now = datetime.now(timezone.utc)
+        now = frozen_now
 
         conversation.modify_title("  Spaced Title  ", now)
 
         assert conversation.title == "Spaced Title"
 
     def test_modify_title_empty_raises_error(
-        self, make_conversation: MakeConversation
+        self, conversation: Conversation, frozen_now: datetime
     ) -> None:
         """Cannot edit title with an empty content."""
-        conversation = make_conversation()
-        now = datetime.now(timezone.utc)
+        now = frozen_now
 
         with pytest.raises(EmptyConversationTitleError):
-            conversation.modify_title("", now)
+            conversation.modify_title(_EMPTY_TITLE, now)
 
         with pytest.raises(EmptyConversationTitleError):
-            conversation.modify_title("   ", now)
+            conversation.modify_title(_SPACES_TITLE, now)
 
     def test_modify_title_too_long_raises_error(
-        self, make_conversation: MakeConversation
+        self, conversation: Conversation, frozen_now: datetime
     ) -> None:
         """Title cannot be longer than 100 characters (max_len)."""
-        conversation = make_conversation()
-        now = datetime.now(timezone.utc)
-        long_title = "A" * 101  # 101 characters
+        now = frozen_now
 
         with pytest.raises(ConversationTitleTooLongError):
-            conversation.modify_title(long_title, now)
-
-    def test_modify_title_when_archived_raises_error(
-        self, make_conversation: MakeConversation
-    ) -> None:
-        """Cannot modify title of archived conversation."""
-        conversation = make_conversation()
-        now = datetime.now(timezone.utc)
-        conversation.archive(now)
-
-        with pytest.raises(ConversationNotWritableError):
-            conversation.modify_title("New Title", now + timedelta(seconds=1))
-
-    def test_modify_title_when_deleted_raises_error(
-        self, make_conversation: MakeConversation
-    ) -> None:
-        """Cannot modify title of deleted conversation."""
-        conversation = make_conversation()
-        now = datetime.now(timezone.utc)
-        conversation.delete(now)
-
-        with pytest.raises(ConversationNotWritableError):
-            conversation.modify_title("New Title", now + timedelta(seconds=1))
+            conversation.modify_title(_LONG_TITLE, now)
 
 
 class TestConversationTouch:
     """Tests for the touch method."""
 
     def test_touch_updates_last_activity(
-        self, make_conversation: MakeConversation
+        self, make_conversation: MakeConversation, frozen_now: datetime
     ) -> None:
         """touch() updates last_activity_at timestamp."""
-        initial_time = datetime.now(timezone.utc)
+        initial_time = frozen_now
         conversation = make_conversation(now=initial_time)
         
         new_time = initial_time + timedelta(minutes=30)
@@ -14,6 +14,8 @@ from src.core.exceptions import InvalidLanguagePairError, InvalidLevelChangeErro
 
 from tests.conftest import MakeStudent
 
+FR, EN, ES, DE, ZZ, XY = (Language(code) for code in ("fr", "en", "es", "de", "zz", "xy"))
+
 
 class TestStudentCreation:
     """Tests for student instantiation."""
@@ -33,8 +35,8 @@ class TestStudentCreation:
     ) -> None:
         """Students can be created with custom languages."""
         student = make_student(
-            native_lang=Language("zz"),
-            target_lang=Language("xy"),
+            native_lang=ZZ,
+            target_lang=XY,
             level=CEFRLevel.A2
         )
 
@@ -48,8 +50,8 @@ class TestStudentCreation:
         """Students cannot have same native and target language."""
         with pytest.raises(InvalidLanguagePairError):
             make_student(
-                native_lang=Language("fr"),
-                target_lang=Language("fr")
+                native_lang=FR,
+                target_lang=FR
             )
 
 
@@ -61,11 +63,11 @@ class TeststudentCorrectNativeLanguage:
     ) -> None:
         """Native language can be corrected to a different language."""
         student = make_student(
-            native_lang=Language("fr"),
-            target_lang=Language("en")
+            native_lang=FR,
+            target_lang=EN
         )
 
-        student.correct_native_language(Language("es"))
+        student.correct_native_language(ES)
 
         assert student.native_lang.code == "es"
 
@@ -74,12 +76,12 @@ class TeststudentCorrectNativeLanguage:
     ) -> None:
         """Cannot correct native language to be same as target."""
         student = make_student(
-            native_lang=Language("fr"),
-            target_lang=Language("en")
+            native_lang=FR,
+            target_lang=EN
         )
 
         with pytest.raises(InvalidLanguagePairError):
-            student.correct_native_language(Language("en"))
+            student.correct_native_language(EN)
 
 
 class TeststudentSwitchLearningGoal:
@@ -90,11 +92,11 @@ class TeststudentSwitchLearningGoal:
     ) -> None:
         """Target language can be switched to a different language."""
         student = make_student(
-            native_lang=Language("fr"),
-            target_lang=Language("en")
+            native_lang=FR,
+            target_lang=EN
         )
 
-        student.switch_learning_goal(Language("de"))
+        student.switch_learning_goal(DE)
 
         assert student.target_lang.code == "de"
 
@@ -103,12 +105,12 @@ class TeststudentSwitchLearningGoal:
     ) -> None:
         """Cannot switch target language to be same as native."""
         student = make_student(
-            native_lang=Language("fr"),
-            target_lang=Language("en")
+            native_lang=FR,
+            target_lang=EN
         )
 
         with pytest.raises(InvalidLanguagePairError):
-            student.switch_learning_goal(Language("fr"))
+            student.switch_learning_goal(FR)
 
 
 class TeststudentAssessLevel:
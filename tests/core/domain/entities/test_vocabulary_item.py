@@ -7,8 +7,9 @@ It tracks review progress and last review timestamp.
 
 from __future__ import annotations
 
-from datetime import datetime, timezone, timedelta
-from uuid import uuid4
+from collections.abc import Callable
+from datetime import datetime, timedelta
+from uuid import UUID
 
 from src.core.domain.value_objects import (
     Language,
@@ -47,10 +48,10 @@ class TestVocabularyItemCreation:
         assert vocab.lexeme.definition == "to eat"
 
     def test_vocabulary_item_has_student_id(
-        self, make_vocab: MakeVocab
+        self, make_vocab: MakeVocab, new_uuid: Callable[[], UUID]
     ) -> None:
         """Vocabulary items are linked to a student."""
-        student_id = uuid4()
+        student_id = new_uuid()
         vocab = make_vocab(student_id=student_id)
 
         assert vocab.student_id == student_id
@@ -68,34 +69,33 @@ class TestVocabularyItemReview:
     """Tests for the mark_as_reviewed method."""
 
     def test_mark_as_reviewed_increases_count(
-        self, make_vocab: MakeVocab
+        self, make_vocab: MakeVocab, frozen_now: datetime
     ) -> None:
         """Reviewing increases the review count."""
         vocab = make_vocab()
         initial_count = vocab.review_count
 
-        vocab.mark_as_reviewed(datetime.now(timezone.utc))
+        vocab.mark_as_reviewed(frozen_now)
 
         assert vocab.review_count == initial_count + 1
 
     def test_mark_as_reviewed_updates_timestamp(
-        self, make_vocab: MakeVocab
+        self, make_vocab: MakeVocab, frozen_now: datetime
     ) -> None:
         """Reviewing updates the last reviewed timestamp."""
-        initial_time = datetime.now(timezone.utc)
-        vocab = make_vocab(now=initial_time)
+        vocab = make_vocab(now=frozen_now)
 
-        later_time = initial_time + timedelta(hours=1)
+        later_time = frozen_now + timedelta(hours=1)
         vocab.mark_as_reviewed(later_time)
 
         assert vocab.last_reviewed_at == later_time
 
     def test_multiple_reviews_increment_count(
-        self, make_vocab: MakeVocab
+        self, make_vocab: MakeVocab, frozen_now: datetime
     ) -> None:
         """Multiple reviews increment the count correctly."""
         vocab = make_vocab()
-        now = datetime.now(timezone.utc)
+        now = frozen_now
 
         vocab.mark_as_reviewed(now + timedelta(hours=1))
         vocab.mark_as_reviewed(now + timedelta(hours=2))
@@ -10,17 +10,31 @@ from typing import Any
 from src.core.domain.value_objects import CEFRLevel
 
 
+# level, is_beginner, is_intermediate, is_advanced
+_CATEGORY_CASES = (
+    (CEFRLevel.A1, True, False, False),
+    (CEFRLevel.A2, True, False, False),
+    (CEFRLevel.B1, False, True, False),
+    (CEFRLevel.B2, False, True, False),
+    (CEFRLevel.C1, False, False, True),
+    (CEFRLevel.C2, False, False, True),
+)
+_CATEGORY_IDS = tuple(level.name for level, *_ in _CATEGORY_CASES)
+
+# Strict CEFR hierarchy, from beginner to proficient
+_EXPECTED_ORDER = (
+    CEFRLevel.A1, CEFRLevel.A2,
+    CEFRLevel.B1, CEFRLevel.B2,
+    CEFRLevel.C1, CEFRLevel.C2,
+)
+
+
 class TestCEFRLevelCategories:
     """Tests for level categorization (beginner/intermediate/advanced)."""
 
-    @pytest.mark.parametrize("level, is_beginner, is_intermediate, is_advanced", [
-        (CEFRLevel.A1, True, False, False),
-        (CEFRLevel.A2, True, False, False),
-        (CEFRLevel.B1, False, True, False),
-        (CEFRLevel.B2, False, True, False),
-        (CEFRLevel.C1, False, False, True),
-        (CEFRLevel.C2, False, False, True),
-    ])
+    @pytest.mark.parametrize(
+        "level, is_beginner, is_intermediate, is_advanced", _CATEGORY_CASES, ids=_CATEGORY_IDS
+    )
     def test_categories_and_invariants(self, level: CEFRLevel, is_beginner: bool, is_intermediate: bool, is_advanced: bool):
         """Each level must map to exactly one educational category."""
         assert level.is_beginner is is_beginner
@@ -30,12 +44,7 @@ class TestCEFRLevelCategories:
 
     def test_total_ordering(self):
         """Levels must follow the strict CEFR hierarchy for progression logic."""
-        expected = [
-            CEFRLevel.A1, CEFRLevel.A2, 
-            CEFRLevel.B1, CEFRLevel.B2, 
-            CEFRLevel.C1, CEFRLevel.C2
-        ]
-        assert sorted(list(CEFRLevel)) == expected
+        assert tuple(sorted(CEFRLevel)) == _EXPECTED_ORDER
         assert CEFRLevel.A1 < CEFRLevel.B1
         assert CEFRLevel.C2 > CEFRLevel.C1
 
@@ -11,13 +11,18 @@ import pytest
 from src.core.domain.value_objects import Role
 
 
+# role, is_student, is_teacher
+_ROLE_CASES = (
+    (Role.STUDENT, True, False),
+    (Role.TEACHER, False, True),
+)
+_ROLE_IDS = tuple(role.name for role, *_ in _ROLE_CASES)
+
+
 class TestRoleClassification:
     """Tests for role type classification."""
 
-    @pytest.mark.parametrize("role, is_student, is_teacher", [
-        (Role.STUDENT, True, False),
-        (Role.TEACHER, False, True),
-    ])
+    @pytest.mark.parametrize("role, is_student, is_teacher", _ROLE_CASES, ids=_ROLE_IDS)
     def test_classification_logic(self, role: Role, is_student: bool, is_teacher: bool):
         """Ensure correct role-to-type mapping."""
         assert role.is_student is is_student
@@ -11,14 +11,21 @@ import pytest
 from src.core.domain.value_objects import Status
 
 
+# status, is_active, is_archived, is_writable
+_FLAG_CASES = (
+    (Status.ACTIVE, True, False, True),
+    (Status.ARCHIVED, False, True, False),
+    (Status.DELETED, False, False, False),
+)
+_FLAG_IDS = tuple(status.name for status, *_ in _FLAG_CASES)
+
+
 class TestStatusFlags:
     """Tests for status boolean flags."""
 
-    @pytest.mark.parametrize("status, is_active, is_archived, is_writable", [
-        (Status.ACTIVE, True, False, True),
-        (Status.ARCHIVED, False, True, False),
-        (Status.DELETED, False, False, False),
-    ])
+    @pytest.mark.parametrize(
+        "status, is_active, is_archived, is_writable", _FLAG_CASES, ids=_FLAG_IDS
+    )
     def test_status_logic_flags(self, status: Status, is_active: bool, is_archived: bool, is_writable: bool):
         """Ensure lifecycle flags match business rules."""
         assert status.is_active is is_active
@@ -1,17 +1,43 @@
 """
-Test Doubles - Fake, Stub, Mock implementations for testing.
+Test Doubles - Fake, Stub, Spy implementations for testing.
 
 This package contains test doubles organized by type:
 - fakes/: Simplified working implementations (e.g., in-memory repositories)
-- stubs/: Fixed response providers (e.g., time provider)
+- stubs/: Fixed response providers (e.g., time provider, chat provider)
+- spies/: Providers recording their calls (e.g., chat provider)
+- factories: Plain DTO builders for tests that need no fixture
 
-Mocks are created directly with unittest.mock in test fixtures.
+Spies replace unittest.mock where a test verifies interactions.
+
+Exports are resolved lazily (PEP 562): importing one double doesn't load the others.
 """
 
-from .fakes import InMemoryConversationRepository
-from .stubs import StubTimeProvider
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .fakes import InMemoryConversationRepository
+    from .spies import SpyChatProvider
+    from .stubs import StubChatProvider, StubTimeProvider
+
+_EXPORTS = {
+    "InMemoryConversationRepository": ".fakes",
+    "SpyChatProvider": ".spies",
+    "StubChatProvider": ".stubs",
+    "StubTimeProvider": ".stubs",
+}
 
 __all__ = [
     "InMemoryConversationRepository",
+    "SpyChatProvider",
+    "StubChatProvider",
     "StubTimeProvider",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
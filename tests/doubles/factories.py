@@ -0,0 +1,55 @@
+"""
+Factories - Plain DTO builders.
+
+Module-level functions, called directly by tests that set every field
+themselves and so gain nothing from going through a pytest fixture.
+Ids left out are drawn from the shared deterministic sequence.
+"""
+
+from datetime import datetime, timezone
+from typing import Final
+from uuid import UUID
+
+from src.core.domain import Conversation, Language, Status
+from src.application.dtos.conversations import (
+    DeleteConversationCommand,
+    SelectConversationQuery,
+)
+
+from .stubs import fresh_uuid
+
+_BARE_TIME: Final[datetime] = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+_BARE_NATIVE: Final[Language] = Language("fr")
+_BARE_TARGET: Final[Language] = Language("en")
+
+def make_bare_conversation(student_id: UUID, title: str = "Conversation") -> Conversation:
+    """Empty active conversation owned by `student_id`, for tests that only need one to exist."""
+    return Conversation(
+        _id=fresh_uuid(),
+        _created_at=_BARE_TIME,
+        _student_id=student_id,
+        _native_lang=_BARE_NATIVE,
+        _target_lang=_BARE_TARGET,
+        _last_activity_at=_BARE_TIME,
+        _status=Status.ACTIVE,
+        _title=title,
+        _messages=[],
+    )
+
+def make_select_conversation_query(
+    student_id: UUID | None = None,
+    conversation_id: UUID | None = None,
+) -> SelectConversationQuery:
+    return SelectConversationQuery(
+        student_id=student_id or fresh_uuid(),
+        conversation_id=conversation_id or fresh_uuid(),
+    )
+
+def make_delete_conversation_command(
+    conversation_id: UUID | None = None,
+    student_id: UUID | None = None,
+) -> DeleteConversationCommand:
+    return DeleteConversationCommand(
+        conversation_id=conversation_id or fresh_uuid(),
+        student_id=student_id or fresh_uuid(),
+    )
@@ -5,8 +5,12 @@ Fake implementation of ConversationRepository using in-memory storage.
 Has real logic but simplified storage - no persistence between runs.
 """
 
-import copy
-from typing import Sequence
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+from dataclasses import replace
+from datetime import datetime
+from itertools import islice
+from typing import Iterable, Sequence
 from uuid import UUID
 
 from src.core.domain import Conversation, Status
@@ -17,15 +21,44 @@ from src.application.ports import ConversationReader
 from src.application.queries.conversations import ConversationSummary
 
 
+# Statuses listed by get_student_conversations (DELETED is never listed)
+_VISIBLE: frozenset[Status] = frozenset({Status.ACTIVE})
+_VISIBLE_WITH_ARCHIVED: frozenset[Status] = frozenset({Status.ACTIVE, Status.ARCHIVED})
+
+
+def _clone(conversation: Conversation) -> Conversation:
+    """
+    Copy a conversation without going through copy.deepcopy.
+
+    Value objects, UUIDs and datetimes are immutable and can be shared; only the
+    message list and the messages themselves (editable) need fresh instances.
+    """
+    return replace(
+        conversation,
+        _messages=[replace(msg) for msg in conversation._messages],
+    )
+
+
 class InMemoryConversationRepository(ConversationRepository, ConversationReader):
     """
     In-memory Fake implementation of ConversationRepository and ConversationReader.
     
-    Uses deep copying to prevent external modifications to stored entities.
+    Stores and returns clones to prevent external modifications to stored entities.
+    Conversations are also indexed per student, newest first, so listing a
+    student's conversations doesn't scan and sort the whole storage.
     """
 
     def __init__(self) -> None:
         self._storage: dict[UUID, Conversation] = {}
+        self._by_student: defaultdict[UUID, list[Conversation]] = defaultdict(list)
+        # Parallel to _by_student: negated creation timestamps, ascending
+        self._sort_keys: defaultdict[UUID, list[float]] = defaultdict(list)
+
+    def clear(self) -> None:
+        """Drop every stored conversation (test isolation helper)."""
+        self._storage.clear()
+        self._by_student.clear()
+        self._sort_keys.clear()
 
     # ──────────────────────────────────────────────────────────────────────────
     # ConversationRepository (Write Operations)
@@ -33,19 +66,27 @@ class InMemoryConversationRepository(ConversationRepository, ConversationReader)
 
     async def save(self, conversation: Conversation) -> None:
         """Save or update a conversation."""
-        self._storage[conversation.id] = copy.deepcopy(conversation)
+        self._store(_clone(conversation))
+
+    async def save_many(self, conversations: Iterable[Conversation]) -> None:
+        """Save several conversations in one call (test setup helper)."""
+        for conversation in conversations:
+            self._store(_clone(conversation))
 
     async def find_by_id(self, id: UUID) -> Conversation | None:
         """Find a conversation by ID, returns None if not found."""
-        if id not in self._storage:
+        conversation = self._storage.get(id)
+        if conversation is None:
             return None
-        return copy.deepcopy(self._storage[id])
+        return _clone(conversation)
 
     async def remove(self, id: UUID) -> None:
         """Remove a conversation by ID, raises if not found (only for in-memory storage)."""
-        if id not in self._storage:
-            raise ResourceNotFoundError(resource_type="Conversation", resource_id=id)
-        del self._storage[id]
+        try:
+            conversation = self._storage.pop(id)
+        except KeyError:
+            raise ResourceNotFoundError(resource_type="Conversation", resource_id=id) from None
+        self._unindex(conversation)
 
     # ──────────────────────────────────────────────────────────────────────────
     # ConversationReader (Query Operations)
@@ -73,19 +114,62 @@ class InMemoryConversationRepository(ConversationRepository, ConversationReader)
         Returns:
             List of conversation summaries, sorted by creation date (newest first)
         """
-        # Determine which statuses to include
-        allowed_statuses = {Status.ACTIVE}
-        if include_archived:
-            allowed_statuses.add(Status.ARCHIVED)
         # Note: DELETED conversations are never included (soft delete)
+        allowed_statuses = _VISIBLE_WITH_ARCHIVED if include_archived else _VISIBLE
         
-        student_conversations = [
-            conv for conv in self._storage.values() 
-            if conv.student_id == student_id and conv.status in allowed_statuses
-        ]
-        student_conversations.sort(key=lambda c: c.created_at, reverse=True)
-        paginated_convs = student_conversations[offset : offset + limit]
-        return [self._to_summary(c) for c in paginated_convs]
+        visible = (
+            conv for conv in self._by_student.get(student_id, ())
+            if conv.status in allowed_statuses
+        )
+        return [self._to_summary(c) for c in islice(visible, offset, offset + limit)]
+
+    # ──────────────────────────────────────────────────────────────────────────
+    # Per-student index
+    # ──────────────────────────────────────────────────────────────────────────
+
+    @staticmethod
+    def _sort_key(created_at: datetime) -> float:
+        """Ascending key for newest-first order."""
+        return -created_at.timestamp()
+
+    def _store(self, conversation: Conversation) -> None:
+        """Put a clone in storage and keep the per-student index in sync."""
+        previous = self._storage.get(conversation.id)
+        self._storage[conversation.id] = conversation
+
+        if (
+            previous is not None
+            and previous.student_id == conversation.student_id
+            and previous.created_at == conversation.created_at
+        ):
+            # Same slot: replace in place to keep the original ordering among ties
+            entries = self._by_student[conversation.student_id]
+            entries[self._position(previous)] = conversation
+            return
+
+        if previous is not None:
+            self._unindex(previous)
+        key = self._sort_key(conversation.created_at)
+        keys = self._sort_keys[conversation.student_id]
+        # bisect_right keeps insertion order among equal creation dates
+        position = bisect_right(keys, key)
+        keys.insert(position, key)
+        self._by_student[conversation.student_id].insert(position, conversation)
+
+    def _unindex(self, conversation: Conversation) -> None:
+        """Remove a stored conversation from the per-student index."""
+        position = self._position(conversation)
+        del self._by_student[conversation.student_id][position]
+        del self._sort_keys[conversation.student_id][position]
+
+    def _position(self, conversation: Conversation) -> int:
+        """Locate a stored conversation in its student's index."""
+        keys = self._sort_keys[conversation.student_id]
+        entries = self._by_student[conversation.student_id]
+        position = bisect_left(keys, self._sort_key(conversation.created_at))
+        while entries[position].id != conversation.id:
+            position += 1
+        return position
 
     def _to_summary(self, conversation: Conversation) -> ConversationSummary:
         """
@@ -0,0 +1,11 @@
+"""
+Spies - Working doubles that record how they were called.
+
+Spies return configured values like stubs, and keep their calls so tests
+can verify interactions without unittest.mock.
+"""
+
+from .async_spy import AsyncSpy
+from .chat_provider_spy import SpyChatProvider
+
+__all__ = ["AsyncSpy", "SpyChatProvider"]
@@ -0,0 +1,28 @@
+
+from typing import Any
+
+class AsyncSpy:
+    """
+    Awaitable callable recording its calls.
+
+    Mirrors the subset of AsyncMock the tests rely on: `return_value`,
+    `side_effect` (an exception to raise) and call assertions.
+    """
+
+    def __init__(self, return_value: Any = None):
+        self.return_value = return_value
+        self.side_effect: BaseException | None = None
+        self.calls: list[tuple[tuple[Any, ...], dict[str, Any]]] = []
+
+    async def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        self.calls.append((args, kwargs))
+        if self.side_effect is not None:
+            raise self.side_effect
+        return self.return_value
+
+    def assert_called_once(self) -> None:
+        assert len(self.calls) == 1, f"Expected 1 call, got {len(self.calls)}"
+
+    def assert_awaited_once_with(self, *args: Any, **kwargs: Any) -> None:
+        self.assert_called_once()
+        assert self.calls[0] == (args, kwargs), f"Expected call {(args, kwargs)}, got {self.calls[0]}"
@@ -0,0 +1,33 @@
+
+from collections.abc import AsyncIterator
+
+from src.core.domain import ChatMessage, Language, TeacherProfile
+from src.core.ports import ChatProvider
+
+from .async_spy import AsyncSpy
+
+class SpyChatProvider(ChatProvider):
+    """
+    ChatProvider recording the requests it receives.
+
+    `get_teacher_response` is an AsyncSpy answering "Hello Student!" by
+    default; configure it through `.return_value` / `.side_effect`.
+    Streaming goes through the same spy and yields its answer as a single chunk.
+    """
+
+    def __init__(self, response: str = "Hello Student!"):
+        self.get_teacher_response = AsyncSpy(return_value=response)
+
+    async def stream_teacher_response(
+        self,
+        history: tuple[ChatMessage, ...],
+        teacher_profile: TeacherProfile,
+        native_lang: Language,
+        target_lang: Language
+    ) -> AsyncIterator[str]:
+        yield await self.get_teacher_response(
+            history=history,
+            teacher_profile=teacher_profile,
+            native_lang=native_lang,
+            target_lang=target_lang,
+        )
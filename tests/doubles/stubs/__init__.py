@@ -5,6 +5,8 @@ Stubs return predefined values without any verification.
 Use for dependencies where you need controlled, predictable values.
 """
 
+from .chat_provider_stub import StubChatProvider
+from .id_provider_stub import SequentialIdProvider, fresh_uuid
 from .time_provider_stub import StubTimeProvider
 
-__all__ = ["StubTimeProvider"]
+__all__ = ["SequentialIdProvider", "StubChatProvider", "StubTimeProvider", "fresh_uuid"]
@@ -0,0 +1,46 @@
+
+from collections.abc import AsyncIterator, Sequence
+
+from src.core.domain import ChatMessage, Language, TeacherProfile
+from src.core.ports import ChatProvider
+
+class StubChatProvider(ChatProvider):
+    """
+    Canned teacher: always answers `response`, or raises `error` when set.
+
+    The streamed answer is `chunks` when given, otherwise the whole response
+    as a single chunk. Holds no call records, so one instance can be shared.
+    """
+
+    def __init__(
+        self,
+        response: str = "Hello Student!",
+        chunks: Sequence[str] | None = None,
+        error: Exception | None = None,
+    ):
+        self._response = response
+        self._chunks = tuple(chunks) if chunks is not None else (response,)
+        self._error = error
+
+    async def get_teacher_response(
+        self,
+        history: tuple[ChatMessage, ...],
+        teacher_profile: TeacherProfile,
+        native_lang: Language,
+        target_lang: Language
+    ) -> str:
+        if self._error is not None:
+            raise self._error
+        return self._response
+
+    async def stream_teacher_response(
+        self,
+        history: tuple[ChatMessage, ...],
+        teacher_profile: TeacherProfile,
+        native_lang: Language,
+        target_lang: Language
+    ) -> AsyncIterator[str]:
+        if self._error is not None:
+            raise self._error
+        for chunk in self._chunks:
+            yield chunk
@@ -0,0 +1,21 @@
+import itertools
+from uuid import UUID
+
+from src.core.ports import IdProvider
+
+class SequentialIdProvider(IdProvider):
+    """
+    Deterministic ids: UUID(int=1), UUID(int=2), ...
+
+    Unique within the provider, without the os.urandom read of uuid4().
+    """
+    def __init__(self, start: int = 1):
+        self._counter = itertools.count(start)
+
+    def new_id(self) -> UUID:
+        return UUID(int=next(self._counter))
+
+
+# Session-wide sequence shared by the fixture factories, so ids never collide
+# across conftest modules.
+fresh_uuid = SequentialIdProvider().new_id
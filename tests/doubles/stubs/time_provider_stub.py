@@ -3,6 +3,9 @@ from datetime import datetime
 from src.core.ports import TimeProvider
 
 class StubTimeProvider(TimeProvider):
+    """Always returns the same instant."""
+    __slots__ = ("_now",)
+
     def __init__(self, now: datetime):
         self._now = now
 
@@ -0,0 +1,230 @@
+import asyncio
+from collections.abc import AsyncIterator, Callable
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.core.domain import ChatMessage, Language, Role, TeacherProfile
+from src.core.exceptions import TeacherResponseError
+
+from src.infrastructure.adapters.driven import LLMTeacherAdapter
+from src.infrastructure.adapters.driven.chat import CircuitBreaker, CircuitState
+from src.infrastructure.adapters.driven.chat import llm_teacher
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
+
+@pytest.fixture
+def breaker(clock: FakeClock) -> CircuitBreaker:
+    return CircuitBreaker(failure_threshold=2, failure_window=10.0, reset_timeout=30.0, clock=clock)
+
+
+class TestCircuitBreaker:
+
+    def test_should_open_after_threshold_failures(self, breaker: CircuitBreaker) -> None:
+        breaker.record_failure()
+        assert breaker.state is CircuitState.CLOSED
+
+        breaker.record_failure()
+
+        assert breaker.state is CircuitState.OPEN
+        with pytest.raises(TeacherResponseError) as exc_info:
+            breaker.before_call()
+        assert exc_info.value.retry_after == 30.0
+
+    def test_should_forget_failures_outside_window(self, breaker: CircuitBreaker, clock: FakeClock) -> None:
+        breaker.record_failure()
+        clock.now = 11.0
+        breaker.record_failure()
+
+        assert breaker.state is CircuitState.CLOSED
+
+    def test_should_allow_a_single_probe_when_half_open(self, breaker: CircuitBreaker, clock: FakeClock) -> None:
+        breaker.record_failure()
+        breaker.record_failure()
+        clock.now = 30.0
+
+        assert breaker.state is CircuitState.HALF_OPEN
+        breaker.before_call()
+        with pytest.raises(TeacherResponseError):
+            breaker.before_call()
+
+    @pytest.mark.parametrize("probe_succeeds, expected_state", [
+        (True, CircuitState.CLOSED),
+        (False, CircuitState.OPEN),
+    ])
+    def test_probe_outcome_should_close_or_reopen(
+        self, 
+        breaker: CircuitBreaker, 
+        clock: FakeClock,
+        probe_succeeds: bool,
+        expected_state: CircuitState,
+    ) -> None:
+        breaker.record_failure()
+        breaker.record_failure()
+        clock.now = 30.0
+        breaker.before_call()
+
+        if probe_succeeds:
+            breaker.record_success()
+        else:
+            breaker.record_failure()
+
+        assert breaker.state is expected_state
+
+
+class TestLLMTeacherAdapterFailFast:
+
+    async def test_should_not_call_llm_again_for_a_request_that_just_failed(
+        self,
+        make_chat_message: Callable[..., ChatMessage],
+    ) -> None:
+        client = AsyncMock()
+        client.generate.side_effect = TeacherResponseError(cause="timeout")
+        teacher = LLMTeacherAdapter(client=client)
+        request = dict(
+            history=(make_chat_message(role=Role.STUDENT, content="Hello"),),
+            teacher_profile=TeacherProfile(),
+            native_lang=Language("fr"),
+            target_lang=Language("en"),
+        )
+
+        with pytest.raises(TeacherResponseError):
+            await teacher.get_teacher_response(**request)
+        with pytest.raises(TeacherResponseError) as exc_info:
+            await teacher.get_teacher_response(**request)
+
+        client.generate.assert_awaited_once()
+        assert exc_info.value.retry_after is not None
+
+    async def test_should_fail_fast_while_circuit_is_open(
+        self,
+        breaker: CircuitBreaker,
+        make_chat_message: Callable[..., ChatMessage],
+    ) -> None:
+        client = AsyncMock()
+        client.generate.side_effect = TeacherResponseError(cause="timeout")
+        teacher = LLMTeacherAdapter(client=client, circuit_breaker=breaker)
+
+        for content in ("one", "two", "three"):
+            with pytest.raises(TeacherResponseError):
+                await teacher.get_teacher_response(
+                    history=(make_chat_message(role=Role.STUDENT, content=content),),
+                    teacher_profile=TeacherProfile(),
+                    native_lang=Language("fr"),
+                    target_lang=Language("en"),
+                )
+
+        assert client.generate.await_count == 2
+
+    async def test_should_release_probe_when_stream_is_abandoned(
+        self,
+        breaker: CircuitBreaker,
+        clock: FakeClock,
+        make_chat_message: Callable[..., ChatMessage],
+    ) -> None:
+        async def chunks() -> AsyncIterator[str]:
+            yield "Hel"
+            yield "lo"
+
+        client = MagicMock()
+        client.stream.side_effect = lambda *args: chunks()
+        teacher = LLMTeacherAdapter(client=client, circuit_breaker=breaker)
+        request = dict(
+            history=(make_chat_message(role=Role.STUDENT, content="Hello"),),
+            teacher_profile=TeacherProfile(),
+            native_lang=Language("fr"),
+            target_lang=Language("en"),
+        )
+        breaker.record_failure()
+        breaker.record_failure()
+        clock.now = 30.0
+
+        # The probe stream is dropped after its first chunk (client disconnect)
+        stream = teacher.stream_teacher_response(**request)
+        assert await anext(stream) == "Hel"
+        await stream.aclose()
+
+        assert breaker.state is CircuitState.HALF_OPEN
+        assert [c async for c in teacher.stream_teacher_response(**request)] == ["Hel", "lo"]
+        assert breaker.state is CircuitState.CLOSED
+
+    async def test_abandoned_streams_should_not_open_circuit(
+        self,
+        breaker: CircuitBreaker,
+        make_chat_message: Callable[..., ChatMessage],
+    ) -> None:
+        async def chunks() -> AsyncIterator[str]:
+            yield "Hel"
+            yield "lo"
+
+        client = MagicMock()
+        client.stream.side_effect = lambda *args: chunks()
+        teacher = LLMTeacherAdapter(client=client, circuit_breaker=breaker)
+
+        for _ in range(5):
+            stream = teacher.stream_teacher_response(
+                history=(make_chat_message(role=Role.STUDENT, content="Hello"),),
+                teacher_profile=TeacherProfile(),
+                native_lang=Language("fr"),
+                target_lang=Language("en"),
+            )
+            await anext(stream)
+            await stream.aclose()
+
+        assert breaker.state is CircuitState.CLOSED
+
+    async def test_should_release_probe_when_call_is_cancelled(
+        self,
+        breaker: CircuitBreaker,
+        clock: FakeClock,
+        make_chat_message: Callable[..., ChatMessage],
+    ) -> None:
+        client = AsyncMock()
+        client.generate.side_effect = asyncio.CancelledError
+        teacher = LLMTeacherAdapter(client=client, circuit_breaker=breaker)
+        breaker.record_failure()
+        breaker.record_failure()
+        clock.now = 30.0
+
+        with pytest.raises(asyncio.CancelledError):
+            await teacher.get_teacher_response(
+                history=(make_chat_message(role=Role.STUDENT, content="Hello"),),
+                teacher_profile=TeacherProfile(),
+                native_lang=Language("fr"),
+                target_lang=Language("en"),
+            )
+
+        assert breaker.state is CircuitState.HALF_OPEN
+        breaker.before_call()
+
+    async def test_negative_cache_should_stay_bounded(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        make_chat_message: Callable[..., ChatMessage],
+    ) -> None:
+        monkeypatch.setattr(llm_teacher, "_NEGATIVE_CACHE_MAX_SIZE", 2)
+        client = AsyncMock()
+        client.generate.side_effect = TeacherResponseError(cause="timeout")
+        teacher = LLMTeacherAdapter(client=client, circuit_breaker=CircuitBreaker(failure_threshold=10))
+
+        for content in ("one", "two", "three"):
+            with pytest.raises(TeacherResponseError):
+                await teacher.get_teacher_response(
+                    history=(make_chat_message(role=Role.STUDENT, content=content),),
+                    teacher_profile=TeacherProfile(),
+                    native_lang=Language("fr"),
+                    target_lang=Language("en"),
+                )
+
+        assert len(teacher._recent_failures) == 2
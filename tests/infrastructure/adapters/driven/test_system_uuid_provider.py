@@ -0,0 +1,21 @@
+from uuid import RFC_4122
+
+from src.infrastructure.adapters.driven import SystemUUIDProvider
+
+
+class TestSystemUUIDProvider:
+
+    def test_should_generate_version_7_uuids(self) -> None:
+        uuid = SystemUUIDProvider().new_id()
+
+        assert uuid.version == 7
+        assert uuid.variant == RFC_4122
+
+    def test_should_generate_unique_time_ordered_prefixes(self) -> None:
+        provider = SystemUUIDProvider()
+
+        ids = [provider.new_id() for _ in range(100)]
+        timestamps = [uuid.int >> 80 for uuid in ids]
+
+        assert len(set(ids)) == len(ids)
+        assert timestamps == sorted(timestamps)
@@ -1,16 +1,22 @@
+"""
+FastAPI test fixtures.
+
+The application module is imported inside the fixtures, so the app graph is only
+built when an HTTP test actually runs (not for e.g. `pytest -k cefr`).
+"""
 
 import pytest
-from unittest.mock import AsyncMock
 from fastapi.testclient import TestClient
 from typing import Generator
 
-from src.infrastructure.adapters.driving.fastapi.main import app
 from src.infrastructure.adapters.driven import InMemoryConversationRepository
 from src.infrastructure.adapters.driving.fastapi.dependencies import (
     get_in_memory_db, 
     get_chat_provider,
 )
 
+from tests.doubles.spies import SpyChatProvider
+
 @pytest.fixture
 def mock_db() -> InMemoryConversationRepository:
     """
@@ -18,29 +24,35 @@ def mock_db() -> InMemoryConversationRepository:
     """
     return InMemoryConversationRepository()
 
-@pytest.fixture
-def mock_chat_provider() -> AsyncMock:
+@pytest.fixture(scope="session")
+def _app_client() -> Generator[TestClient, None, None]:
     """
-    Mocks the LLM provider to avoid real API calls and ensure determinism.
+    A single TestClient for the whole session.
+
+    The app lifespan runs once; tests only swap dependency overrides.
     """
-    mock = AsyncMock()
-    mock.get_teacher_response.return_value = "Mocked Teacher Response"
-    return mock
+    from src.infrastructure.adapters.driving.fastapi.main import app
+
+    with TestClient(app) as c:
+        yield c
 
 @pytest.fixture
-def client(mock_db: InMemoryConversationRepository, mock_chat_provider: AsyncMock) -> Generator[TestClient, None, None]:
+def client(
+    _app_client: TestClient,
+    mock_db: InMemoryConversationRepository,
+    mock_chat: SpyChatProvider,
+) -> Generator[TestClient, None, None]:
     """
-    Configures the TestClient with dependency overrides.
+    Configures the shared TestClient with dependency overrides.
     
     CRITICAL: We override the Singletons (get_in_memory_db, get_chat_provider)
     so that the entire dependency tree uses our test doubles.
     """
+    app = _app_client.app
     app.dependency_overrides[get_in_memory_db] = lambda: mock_db
-    app.dependency_overrides[get_chat_provider] = lambda: mock_chat_provider
+    app.dependency_overrides[get_chat_provider] = lambda: mock_chat
     
-    # Yield Client
-    with TestClient(app) as c:
-        yield c
+    yield _app_client
         
     # Cleanup (Reset overrides)
-    app.dependency_overrides = {}
\ No newline at end of file
+    app.dependency_overrides.clear()
\ No newline at end of file
@@ -11,9 +11,9 @@ from src.infrastructure.adapters.driven import InMemoryConversationRepository
 
 def test_create_conversation_should_return_201(
     client: TestClient,
-    make_student: Callable[..., Student]
+    shared_student: Student,
 ) -> None:
-    student = make_student()
+    student = shared_student
     
     payload = {
         "student_id": str(student.id),
@@ -29,9 +29,9 @@ def test_create_conversation_should_return_201(
 
 def test_create_conversation_invalid_lang_should_return_400(
     client: TestClient,
-    make_student: Callable[..., Student],
+    shared_student: Student,
 ) -> None:
-    student = make_student()
+    student = shared_student
 
     payload = {
         "student_id": str(student.id),
@@ -67,6 +67,8 @@ async def test_list_conversations_should_filter_by_student(
     data = response.json()
     assert len(data) == 1
     assert data[0]["conversation_id"] == str(conv1.id)
+    # Same datetime format as pydantic-serialized responses
+    assert data[0]["created_at"] == "2024-01-01T00:00:00Z"
 
 async def test_get_conversation_should_return_details(
     client: TestClient, 
@@ -9,4 +9,16 @@ def test_health_check_returns_200(client: TestClient):
     response = client.get("/health")
     
     assert response.status_code == status.HTTP_200_OK
-    assert response.json() == {"status": "ok"}
\ No newline at end of file
+    assert response.json() == {"status": "ok"}
+
+def test_health_check_answers_head_probes(client: TestClient):
+    response = client.head("/health")
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-length"] == str(len(b'{"status":"ok"}'))
+    assert response.content == b""
+
+def test_health_check_is_documented(client: TestClient):
+    response = client.get("/openapi.json")
+
+    assert "/health" in response.json()["paths"]
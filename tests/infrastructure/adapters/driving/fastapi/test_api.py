@@ -1,10 +1,12 @@
 
 from collections.abc import Callable
+
+import pytest
 from fastapi.testclient import TestClient
-from unittest.mock import AsyncMock
 
 from src.core.domain.entities import Student, Conversation
 from src.core.domain.value_objects import CreativityLevel, GenerationStyle
+from src.core.exceptions import TeacherResponseError
 
 from src.infrastructure.adapters.driven import InMemoryConversationRepository
 from src.infrastructure.adapters.driving.fastapi.dependencies import (
@@ -12,7 +14,8 @@ from src.infrastructure.adapters.driving.fastapi.dependencies import (
     get_conversation_repository
 )
 
-from src.infrastructure.adapters.driving.fastapi.main import app
+from tests.doubles.spies import SpyChatProvider
+from tests.doubles.stubs import StubChatProvider
 
 
 def test_health_check_returns_200(client: TestClient):
@@ -23,9 +26,9 @@ def test_health_check_returns_200(client: TestClient):
 
 def test_create_conversation_should_return_201(
     client: TestClient,
-    make_student: Callable[..., Student]
+    shared_student: Student,
 ):
-    student: Student = make_student()
+    student = shared_student
     payload = {
         "student_id": str(student.id),
         "native_lang": "fr",
@@ -41,8 +44,9 @@ def test_create_conversation_should_return_201(
 async def test_send_message_should_return_200(
     client: TestClient, 
     make_conversation: Callable[..., Conversation],
-    mock_chat: AsyncMock,
+    mock_chat: SpyChatProvider,
 ):
+    app = client.app
     shared_repo = InMemoryConversationRepository()
     conversation = make_conversation()
     await shared_repo.save(conversation=conversation)
@@ -67,4 +71,71 @@ async def test_send_message_should_return_200(
         mock_chat.get_teacher_response.assert_called_once()
 
     finally:
-        app.dependency_overrides = {}
\ No newline at end of file
+        app.dependency_overrides = {}
+
+
+async def test_stream_message_should_return_server_sent_events(
+    client: TestClient,
+    make_conversation: Callable[..., Conversation],
+) -> None:
+    app = client.app
+    shared_repo = InMemoryConversationRepository()
+    conversation = make_conversation()
+    await shared_repo.save(conversation=conversation)
+
+    stub_chat = StubChatProvider(chunks=("Hello ", "Student!\nBye"))
+
+    app.dependency_overrides[get_conversation_repository] = lambda: shared_repo
+    app.dependency_overrides[get_chat_provider] = lambda: stub_chat
+
+    try:
+        payload = {"student_message": "Hello world"}
+
+        response = client.post(f"/api/conversations/{conversation.id}/messages/stream", json=payload)
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        assert response.text == "data: Hello \n\ndata: Student!\ndata: Bye\n\n"
+
+    finally:
+        app.dependency_overrides = {}
+
+
+@pytest.mark.parametrize(
+    "stub_chat",
+    [
+        StubChatProvider(error=TeacherResponseError(cause="timeout")),
+        StubChatProvider(chunks=(" ", "\n")),
+    ],
+    ids=["teacher-error", "blank-response"],
+)
+async def test_stream_message_should_end_with_error_event_on_failure(
+    client: TestClient,
+    make_conversation: Callable[..., Conversation],
+    stub_chat: StubChatProvider,
+) -> None:
+    app = client.app
+    shared_repo = InMemoryConversationRepository()
+    conversation = make_conversation()
+    await shared_repo.save(conversation=conversation)
+
+    app.dependency_overrides[get_conversation_repository] = lambda: shared_repo
+    app.dependency_overrides[get_chat_provider] = lambda: stub_chat
+
+    try:
+        payload = {"student_message": "Hello world"}
+
+        response = client.post(f"/api/conversations/{conversation.id}/messages/stream", json=payload)
+
+        assert response.status_code == 200
+        assert response.text.endswith("\n\n")
+        last_event = response.text.strip().split("\n\n")[-1]
+        assert last_event.startswith("event: error\ndata: ")
+        assert '"type":"error:teacher-service-unavailable"' in last_event
+
+        # Nothing was persisted (a retry won't duplicate the student's message)
+        saved = await shared_repo.get_by_id(conversation.id)
+        assert saved.messages == ()
+
+    finally:
+        app.dependency_overrides = {}
@@ -0,0 +1,23 @@
+
+from src.infrastructure.adapters.driven import InMemoryConversationRepository
+from src.infrastructure.adapters.driving.fastapi.dependencies import (
+    get_time_provider,
+    get_select_conversation_use_case,
+    get_delete_conversation_use_case,
+)
+
+
+def test_use_case_factories_should_reuse_instances_for_same_dependencies():
+    repo = InMemoryConversationRepository()
+
+    assert get_select_conversation_use_case(repo) is get_select_conversation_use_case(repo)
+    assert (
+        get_delete_conversation_use_case(repository=repo, time_provider=get_time_provider())
+        is get_delete_conversation_use_case(repository=repo, time_provider=get_time_provider())
+    )
+
+def test_use_case_factories_should_build_new_instance_for_other_dependencies():
+    assert (
+        get_select_conversation_use_case(InMemoryConversationRepository())
+        is not get_select_conversation_use_case(InMemoryConversationRepository())
+    )
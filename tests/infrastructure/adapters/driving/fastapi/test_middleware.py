@@ -0,0 +1,32 @@
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.infrastructure.adapters.driving.fastapi.middleware import ServerTimingMiddleware
+
+
+def test_server_timing_header_is_added(client: TestClient):
+    response = client.get("/health")
+
+    assert response.headers["server-timing"].startswith("app;dur=")
+    # Existing headers are preserved
+    assert response.headers["content-type"] == "application/json"
+
+
+def test_server_timing_passes_lifespan_through():
+    events: list[str] = []
+
+    @asynccontextmanager
+    async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+        events.append("startup")
+        yield
+
+    app = FastAPI(lifespan=lifespan)
+    app.add_middleware(ServerTimingMiddleware)
+
+    with TestClient(app):
+        pass
+
+    assert events == ["startup"]
@@ -1,7 +1,11 @@
 
-from typing import Callable
+import asyncio
+import re
+from types import SimpleNamespace
+from typing import Any, Callable, Iterator
 import pytest
 from unittest.mock import AsyncMock, MagicMock
+import httpx
 import openai
 
 from src.core.domain.entities import ChatMessage
@@ -10,25 +14,82 @@ from src.core.exceptions import TeacherResponseError
 
 from src.infrastructure.ai import BaseOpenAIClient
 
+# SDK errors and the message pattern each must map to, built once at import
+_MOCK_RESPONSE = MagicMock()
+_MOCK_RESPONSE_500 = MagicMock(status_code=500)
+_OPENAI_ERRORS = (
+    (
+        openai.RateLimitError(message="", response=_MOCK_RESPONSE, body=None),
+        re.compile("The teacher is currently busy")
+    ),
+    (
+        openai.AuthenticationError(message="", response=_MOCK_RESPONSE, body=None),
+        re.compile(r"Teacher service configuration error \(Auth\)")
+    ),
+    (
+        openai.PermissionDeniedError(message="", response=_MOCK_RESPONSE, body=None),
+        re.compile("Access denied to the learning service")
+    ),
+    (
+        openai.APIConnectionError(message="", request=MagicMock()),
+        re.compile("The teacher service is currently unavailable")
+    ),
+    (
+        openai.APIStatusError(message="", response=_MOCK_RESPONSE_500, body=None),
+        re.compile(r"Teacher service encountered an error \(500\)")
+    ),
+)
+
 class MockOpenAIClient(BaseOpenAIClient):
     """Testable implementation of BaseOpenAIClient for unit tests."""
     
     from openai import AsyncOpenAI, AsyncAzureOpenAI
     
-    def __init__(self, model_name: str, client: AsyncOpenAI | AsyncAzureOpenAI):
+    def __init__(
+        self,
+        model_name: str,
+        client: AsyncOpenAI | AsyncAzureOpenAI,
+        max_concurrent_requests: int | None = None,
+    ):
         """Initialize with a mock client for testing."""
-        super().__init__(model_name)
+        super().__init__(model_name, max_concurrent_requests)
         self._test_client = client
 
     def _create_client(self) -> AsyncOpenAI | AsyncAzureOpenAI:
         """Return the injected mock client."""
         return self._test_client
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def openai_client_mock() -> AsyncMock:
-    """Mock AsyncOpenAI client."""
+    """Mock AsyncOpenAI client, built once per module and reset after each test."""
     return AsyncMock()
 
+@pytest.fixture(autouse=True)
+def _reset_openai_client_mock(openai_client_mock: AsyncMock) -> Iterator[None]:
+    yield
+    openai_client_mock.reset_mock(return_value=True, side_effect=True)
+
+@pytest.fixture(scope="module")
+def mock_openai_response() -> tuple[SimpleNamespace, SimpleNamespace]:
+    """
+    Completion response fake built once per module: (response, message).
+
+    Plain attribute bags (no call is ever asserted on them). Tests only set
+    `message.content` before handing `response` to the client.
+    """
+    mock_message = SimpleNamespace(content=None)
+    mock_response = SimpleNamespace(choices=[SimpleNamespace(message=mock_message)])
+    return mock_response, mock_message
+
+@pytest.fixture(scope="module")
+def canonical_messages(make_chat_message: Callable[..., ChatMessage]) -> tuple[ChatMessage, ...]:
+    """Student/teacher/student history, built once per module (read-only)."""
+    return (
+        make_chat_message(role=Role.STUDENT, content="Student message"),
+        make_chat_message(role=Role.TEACHER, content="Teacher message"),
+        make_chat_message(role=Role.STUDENT, content="Student question"),
+    )
+
 @pytest.fixture
 def base_openai_client(openai_client_mock: AsyncMock):
     """Fixture providing a MockOpenAIClient with mocked dependencies."""
@@ -43,34 +104,30 @@ class TestBaseOpenAIClientFormat:
         self, 
         base_openai_client: AsyncMock,
         openai_client_mock: AsyncMock,
-        make_chat_message: Callable[..., ChatMessage]
+        mock_openai_response: tuple[SimpleNamespace, SimpleNamespace],
+        canonical_messages: tuple[ChatMessage, ...],
     ) -> None:
-        mock_message = MagicMock()
+        mock_response, mock_message = mock_openai_response
         mock_message.content = "Teacher response"
 
-        mock_choice = MagicMock()
-        mock_choice.message = mock_message
+        captured: list[dict[str, object]] = []
 
-        mock_response = MagicMock()
-        mock_response.choices = [mock_choice]
+        async def capture(**kwargs: object) -> SimpleNamespace:
+            captured.append(kwargs)
+            return mock_response
 
-        openai_client_mock.chat.completions.create.return_value = mock_response
+        openai_client_mock.chat.completions.create.side_effect = capture
 
-        messages: list[ChatMessage] = [
-            make_chat_message(role=Role.STUDENT, content="Student message"),
-            make_chat_message(role=Role.TEACHER, content="Teacher message"),
-            make_chat_message(role=Role.STUDENT, content="Student question"),
-        ]
         system_prompt = "You're a useful teacher."
 
-        _ = await base_openai_client.generate(messages=messages, system_prompt=system_prompt)
+        _ = await base_openai_client.generate(messages=canonical_messages, system_prompt=system_prompt)
 
-        openai_client_mock.chat.completions.create.assert_called_once()
-        kwargs = openai_client_mock.chat.completions.create.call_args.kwargs
+        assert len(captured) == 1
+        kwargs = captured[0]
 
         assert kwargs["model"] == "gpt-test"
         
-        formatted_messages = kwargs["messages"]
+        formatted_messages: Any = kwargs["messages"]
 
         assert formatted_messages[0]["role"] == "system"
         assert formatted_messages[0]["content"] == system_prompt
@@ -84,65 +141,133 @@ class TestBaseOpenAIClientFormat:
         assert formatted_messages[-1]["role"] == "user"
         assert formatted_messages[-1]["content"] == "Student question"
 
-    @pytest.mark.parametrize("invalid_content", [
-        None,           
-        "",             
-        "   ",          
-        "\n\t",         
-    ])
+    async def test_should_format_edited_messages_with_their_new_content(
+        self,
+        base_openai_client: AsyncMock,
+        make_chat_message: Callable[..., ChatMessage]
+    ) -> None:
+        message = make_chat_message(role=Role.STUDENT, content="Helo")
+        history = (message,)
+        _ = base_openai_client._convert_to_openai_format(history, "Sys")
+
+        message.edit_content("Hello")
+        formatted = base_openai_client._convert_to_openai_format(history, "Sys")
+
+        assert formatted[-1]["content"] == "Hello"
+
+    # One case per branch of the guard: `content is None` and `not content.strip()`
+    @pytest.mark.parametrize("invalid_content", [None, " \n\t"], ids=["none", "blank"])
     async def test_should_raise_on_invalid_content(
         self,
         base_openai_client: AsyncMock,
         openai_client_mock: AsyncMock,
-        make_chat_message: Callable[..., ChatMessage],
+        mock_openai_response: tuple[SimpleNamespace, SimpleNamespace],
         invalid_content: str | None
     ) -> None:
-        mock_message = MagicMock()
+        mock_response, mock_message = mock_openai_response
         mock_message.content = invalid_content
-
-        mock_choice = MagicMock()
-        mock_choice.message = mock_message
-
-        mock_response = MagicMock()
-        mock_response.choices = [mock_choice]
-
         openai_client_mock.chat.completions.create.return_value = mock_response
         
         with pytest.raises(TeacherResponseError, match="empty response"):
             await base_openai_client.generate(messages=[], system_prompt="Sys")
         
-    mock_response_500 = MagicMock()
-    mock_response_500.status_code = 500
-    @pytest.mark.parametrize("openai_error, expected_match", [
-        (
-            openai.RateLimitError(message="", response=MagicMock(), body=None), 
-            "The teacher is currently busy"
-        ),
-        (
-            openai.AuthenticationError(message="", response=MagicMock(), body=None), 
-            r"Teacher service configuration error \(Auth\)"
-        ),
-        (
-            openai.PermissionDeniedError(message="", response=MagicMock(), body=None), 
-            "Access denied to the learning service"
-        ),
-        (
-            openai.APIConnectionError(message="", request=MagicMock()), 
-            "The teacher service is currently unavailable"
-        ),
-        (
-            openai.APIStatusError(message="", response=mock_response_500, body=None), 
-            r"Teacher service encountered an error \(500\)"
-        ),
-    ])
+    @pytest.mark.parametrize("openai_error, expected_match", _OPENAI_ERRORS)
     async def test_should_map_openai_exceptions_to_domain_error(
         self,
         base_openai_client: AsyncMock,
         openai_client_mock: AsyncMock,
         openai_error: Exception,
-        expected_match: str
+        expected_match: re.Pattern[str]
     ) -> None:
         openai_client_mock.chat.completions.create.side_effect = openai_error
 
         with pytest.raises(TeacherResponseError, match=expected_match):
-            await base_openai_client.generate(messages=[], system_prompt="Sys")
\ No newline at end of file
+            await base_openai_client.generate(messages=[], system_prompt="Sys")
+
+class TestBaseOpenAIClientStream:
+
+    async def test_should_yield_non_empty_deltas(
+        self,
+        base_openai_client: MockOpenAIClient,
+        openai_client_mock: AsyncMock,
+    ) -> None:
+        async def fake_chunks():
+            for content in ("Hel", None, "lo"):
+                yield SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=content))])
+
+        openai_client_mock.chat.completions.create.return_value = fake_chunks()
+
+        chunks = [c async for c in base_openai_client.stream(messages=(), system_prompt="Sys")]
+
+        assert chunks == ["Hel", "lo"]
+        assert openai_client_mock.chat.completions.create.call_args.kwargs["stream"] is True
+
+    async def test_should_map_dropped_connection_to_domain_error(
+        self,
+        base_openai_client: MockOpenAIClient,
+        openai_client_mock: AsyncMock,
+    ) -> None:
+        async def fake_chunks():
+            yield SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content="Hel"))])
+            raise httpx.ReadTimeout("timed out")
+
+        openai_client_mock.chat.completions.create.return_value = fake_chunks()
+        stream = base_openai_client.stream(messages=(), system_prompt="Sys")
+
+        assert await anext(stream) == "Hel"
+        with pytest.raises(TeacherResponseError, match="interrupted its response"):
+            await anext(stream)
+
+
+class TestBaseOpenAIClientLifecycle:
+
+    async def test_should_close_created_client(
+        self,
+        base_openai_client: MockOpenAIClient,
+        openai_client_mock: AsyncMock,
+    ) -> None:
+        _ = base_openai_client.client
+
+        await base_openai_client.aclose()
+
+        openai_client_mock.close.assert_awaited_once()
+        assert base_openai_client._client is None
+
+    async def test_should_not_create_client_on_close(
+        self,
+        base_openai_client: MockOpenAIClient,
+        openai_client_mock: AsyncMock,
+    ) -> None:
+        await base_openai_client.aclose()
+
+        openai_client_mock.close.assert_not_awaited()
+
+
+class TestBaseOpenAIClientConcurrency:
+
+    async def test_should_bound_requests_in_flight(
+        self,
+        openai_client_mock: AsyncMock,
+    ) -> None:
+        in_flight = 0
+        peak = 0
+
+        async def create(**kwargs: object) -> SimpleNamespace:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return SimpleNamespace(
+                choices=[SimpleNamespace(message=SimpleNamespace(content="Teacher response"))]
+            )
+
+        openai_client_mock.chat.completions.create.side_effect = create
+        client = MockOpenAIClient("gpt-test", openai_client_mock, max_concurrent_requests=2)
+
+        results = await asyncio.gather(
+            *(client.generate(messages=(), system_prompt="Sys") for _ in range(5))
+        )
+
+        assert results == ["Teacher response"] * 5
+        assert peak == 2
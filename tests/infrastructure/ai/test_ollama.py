@@ -1,28 +1,36 @@
 
+import pytest
+
 from src.infrastructure.adapters.driven import LLMTeacherAdapter
 from src.infrastructure.ai import OllamaClient
 from src.infrastructure.ai.config import OllamaConfig
 
-class TestOllama:
 
-    async def test_ollama_config(self) -> None:
-        config = OllamaConfig()
+@pytest.fixture(scope="module")
+def ollama_config() -> OllamaConfig:
+    """Default configuration, validated once per module."""
+    return OllamaConfig()
+
+@pytest.fixture(scope="module")
+def ollama_client(ollama_config: OllamaConfig) -> OllamaClient:
+    """Client wired from the default configuration."""
+    return OllamaClient(
+        base_url=ollama_config.openai_compatible_url,
+        model_name=ollama_config.model
+    )
 
-        ollama_client = OllamaClient(
-            base_url=config.openai_compatible_url,
-            model_name=config.model
-        )
 
+class TestOllama:
+
+    async def test_should_wire_default_ollama_client(
+        self, ollama_config: OllamaConfig, ollama_client: OllamaClient
+    ) -> None:
         teacher = LLMTeacherAdapter(client=ollama_client)
 
         assert isinstance(teacher, LLMTeacherAdapter)
+        assert str(ollama_client.client.base_url) == f"{ollama_config.base_url}/v1/"
+
+    async def test_should_request_prompt_caching(self) -> None:
+        ollama_client = OllamaClient(base_url="http://localhost:11434/v1", model_name="test")
 
-    async def test_should_configure_ollama_client_correctly(self) -> None:
-        config = OllamaConfig()
-        
-        ollama_client = OllamaClient(
-            base_url=config.openai_compatible_url,
-            model_name=config.model
-        )
-        
-        assert str(ollama_client.client.base_url) == f"{config.base_url}/v1/" 
\ No newline at end of file
+        assert ollama_client._extra_body() == {"cache_prompt": True}
@@ -0,0 +1,18 @@
+
+import pytest
+
+from src.core.domain.value_objects import Language
+from src.core.exceptions import InvalidLanguageIsoCodeError
+from src.infrastructure.utils import to_language
+
+
+def test_to_language_should_share_instances_per_code():
+    english = to_language("en")
+
+    assert english == Language("en")
+    assert to_language("en") is english
+
+
+def test_to_language_should_reject_invalid_code():
+    with pytest.raises(InvalidLanguageIsoCodeError):
+        to_language("english")
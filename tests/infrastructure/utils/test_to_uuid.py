@@ -0,0 +1,19 @@
+
+import pytest
+from uuid import UUID, uuid4
+
+from src.infrastructure.utils import to_uuid
+
+
+def test_to_uuid_should_parse_and_reuse_result():
+    raw = str(uuid4())
+
+    first = to_uuid(raw)
+
+    assert first == UUID(raw)
+    assert to_uuid(raw) is first
+
+
+def test_to_uuid_should_reject_invalid_string():
+    with pytest.raises(ValueError):
+        to_uuid("not-a-uuid")